@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Agent loop benchmark with recorded Anthropic / Slack traffic
+
+Runs scripted conversations through the same path as the job worker
+(``_process_message_with_handler``: SlackEventHandlerV5 + SlackOutboundSender)
+with the Anthropic and Slack clients pointed at local CassetteServers.
+
+    # 1. Record once against the real APIs (needs ANTHROPIC_API_KEY / SLACK_BOT_TOKEN)
+    python scripts/benchmark_agent_loop.py --record --cassettes bench/cassettes
+
+    # 2. Replay offline as often as needed (no API budget, no network)
+    python scripts/benchmark_agent_loop.py --cassettes bench/cassettes --concurrency 8 \\
+        --output bench/after.json --baseline bench/before.json
+
+Reports throughput, p50/p99 latency and Anthropic token usage as JSON.
+
+Scope: the measured latency starts when a worker picks the message up. The
+webhook (signature check, event dedup, enqueue), the job queue and worker
+pool, and the burst coalescing window (MESSAGE_COALESCE_WINDOW_MS, default
+1500 ms) are not exercised, so real reply latency is higher by at least the
+coalescing window. Use it to compare agent-loop changes, not as an estimate
+of user-visible latency.
+DATABASE_URL must point to a migrated database; every conversation runs as a
+fresh benchmark user, so runs don't see each other's history or tasks.
+
+Scenario file: one message per line, conversations separated by a blank line.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import secrets
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.adapters.primary.api.routes.slack import _process_message_with_handler
+from src.infrastructure.config import AppConfig
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.di import create_anthropic_client, create_slack_event_handler
+from src.infrastructure.replay import Cassette, CassetteServer, LatencyModel
+from src.infrastructure.slack_outbound import SlackOutboundSender
+
+ANTHROPIC_UPSTREAM = "https://api.anthropic.com"
+SLACK_UPSTREAM = "https://slack.com"
+
+DEFAULT_SCENARIO = [
+    ["おはよう", "今日のタスク", "明日までに週報を作成するタスクを追加して", "週報を書いたので完了にして"],
+    ["来週の金曜までにプロジェクト資料をまとめるタスクを登録して", "それぞれの期限を教えて"],
+]
+
+
+def load_scenario(path: Path | None) -> list[list[str]]:
+    """Conversations of the benchmark (one message per line, blank line between conversations)"""
+    if path is None:
+        return DEFAULT_SCENARIO
+    conversations = [block.strip().splitlines() for block in path.read_text(encoding="utf-8").split("\n\n")]
+    return [[line.strip() for line in lines if line.strip()] for lines in conversations if lines]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    anthropic_path = args.cassettes / "anthropic.json"
+    slack_path = args.cassettes / "slack.json"
+    latency = LatencyModel(scale=args.latency_scale, extra_ms=args.extra_latency_ms, jitter_ms=args.jitter_ms)
+    if args.record:
+        anthropic_server = CassetteServer(Cassette(), upstream=ANTHROPIC_UPSTREAM)
+        slack_server = CassetteServer(Cassette(), upstream=SLACK_UPSTREAM)
+    else:
+        anthropic_server = CassetteServer(Cassette.load(anthropic_path), latency=latency)
+        slack_server = CassetteServer(Cassette.load(slack_path), latency=latency, strict=False)
+
+    config = dataclasses.replace(
+        AppConfig.from_env(),
+        anthropic_base_url=await anthropic_server.start(),
+        slack_api_base_url=await slack_server.start() + "/api/",
+    )
+    db_manager = DatabaseManager(config.database_url)
+    slack_client = AsyncWebClient(token=config.slack_bot_token, base_url=config.slack_api_base_url)
+    slack_sender = SlackOutboundSender(slack_client)
+    anthropic_client = create_anthropic_client(config)
+    handler, conversation_summarizer, conversation_write_behind = create_slack_event_handler(
+        config, db_manager, slack_client, anthropic_client
+    )
+
+    conversations = load_scenario(args.scenario)
+    latencies_ms: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run_conversation(messages: list[str]) -> None:
+        nonlocal errors
+        user_id = f"UB{secrets.token_hex(4).upper()}"
+        channel = f"DB{secrets.token_hex(4).upper()}"
+        async with semaphore:
+            for text in messages:
+                started = time.perf_counter()
+                try:
+                    await _process_message_with_handler(
+                        db_manager, handler, slack_sender, user_id, text, channel, notify_busy=False
+                    )
+                except Exception as e:
+                    errors += 1
+                    logging.warning(f"Benchmark message failed: {e}")
+                    continue
+                latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    try:
+        for _ in range(args.repeat):
+            anthropic_server.cassette.rewind()
+            slack_server.cassette.rewind()
+            await asyncio.gather(
+                *(run_conversation(messages) for messages in conversations for _ in range(args.concurrency))
+            )
+        wall_seconds = time.perf_counter() - started
+    finally:
+        if conversation_summarizer is not None:
+            await conversation_summarizer.close()
+        if conversation_write_behind is not None:
+            await conversation_write_behind.close()
+        await slack_sender.close()
+        await anthropic_client.close()
+        await db_manager.close()
+        await anthropic_server.close()
+        await slack_server.close()
+
+    if args.record:
+        anthropic_server.cassette.save(anthropic_path)
+        slack_server.cassette.save(slack_path)
+
+    usage = anthropic_server.stats
+    return {
+        "mode": "record" if args.record else "replay",
+        "messages": len(latencies_ms) + errors,
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_second": round(len(latencies_ms) / wall_seconds, 3) if wall_seconds else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 0.50), 1),
+            "p99": round(percentile(latencies_ms, 0.99), 1),
+            "mean": round(statistics.fmean(latencies_ms), 1) if latencies_ms else 0.0,
+        },
+        "anthropic": {
+            "requests": usage.requests,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_read_input_tokens": usage.cache_read_input_tokens,
+            "cache_creation_input_tokens": usage.cache_creation_input_tokens,
+            "cassette_misses": usage.misses,
+        },
+        "slack": {"requests": slack_server.stats.requests, "cassette_misses": slack_server.stats.misses},
+    }
+
+
+def compare(result: dict, baseline: dict) -> dict[str, str]:
+    """Relative change of the headline numbers against a previous run"""
+    pairs = {
+        "throughput_per_second": (result["throughput_per_second"], baseline["throughput_per_second"]),
+        "latency_p50_ms": (result["latency_ms"]["p50"], baseline["latency_ms"]["p50"]),
+        "latency_p99_ms": (result["latency_ms"]["p99"], baseline["latency_ms"]["p99"]),
+        "input_tokens": (result["anthropic"]["input_tokens"], baseline["anthropic"]["input_tokens"]),
+        "output_tokens": (result["anthropic"]["output_tokens"], baseline["anthropic"]["output_tokens"]),
+    }
+    return {key: f"{(new - old) / old:+.1%}" if old else "n/a" for key, (new, old) in pairs.items()}
+
+
+def main():
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassettes", type=Path, required=True, help="Directory of anthropic.json / slack.json")
+    parser.add_argument("--record", action="store_true", help="Record against the real APIs instead of replaying")
+    parser.add_argument("--scenario", type=Path, help="Scenario file (default: built-in conversations)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Copies of each conversation run concurrently")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of the whole scenario")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier of recorded API latency")
+    parser.add_argument("--extra-latency-ms", type=float, default=0.0, help="Constant delay per API response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random delay per API response (seeded)")
+    parser.add_argument("--output", type=Path, help="Write the result JSON here")
+    parser.add_argument("--baseline", type=Path, help="Previous result JSON to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = asyncio.run(run(args))
+    if args.baseline:
+        result["vs_baseline"] = compare(result, json.loads(args.baseline.read_text(encoding="utf-8")))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
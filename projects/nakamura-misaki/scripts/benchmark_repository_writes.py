@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Round-trip benchmark of repository writes on the message hot path
+
+Every Slack message ends with the conversation being saved (and, for most
+turns, a task written by a tool call). This script runs that write sequence
+with two strategies and reports database round-trips and time per message:
+
+- select_then_write: SELECT the row, then mutate the ORM object / add a new
+  one and flush (the repositories' previous save())
+- upsert: the repositories' save() (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+
+    # In-memory SQLite (round-trip counts only; latency is not representative)
+    python scripts/benchmark_repository_writes.py
+
+    # Migrated PostgreSQL: round-trips and real latency
+    python scripts/benchmark_repository_writes.py --database-url postgresql+asyncpg://... --messages 500
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.domain.models.task import Task
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_task_repository import (
+    PostgreSQLTaskRepository,
+    TaskModel,
+)
+from src.infrastructure.database.schema import ConversationMessageTable, ConversationTable
+from src.infrastructure.repositories.conversation_message_store import ConversationMessageStore
+
+
+async def _select_then_write(session: AsyncSession, model: type, key: Any, values: dict[str, Any]) -> None:
+    """The previous save(): load the row, then update it or add a new one"""
+    existing = await session.get(model, key)
+    if existing:
+        for column, value in values.items():
+            setattr(existing, column, value)
+    else:
+        session.add(model(**values))
+    await session.flush()
+
+
+async def _save_conversation_select_then_write(session: AsyncSession, conversation: Conversation) -> None:
+    existing = await session.get(ConversationTable, conversation.id)
+    stored_count = existing.message_count if existing else 0
+    await _select_then_write(
+        session,
+        ConversationTable,
+        conversation.id,
+        {
+            "conversation_id": conversation.id,
+            "user_id": conversation.user_id,
+            "channel_id": conversation.channel_id,
+            "message_count": conversation.message_count,
+            "created_at": conversation.created_at,
+            "updated_at": conversation.updated_at,
+            "last_message_at": conversation.updated_at,
+        },
+    )
+    new_messages = conversation.messages_between(stored_count, conversation.message_count)
+    await ConversationMessageStore(session).append(conversation.id, stored_count, new_messages)
+
+
+async def _save_task_select_then_write(session: AsyncSession, task: Task) -> None:
+    await _select_then_write(
+        session,
+        TaskModel,
+        task.id,
+        {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "assignee_user_id": task.assignee_user_id,
+            "creator_user_id": task.creator_user_id,
+            "status": task.status.value,
+            "due_at": task.due_at,
+            "priority": task.priority,
+            "progress_percent": task.progress_percent,
+            "estimated_hours": task.estimated_hours,
+            "completed_at": task.completed_at,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        },
+    )
+
+
+async def run_strategy(sessionmaker: async_sessionmaker, strategy: str, messages: int) -> dict[str, float]:
+    """Save a growing conversation and a task once per message, each in its own session"""
+    conversation = Conversation.create(user_id="UBENCH0001", channel_id="DBENCH0001")
+    task = Task.create(title="週報を作成", assignee_user_id="UBENCH0001", creator_user_id="UBENCH0001")
+    statements = 0
+    elapsed = 0.0
+
+    for i in range(messages):
+        conversation.add_message(Message.user(f"メッセージ {i}"))
+        conversation.add_message(Message.assistant(f"返信 {i}"))
+        task.update_progress(i % 100)
+        async with sessionmaker() as session:
+            connection = await session.connection()
+
+            def count(*args):
+                nonlocal statements
+                statements += 1
+
+            event.listen(connection.sync_connection, "before_cursor_execute", count)
+            started = time.perf_counter()
+            if strategy == "upsert":
+                await PostgreSQLConversationRepository(session).save(conversation)
+                await PostgreSQLTaskRepository(session).save(task)
+            else:
+                await _save_conversation_select_then_write(session, conversation)
+                await _save_task_select_then_write(session, task)
+            await session.commit()
+            elapsed += time.perf_counter() - started
+
+    return {
+        "round_trips_per_message": round(statements / messages, 2),
+        "ms_per_message": round(elapsed * 1000 / messages, 3),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    engine = create_async_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                ConversationTable.metadata.create_all,
+                tables=[ConversationTable.__table__, ConversationMessageTable.__table__],
+            )
+            await connection.run_sync(TaskModel.metadata.create_all)
+    sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        result = {
+            strategy: await run_strategy(sessionmaker, strategy, args.messages)
+            for strategy in ("select_then_write", "upsert")
+        }
+    finally:
+        await engine.dispose()
+
+    before, after = result["select_then_write"], result["upsert"]
+    result["round_trip_reduction"] = f"{1 - after['round_trips_per_message'] / before['round_trips_per_message']:.1%}"
+    return result
+
+
+def main():
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:", help="Async SQLAlchemy URL")
+    parser.add_argument("--messages", type=int, default=200, help="Messages (conversation + task saves) per strategy")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
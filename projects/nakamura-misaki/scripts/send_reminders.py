@@ -23,23 +23,28 @@ from src.adapters.secondary.postgresql_handoff_repository import (
     PostgreSQLHandoffRepository,
 )
 from src.application.use_cases.send_handoff_reminder import SendHandoffReminderUseCase
+from src.infrastructure.slack_outbound import SlackOutboundSender
 
 
 class SlackClient:
-    """Slack Client for sending DMs"""
+    """Slack Client for sending DMs (rate-limited via SlackOutboundSender)"""
 
     def __init__(self, token: str):
-        self._client = AsyncWebClient(token=token)
+        self._sender = SlackOutboundSender(AsyncWebClient(token=token))
 
     async def send_dm(self, user_id: str, message: str):
         """Send DM to user"""
-        await self._client.chat_postMessage(
-            channel=user_id,
-            text=message,
+        await self._sender.post_message(
+            user_id,
+            message,
             unfurl_links=False,
             unfurl_media=False,
         )
 
+    async def close(self):
+        """Deliver rate-limited DMs still waiting for retry"""
+        await self._sender.close()
+
 
 async def main():
     """メインエントリーポイント"""
@@ -85,6 +90,9 @@ async def main():
             await session.rollback()
             sys.exit(1)
 
+        finally:
+            await slack_client.close()
+
     await engine.dispose()
 
 
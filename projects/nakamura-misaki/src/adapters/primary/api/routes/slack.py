@@ -3,23 +3,30 @@
 Handles Slack Event Subscriptions with signature verification.
 """
 
-import asyncio
 import hashlib
 import hmac
 import logging
 import time
 
-from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Request
-from slack_sdk.web.async_client import AsyncWebClient
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from pydantic import ValidationError
 
-from src.adapters.primary.slack_event_handler import SlackEventHandlerV5
+from src.adapters.primary.api.slack_payloads import parse_event_envelope
+from src.infrastructure.claude_gateway import ClaudeUnavailableError
+from src.infrastructure.queue import Job
+from src.infrastructure.slack_outbound import StreamingReply
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# In-memory set to track recently processed event IDs (prevent duplicate processing)
-_processed_events: set[str] = set()
-_processed_events_lock = asyncio.Lock()
+# Job type for Slack message processing in the durable job queue
+SLACK_MESSAGE_JOB = "slack_message"
+
+# Immediate reply when Claude is overloaded; the job itself is retried by the queue
+BUSY_REPLY = "いまClaudeが混み合っていて応答できない。少し待ってから自動で再試行する。"
+
+# Bot user ID (messages posted with the User Token appear as this user)
+BOT_USER_ID = "U09AHTB4X4H"
 
 
 @router.get("/health")
@@ -31,9 +38,10 @@ async def health():
 @router.post("/slack")
 async def slack_events(
     request: Request,
-    background_tasks: BackgroundTasks,
+    response: Response,
     x_slack_signature: str = Header(...),
     x_slack_request_timestamp: str = Header(...),
+    x_slack_retry_num: str | None = Header(None),
 ):
     """Slack Events API endpoint
 
@@ -41,8 +49,10 @@ async def slack_events(
 
     Args:
         request: FastAPI Request
+        response: FastAPI Response（X-Slack-No-Retryヘッダー設定用）
         x_slack_signature: Slack署名
         x_slack_request_timestamp: リクエストタイムスタンプ
+        x_slack_retry_num: Slackの再送回数（再送時のみ）
 
     Returns:
         イベント処理結果
@@ -50,189 +60,235 @@ async def slack_events(
     Raises:
         HTTPException: 署名検証失敗時
     """
-    # リクエストボディ取得
+    # リクエストボディ取得（生バイトのまま署名検証・パースする）
     body = await request.body()
-    body_str = body.decode("utf-8")
 
     logger.info(f"Received Slack webhook, timestamp={x_slack_request_timestamp}")
 
     # 署名検証
     signing_secret = request.app.state.slack_signing_secret
     if not _verify_slack_signature(
-        body_str, x_slack_signature, x_slack_request_timestamp, signing_secret
+        body, x_slack_signature, x_slack_request_timestamp, signing_secret
     ):
         logger.warning("Slack signature verification failed")
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    # JSONパース
-    event_data = await request.json()
-    event_type = event_data.get("type")
-    logger.debug(f"Slack event type: {event_type}, payload: {event_data}")
+    # JSONパース（1回のみ）
+    try:
+        envelope = parse_event_envelope(body)
+    except ValidationError as e:
+        logger.warning(f"Malformed Slack payload: {e.error_count()} error(s)")
+        raise HTTPException(status_code=400, detail="Invalid payload") from e
+    event_type = envelope.type
+    logger.debug(f"Slack event type: {event_type}")
 
     # URL Verification Challenge（初回セットアップ）
     if event_type == "url_verification":
-        challenge = event_data.get("challenge")
-        logger.info(f"Responding to URL verification challenge: {challenge}")
-        return {"challenge": challenge}
+        logger.info("Responding to URL verification challenge")
+        return {"challenge": envelope.challenge}
 
     # Event Callback処理
-    if event_type == "event_callback":
-        event = event_data.get("event", {})
-        event_subtype = event.get("type")
+    if event_type == "event_callback" and envelope.event is not None:
+        event = envelope.event
+        event_id = envelope.event_id
 
-        logger.info(f"Processing event_callback: subtype={event_subtype}, user={event.get('user')}")
+        # Reject ignorable events before any I/O
+        if event.type != "message":
+            return {"status": "ignored"}
+        if event.is_bot:
+            logger.info("Ignoring bot message event")
+            return {"status": "ignored"}
+        # Messages from the bot itself (User Token posts as user, not bot)
+        if event.user == BOT_USER_ID:
+            logger.info("Ignoring message from bot itself")
+            return {"status": "ignored"}
+        text = event.text.strip()
+        if not text:
+            logger.info("Ignoring empty or whitespace-only message")
+            return {"status": "ignored"}
 
-        # botメッセージは無視
-        if event.get("subtype") == "bot_message":
-            logger.info("Ignoring bot_message event")
+        user_id = event.user
+        channel = event.channel
+        logger.info(f"Message event: user={user_id}, channel={channel}, text_length={len(text)}")
+
+        # Check for duplicate events (Slack retry logic, shared across workers)
+        dedup_store = request.app.state.event_dedup_store
+        if event_id and not await dedup_store.mark_seen(event_id):
+            if x_slack_retry_num is not None:
+                logger.info(f"Ignoring Slack retry #{x_slack_retry_num} of event {event_id}")
+            else:
+                logger.info(f"Ignoring duplicate event: {event_id}")
+            response.headers["X-Slack-No-Retry"] = "1"
             return {"status": "ignored"}
 
-        # メッセージイベント処理
-        if event_subtype == "message":
-            user_id = event.get("user")
-            text = event.get("text", "").strip()
-            channel = event.get("channel")
+        # Enqueue to the durable job queue and return 200 immediately
+        # (Slack expects 200 within 3 seconds or will retry)
+        # JobWorkerPool processes the message with its own DB session
+        try:
+            job_id = await request.app.state.job_queue.enqueue(
+                SLACK_MESSAGE_JOB,
+                {"user_id": user_id, "text": text, "channel": channel},
+                conversation_key=f"{user_id}:{channel}",
+            )
+        except Exception:
+            # Let Slack's retry of this event through the dedup store
+            if event_id:
+                await dedup_store.release(event_id)
+            raise
+        request.app.state.worker_pool.notify()
+        logger.info(f"Message enqueued: job_id={job_id}")
 
-            logger.info(f"Message event: user={user_id}, channel={channel}, text_length={len(text)}")
-            logger.debug(f"Message text: {text}")
+    logger.info("Webhook processed successfully")
+    return {"status": "ok"}
 
-            # Ignore messages from the bot itself (User Token posts as user, not bot)
-            # Bot user ID: U09AHTB4X4H
-            if user_id == "U09AHTB4X4H":
-                logger.info("Ignoring message from bot itself")
-                return {"status": "ignored"}
 
-            # Ignore empty or whitespace-only messages
-            if not text:
-                logger.info("Ignoring empty or whitespace-only message")
-                return {"status": "ignored"}
+def merge_message_payloads(payloads: list[dict]) -> dict:
+    """Merge a burst of queued messages of one conversation into one user turn.
 
-            # Check for duplicate events (Slack retry logic)
-            event_id = event_data.get("event_id")
-            if event_id:
-                async with _processed_events_lock:
-                    if event_id in _processed_events:
-                        logger.info(f"Ignoring duplicate event: {event_id}")
-                        return {"status": "ignored"}
-                    _processed_events.add(event_id)
-                    # Keep only last 1000 event IDs to prevent memory leak
-                    if len(_processed_events) > 1000:
-                        _processed_events.pop()
-
-            # Process message in background to return 200 immediately
-            # (Slack expects 200 within 3 seconds or will retry)
-            # Create handler with new DB session for this request
-            db_manager = request.app.state.db_manager
-            slack_client = request.app.state.slack_client
-            anthropic_api_key = request.app.state.anthropic_api_key
-            conversation_ttl_hours = request.app.state.conversation_ttl_hours
-
-            background_tasks.add_task(
-                _process_message_with_handler,
-                db_manager,
-                slack_client,
-                anthropic_api_key,
-                conversation_ttl_hours,
-                user_id,
-                text,
-                channel,
-            )
+    Args:
+        payloads: SLACK_MESSAGE_JOB payloads, oldest first
 
-    logger.info("Webhook processed successfully")
-    return {"status": "ok"}
+    Returns:
+        Payload whose text is the burst's texts joined by newlines
+    """
+    merged = dict(payloads[0])
+    merged["text"] = "\n".join(payload["text"] for payload in payloads)
+    return merged
+
+
+async def process_message_job(state, job: Job) -> None:
+    """Job handler for SLACK_MESSAGE_JOB (run by JobWorkerPool).
+
+    Messages of one conversation (user_id, channel) run one at a time via
+    KeyedExecutor, so each turn sees the history saved by the previous one.
+
+    Args:
+        state: FastAPI app.state (db_manager, slack_event_handler, slack_sender,
+            keyed_executor, slack_streaming_replies,
+            slack_stream_update_interval_seconds)
+        job: Claimed job with payload {"user_id", "text", "channel"}
+    """
+    payload = job.payload
+    user_id = payload["user_id"]
+    channel = payload["channel"]
+    await state.keyed_executor.run(
+        (user_id, channel),
+        user_id,
+        lambda: _process_message_with_handler(
+            state.db_manager,
+            state.slack_event_handler,
+            state.slack_sender,
+            user_id,
+            payload["text"],
+            channel,
+            streaming_update_interval=(
+                state.slack_stream_update_interval_seconds if state.slack_streaming_replies else None
+            ),
+            notify_busy=job.attempts == 1,
+        ),
+    )
 
 
 async def _process_message_with_handler(
     db_manager,
-    slack_client,
-    anthropic_api_key: str,
-    conversation_ttl_hours: int,
+    handler,
+    slack_sender,
     user_id: str,
     text: str,
     channel: str,
+    streaming_update_interval: float | None = None,
+    notify_busy: bool = True,
 ) -> None:
-    """Process Slack message in background with new DB session.
+    """Process Slack message in a queue worker within its own unit of work.
+
+    The handler is the process-wide one built at startup; its repositories
+    use the session bound here by ``db_manager.request_scope()``.
 
     Args:
         db_manager: DatabaseManager instance
-        slack_client: AsyncWebClient instance
-        anthropic_api_key: Anthropic API key
-        conversation_ttl_hours: Conversation TTL hours
+        handler: Shared SlackEventHandlerV5 (built on a ScopedSession)
+        slack_sender: SlackOutboundSender used to post the reply
         user_id: User ID
         text: Message text
         channel: Channel ID
+        streaming_update_interval: If set, stream the reply into a placeholder
+            message updated at most once per this many seconds
+        notify_busy: Post BUSY_REPLY if Claude is unavailable (first attempt only,
+            so queue retries don't repeat it)
+
+    Raises:
+        Exception: Propagated so that the job queue schedules a retry
     """
     try:
-        # Create new DB session for this background task
-        async with db_manager.session() as session:
-            # Build DI container with this session
-            from src.infrastructure.di import DIContainer
-            di_container = DIContainer(session=session, slack_client=slack_client)
-
-            # Build event handler
-            handler = di_container.build_slack_event_handler(
-                anthropic_api_key=anthropic_api_key,
-                conversation_ttl_hours=conversation_ttl_hours
-            )
+        # New DB session for this job, bound to the shared handler's repositories
+        async with db_manager.request_scope():
+            if streaming_update_interval is not None:
+                await _handle_streaming(handler, slack_sender, user_id, text, channel, streaming_update_interval)
+                return
 
             # Handle message
             response_text = await handler.handle_message(user_id, text, channel)
             logger.info(f"Message handled, response_generated={bool(response_text)}")
 
-            # 応答がある場合はSlackに返信
+            # 応答がある場合はSlackに返信（レート制限時は送信キューで再送）
             if response_text:
-                await slack_client.chat_postMessage(
-                    channel=channel,
-                    text=response_text,
+                sent = await slack_sender.post_message(
+                    channel,
+                    response_text,
                     unfurl_links=False,
                     unfurl_media=False,
                 )
-                logger.info(f"Response sent to Slack channel={channel}")
+                if sent is None:
+                    logger.info(f"Response deferred to retry queue channel={channel}")
+                else:
+                    logger.info(f"Response sent to Slack channel={channel}")
+    except ClaudeUnavailableError as e:
+        logger.warning(f"Claude unavailable, job will be retried: {e}")
+        if notify_busy:
+            await slack_sender.post_message(channel, BUSY_REPLY, unfurl_links=False, unfurl_media=False)
+        raise
     except Exception as e:
         logger.error(f"Error handling message: {e}", exc_info=True)
+        raise
 
 
-async def _process_message_async(
-    handler: SlackEventHandlerV5,
-    slack_token: str,
+async def _handle_streaming(
+    handler,
+    slack_sender,
     user_id: str,
     text: str,
     channel: str,
+    update_interval: float,
 ) -> None:
-    """Process Slack message in background (deprecated - use _process_message_with_handler).
+    """Handle message in streaming mode (placeholder + progressive chat.update).
 
     Args:
         handler: SlackEventHandlerV5 instance
-        slack_token: Slack bot token
+        slack_sender: SlackOutboundSender
         user_id: User ID
         text: Message text
         channel: Channel ID
+        update_interval: Minimum seconds between chat.update calls
     """
+    reply = StreamingReply(slack_sender, channel, min_update_interval_seconds=update_interval)
+    await reply.start()
     try:
-        response_text = await handler.handle_message(user_id, text, channel)
-        logger.info(f"Message handled, response_generated={bool(response_text)}")
-
-        # 応答がある場合はSlackに返信
-        if response_text:
-            slack_client = AsyncWebClient(token=slack_token)
-            await slack_client.chat_postMessage(
-                channel=channel,
-                text=response_text,
-                unfurl_links=False,
-                unfurl_media=False,
-            )
-            logger.info(f"Response sent to Slack channel={channel}")
-    except Exception as e:
-        logger.error(f"Error handling message: {e}", exc_info=True)
+        response_text = await handler.handle_message(user_id, text, channel, on_text=reply.append)
+    except Exception:
+        # The job will be retried: don't leave a dangling placeholder
+        await reply.abort()
+        raise
+    logger.info(f"Message handled, response_generated={bool(response_text)}")
+    await reply.finish(response_text)
 
 
 def _verify_slack_signature(
-    body: str, signature: str, timestamp: str, signing_secret: str
+    body: bytes, signature: str, timestamp: str, signing_secret: str
 ) -> bool:
     """Slack署名を検証
 
     Args:
-        body: リクエストボディ
+        body: リクエストボディ（生バイト）
         signature: X-Slack-Signature header
         timestamp: X-Slack-Request-Timestamp header
         signing_secret: Slack Signing Secret
@@ -241,11 +297,14 @@ def _verify_slack_signature(
         署名が正しければTrue
     """
     # タイムスタンプが5分以上古い場合は拒否
-    if abs(time.time() - int(timestamp)) > 60 * 5:
+    try:
+        if abs(time.time() - int(timestamp)) > 60 * 5:
+            return False
+    except ValueError:
         return False
 
-    # 署名生成
-    sig_basestring = f"v0:{timestamp}:{body}".encode()
+    # 署名生成（ボディはデコードせずバイトのまま連結）
+    sig_basestring = b"v0:" + timestamp.encode() + b":" + body
     my_signature = (
         "v0="
         + hmac.new(
@@ -0,0 +1,55 @@
+"""Slack Events API payload models
+
+Webhook bodies are decoded once, straight from the raw request bytes, into
+these typed structs (pydantic-core parses and validates in a single pass).
+Only the fields the webhook route reads are declared; everything else in the
+payload is skipped by the parser.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ["SlackEvent", "SlackEventEnvelope", "parse_event_envelope"]
+
+
+class SlackEvent(BaseModel):
+    """Inner ``event`` object of an ``event_callback``"""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    type: str | None = None
+    subtype: str | None = None
+    user: str | None = None
+    bot_id: str | None = None
+    text: str = ""
+    channel: str | None = None
+
+    @property
+    def is_bot(self) -> bool:
+        """True if the event was posted by a bot integration"""
+        return self.subtype == "bot_message" or self.bot_id is not None
+
+
+class SlackEventEnvelope(BaseModel):
+    """Top-level Events API request (``url_verification`` / ``event_callback``)"""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    type: str | None = None
+    challenge: str | None = None
+    event_id: str | None = None
+    event: SlackEvent | None = None
+
+
+def parse_event_envelope(body: bytes) -> SlackEventEnvelope:
+    """Decode a raw webhook body
+
+    Args:
+        body: Raw request body (already signature-verified)
+
+    Returns:
+        SlackEventEnvelope
+
+    Raises:
+        pydantic.ValidationError: Body is not valid JSON or has unexpected field types
+    """
+    return SlackEventEnvelope.model_validate_json(body)
@@ -0,0 +1,165 @@
+"""Intent fast path: answer formulaic commands without calling Claude.
+
+Confident matches from IntentMatcher are dispatched straight to the same
+tools Claude would call, and the reply is rendered from a template. Low
+confidence matches, ambiguous task titles and tool errors fall back to the LLM.
+
+Metrics:
+    intent_fast_path.hit.{intent}: Answered locally
+    intent_fast_path.low_confidence.{intent}: Matched, but left to the LLM
+    intent_fast_path.fallback.{intent}: Dispatch could not answer (e.g. ambiguous title)
+    intent_fast_path.miss: No pattern matched
+    intent_fast_path_time: Latency of answered messages
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any
+
+from src.adapters.primary.tools.registry import BoundTools
+from src.domain.services.intent_matcher import (
+    COMPLETE_TASK,
+    LIST_TASKS,
+    REGISTER_TASK,
+    WEEKDAYS,
+    Intent,
+    IntentMatcher,
+)
+from src.infrastructure.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+# Tasks listed in a templated reply
+MAX_LISTED_TASKS = 20
+
+
+class IntentFastPath:
+    """Answers recognized commands locally, or returns None for the LLM"""
+
+    def __init__(self, matcher: IntentMatcher | None = None, min_confidence: float = 0.8):
+        """Initialize fast path
+
+        Args:
+            matcher: IntentMatcher
+            min_confidence: Intents below this confidence go to the LLM
+        """
+        self._matcher = matcher or IntentMatcher()
+        self._min_confidence = min_confidence
+
+    async def try_handle(self, text: str, tools: BoundTools) -> str | None:
+        """Answer the message locally if possible
+
+        Args:
+            text: Message text
+            tools: Tools bound to the current request and user
+
+        Returns:
+            Reply text, or None to fall back to the LLM
+        """
+        started = time.time()
+        intent = self._matcher.match(text)
+        if intent is None:
+            metrics.increment("intent_fast_path.miss")
+            return None
+        if intent.confidence < self._min_confidence:
+            metrics.increment(f"intent_fast_path.low_confidence.{intent.name}")
+            return None
+
+        reply = await self._dispatch(intent, tools)
+        if reply is None:
+            metrics.increment(f"intent_fast_path.fallback.{intent.name}")
+            return None
+
+        metrics.increment(f"intent_fast_path.hit.{intent.name}")
+        metrics.record_time("intent_fast_path_time", (time.time() - started) * 1000)
+        logger.info(f"Intent fast path answered {intent.name}")
+        return reply
+
+    async def _dispatch(self, intent: Intent, tools: BoundTools) -> str | None:
+        if intent.name == LIST_TASKS:
+            return await self._list_tasks(intent, tools)
+        if intent.name == COMPLETE_TASK:
+            return await self._complete_task(intent, tools)
+        if intent.name == REGISTER_TASK:
+            return await self._register_task(intent, tools)
+        return None
+
+    async def _list_tasks(self, intent: Intent, tools: BoundTools) -> str | None:
+        result = await _execute(tools, LIST_TASKS, **intent.arguments)
+        if result is None:
+            return None
+        completed = intent.arguments.get("status") == "completed"
+        tasks = result["data"]["tasks"]
+        if not completed:
+            tasks = [task for task in tasks if task["status"] != "completed"]
+        if intent.due_by is not None:
+            tasks = [task for task in tasks if task["due_at"] and _due(task["due_at"]) <= intent.due_by]
+        tasks.sort(key=lambda task: (task["due_at"] is None, task["due_at"] or ""))
+
+        label = "完了済みのタスク" if completed else "未完了のタスク"
+        if intent.due_by is not None:
+            label = f"今日までの{label}"
+        if not tasks:
+            return f"{label}はない。"
+        lines = [f"{label}は{len(tasks)}件だ。"]
+        lines += [f"• {_format_task(task)}" for task in tasks[:MAX_LISTED_TASKS]]
+        if len(tasks) > MAX_LISTED_TASKS:
+            lines.append(f"…ほか{len(tasks) - MAX_LISTED_TASKS}件")
+        return "\n".join(lines)
+
+    async def _complete_task(self, intent: Intent, tools: BoundTools) -> str | None:
+        # Only act when exactly one open task matches; otherwise let Claude ask
+        listed = await _execute(tools, LIST_TASKS)
+        if listed is None:
+            return None
+        title_part = intent.arguments["task_identifier"].lower()
+        candidates = [
+            task
+            for task in listed["data"]["tasks"]
+            if task["status"] != "completed" and title_part in task["title"].lower()
+        ]
+        if len(candidates) != 1:
+            return None
+
+        result = await _execute(tools, COMPLETE_TASK, task_identifier=candidates[0]["id"])
+        if result is None:
+            return None
+        return f"了解した。「{result['data']['title']}」を完了にした。"
+
+    async def _register_task(self, intent: Intent, tools: BoundTools) -> str | None:
+        result = await _execute(tools, REGISTER_TASK, **intent.arguments)
+        if result is None:
+            return None
+        task = result["data"]
+        reply = f"了解した。「{task['title']}」を登録した。"
+        if task.get("due_at"):
+            reply += f"期限は{_format_due(task['due_at'])}だ。"
+        return reply
+
+
+async def _execute(tools: BoundTools, name: str, **arguments: Any) -> dict[str, Any] | None:
+    """Run a tool; None if it is not available or failed"""
+    tool = tools.get(name)
+    if tool is None:
+        return None
+    result = await tool.execute(**arguments)
+    return result if result["success"] else None
+
+
+def _due(due_at: str) -> datetime:
+    """Due time as naive local time (as shown by _format_due)"""
+    return datetime.fromisoformat(due_at).replace(tzinfo=None)
+
+
+def _format_task(task: dict[str, Any]) -> str:
+    """Task title with its due date (e.g. "資料作成（期限: 10/18(土) 23:59）")"""
+    if not task.get("due_at"):
+        return str(task["title"])
+    return f"{task['title']}（期限: {_format_due(task['due_at'])}）"
+
+
+def _format_due(due_at: str) -> str:
+    due = datetime.fromisoformat(due_at)
+    return f"{due.month}/{due.day}({WEEKDAYS[due.weekday()]}) {due:%H:%M}"
@@ -3,9 +3,13 @@
 Natural language task management via Claude Agent SDK.
 """
 
-from anthropic import AsyncAnthropic
+import asyncio
+from dataclasses import dataclass
+
 from slack_sdk.web.async_client import AsyncWebClient
 
+from src.adapters.primary.intent_fast_path import IntentFastPath
+from src.adapters.primary.tools.registry import ToolRegistry
 from src.adapters.primary.tools.task_tools import (
     CompleteTaskTool,
     ListTasksTool,
@@ -21,6 +25,7 @@ from src.contexts.personal_tasks.application.use_cases.complete_task import Comp
 from src.contexts.personal_tasks.application.use_cases.query_user_tasks import QueryUserTasksUseCase
 from src.contexts.personal_tasks.application.use_cases.register_task import RegisterTaskUseCase
 from src.contexts.personal_tasks.application.use_cases.update_task import UpdateTaskUseCase
+from src.contexts.personal_tasks.domain.models.conversation import Message
 from src.contexts.personal_tasks.domain.repositories.conversation_repository import ConversationRepository
 from src.contexts.project_management.adapters.primary.tools.project_tools import (
     AddTaskToProjectTool,
@@ -44,8 +49,72 @@ from src.contexts.project_management.application.use_cases.remove_task_from_proj
 )
 from src.contexts.workforce_management.application.use_cases.suggest_assignees import SuggestAssigneesUseCase
 from src.contexts.workforce_management.domain.repositories.skill_repository import SkillRepository
-from src.domain.services.claude_agent_service import ClaudeAgentService
+from src.domain.services.claude_agent_service import ClaudeAgentService, TextCallback
 from src.domain.services.conversation_manager import ConversationManager
+from src.domain.services.conversation_summarizer import ConversationSummarizer
+from src.domain.services.conversation_window import ConversationWindow
+from src.domain.services.messages_client import MessagesClient
+from src.domain.services.model_router import ModelRouter
+from src.domain.services.task_snapshot import TaskSnapshotBuilder
+
+
+@dataclass(frozen=True)
+class ToolDependencies:
+    """Use cases and repositories the tool factories build tools from"""
+
+    # Personal Tasks
+    register_task_use_case: RegisterTaskUseCase
+    query_user_tasks_use_case: QueryUserTasksUseCase
+    complete_task_use_case: CompleteTaskUseCase
+    update_task_use_case: UpdateTaskUseCase
+    # Workforce Management
+    skill_repository: SkillRepository
+    suggest_assignees_use_case: SuggestAssigneesUseCase
+    # Project Management (Phase 1)
+    create_project_use_case: CreateProjectUseCase
+    add_task_to_project_use_case: AddTaskToProjectUseCase
+    remove_task_from_project_use_case: RemoveTaskFromProjectUseCase
+    get_project_progress_use_case: GetProjectProgressUseCase
+    list_projects_use_case: ListProjectsUseCase
+    archive_project_use_case: ArchiveProjectUseCase
+
+
+# Tools available to Claude. Definitions are computed once per process;
+# each factory builds its tool from the request's ToolDependencies when called.
+TOOL_REGISTRY = ToolRegistry(
+    [
+        # Task Tools
+        (RegisterTaskTool, lambda deps, user_id: RegisterTaskTool(deps.register_task_use_case, user_id)),
+        (ListTasksTool, lambda deps, user_id: ListTasksTool(deps.query_user_tasks_use_case, user_id)),
+        (
+            CompleteTaskTool,
+            lambda deps, user_id: CompleteTaskTool(
+                deps.complete_task_use_case, deps.query_user_tasks_use_case, user_id
+            ),
+        ),
+        (UpdateTaskTool, lambda deps, user_id: UpdateTaskTool(deps.update_task_use_case, user_id)),
+        # Workforce Management Tools
+        (FindEmployeesWithSkillTool, lambda deps, user_id: FindEmployeesWithSkillTool(deps.skill_repository)),
+        (GetEmployeeSkillsTool, lambda deps, user_id: GetEmployeeSkillsTool(deps.skill_repository)),
+        (SuggestAssigneesTool, lambda deps, user_id: SuggestAssigneesTool(deps.suggest_assignees_use_case)),
+        # Project Management Tools (Phase 1)
+        (CreateProjectTool, lambda deps, user_id: CreateProjectTool(deps.create_project_use_case, user_id)),
+        (
+            AddTaskToProjectTool,
+            lambda deps, user_id: AddTaskToProjectTool(deps.add_task_to_project_use_case, user_id),
+        ),
+        (
+            RemoveTaskFromProjectTool,
+            lambda deps, user_id: RemoveTaskFromProjectTool(deps.remove_task_from_project_use_case, user_id),
+        ),
+        (
+            GetProjectProgressTool,
+            lambda deps, user_id: GetProjectProgressTool(deps.get_project_progress_use_case, user_id),
+        ),
+        (ListProjectsTool, lambda deps, user_id: ListProjectsTool(deps.list_projects_use_case, user_id)),
+        (ArchiveProjectTool, lambda deps, user_id: ArchiveProjectTool(deps.archive_project_use_case, user_id)),
+    ]
+)
 
 
 class SlackEventHandlerV5:
@@ -53,7 +122,7 @@ class SlackEventHandlerV5:
 
     def __init__(
         self,
-        anthropic_client: AsyncAnthropic,
+        anthropic_client: MessagesClient,
         slack_client: AsyncWebClient,
         conversation_repository: ConversationRepository,
         # Personal Tasks Use Cases
@@ -72,11 +141,16 @@ class SlackEventHandlerV5:
         list_projects_use_case: ListProjectsUseCase,
         archive_project_use_case: ArchiveProjectUseCase,
         conversation_ttl_hours: int = 24,
+        conversation_window: ConversationWindow | None = None,
+        conversation_summarizer: ConversationSummarizer | None = None,
+        intent_fast_path: IntentFastPath | None = None,
+        task_snapshot_builder: TaskSnapshotBuilder | None = None,
+        model_router: ModelRouter | None = None,
     ):
         """Initialize SlackEventHandlerV5.
 
         Args:
-            anthropic_client: Anthropic async client
+            anthropic_client: Messages API client (AsyncAnthropic or ResilientAnthropicClient)
             slack_client: Slack async client
             conversation_repository: Conversation repository
             register_task_use_case: RegisterTaskUseCase instance
@@ -84,27 +158,37 @@ class SlackEventHandlerV5:
             complete_task_use_case: CompleteTaskUseCase instance
             update_task_use_case: UpdateTaskUseCase instance
             conversation_ttl_hours: Conversation TTL in hours (default 24)
+            conversation_window: Token-budgeted history window (None = full history)
+            conversation_summarizer: Refreshes the rolling summary in the background
+            intent_fast_path: Answers formulaic commands without Claude (None = always Claude)
+            task_snapshot_builder: Prefetches the user's open tasks into the prompt
+            model_router: Chooses fast/default Claude model per turn (None = default model)
         """
         self._anthropic_client = anthropic_client
         self._slack_client = slack_client
 
-        # Personal Tasks Use Cases (stored for tool initialization per user)
-        self._register_task_use_case = register_task_use_case
-        self._query_user_tasks_use_case = query_user_tasks_use_case
-        self._complete_task_use_case = complete_task_use_case
-        self._update_task_use_case = update_task_use_case
-
-        # Workforce Management
-        self._skill_repository = skill_repository
-        self._suggest_assignees_use_case = suggest_assignees_use_case
+        # Use cases the tools are built from (see TOOL_REGISTRY)
+        self._tool_dependencies = ToolDependencies(
+            register_task_use_case=register_task_use_case,
+            query_user_tasks_use_case=query_user_tasks_use_case,
+            complete_task_use_case=complete_task_use_case,
+            update_task_use_case=update_task_use_case,
+            skill_repository=skill_repository,
+            suggest_assignees_use_case=suggest_assignees_use_case,
+            create_project_use_case=create_project_use_case,
+            add_task_to_project_use_case=add_task_to_project_use_case,
+            remove_task_from_project_use_case=remove_task_from_project_use_case,
+            get_project_progress_use_case=get_project_progress_use_case,
+            list_projects_use_case=list_projects_use_case,
+            archive_project_use_case=archive_project_use_case,
+        )
 
-        # Project Management Use Cases (Phase 1)
-        self._create_project_use_case = create_project_use_case
-        self._add_task_to_project_use_case = add_task_to_project_use_case
-        self._remove_task_from_project_use_case = remove_task_from_project_use_case
-        self._get_project_progress_use_case = get_project_progress_use_case
-        self._list_projects_use_case = list_projects_use_case
-        self._archive_project_use_case = archive_project_use_case
+        # History window + background rolling summary
+        self._conversation_window = conversation_window
+        self._conversation_summarizer = conversation_summarizer
+        self._intent_fast_path = intent_fast_path
+        self._task_snapshot_builder = task_snapshot_builder
+        self._model_router = model_router
 
         # Conversation Manager
         self._conversation_manager = ConversationManager(
@@ -112,106 +196,81 @@ class SlackEventHandlerV5:
             ttl_hours=conversation_ttl_hours,
         )
 
-    async def handle_message(self, user_id: str, text: str, channel_id: str) -> str:
+    async def handle_message(
+        self,
+        user_id: str,
+        text: str,
+        channel_id: str,
+        on_text: TextCallback | None = None,
+        model: str | None = None,
+    ) -> str:
         """Handle Slack message with Claude Agent.
 
         Args:
             user_id: Slack User ID
             text: Message text
             channel_id: Slack Channel ID
+            on_text: Streaming mode callback receiving text deltas
+            model: Claude model for this request (overrides routing)
 
         Returns:
             Response message text
         """
         # Get or create conversation (without initial message)
         # process_message will add the user message
-        conversation = await self._conversation_manager.get_or_create(
+        get_conversation = self._conversation_manager.get_or_create(
             user_id=user_id,
             channel_id=channel_id,
             initial_message=None,
         )
+        task_snapshot = None
+        if self._task_snapshot_builder is not None and self._task_snapshot_builder.concurrent:
+            # The prefetch uses its own session, so both queries run at once
+            conversation, task_snapshot = await asyncio.gather(
+                get_conversation, self._task_snapshot_builder.build(user_id)
+            )
+        else:
+            conversation = await get_conversation
+
+        # Bind the process-wide tool registry to this request and user
+        tools = TOOL_REGISTRY.bind(self._tool_dependencies, user_id)
 
-        # Build tools for this user
-        tools = self._build_tools_for_user(user_id)
+        # Formulaic commands are answered locally with the same tools
+        if self._intent_fast_path is not None:
+            reply = await self._intent_fast_path.try_handle(text, tools)
+            if reply is not None:
+                conversation.add_message(Message.user(content=text))
+                conversation.add_message(Message.assistant(content=reply))
+                await self._conversation_manager.save(conversation)
+                return reply
+
+        if self._task_snapshot_builder is not None and not self._task_snapshot_builder.concurrent:
+            task_snapshot = await self._task_snapshot_builder.build(user_id)
 
         # Create Claude Agent Service
         claude_agent = ClaudeAgentService(
             anthropic_client=self._anthropic_client,
             tools=tools,
+            history_window=self._conversation_window,
+            model_router=self._model_router,
         )
 
         # Process message (adds user message + assistant response)
         response_text = await claude_agent.process_message(
             conversation=conversation,
             user_message=text,
+            on_text=on_text,
+            task_snapshot=task_snapshot,
+            model=model,
         )
 
         # Save updated conversation
         await self._conversation_manager.save(conversation)
 
-        return response_text
-
-    def _build_tools_for_user(self, user_id: str) -> list:
-        """Build tool instances for a specific user.
-
-        Args:
-            user_id: Slack User ID
+        # Fold messages that left the window into the summary (off the request path)
+        if self._conversation_window is not None and self._conversation_summarizer is not None:
+            summarized_count = self._conversation_window.needs_summary(conversation)
+            if summarized_count is not None:
+                self._conversation_summarizer.schedule(conversation, summarized_count)
 
-        Returns:
-            list: Tool instances
-        """
-        return [
-            # Task Tools
-            RegisterTaskTool(
-                register_task_use_case=self._register_task_use_case,
-                user_id=user_id,
-            ),
-            ListTasksTool(
-                query_user_tasks_use_case=self._query_user_tasks_use_case,
-                user_id=user_id,
-            ),
-            CompleteTaskTool(
-                complete_task_use_case=self._complete_task_use_case,
-                query_user_tasks_use_case=self._query_user_tasks_use_case,
-                user_id=user_id,
-            ),
-            UpdateTaskTool(
-                update_task_use_case=self._update_task_use_case,
-                user_id=user_id,
-            ),
-            # Workforce Management Tools
-            FindEmployeesWithSkillTool(
-                skill_repository=self._skill_repository,
-            ),
-            GetEmployeeSkillsTool(
-                skill_repository=self._skill_repository,
-            ),
-            SuggestAssigneesTool(
-                suggest_assignees_use_case=self._suggest_assignees_use_case,
-            ),
-            # Project Management Tools (Phase 1)
-            CreateProjectTool(
-                create_project_use_case=self._create_project_use_case,
-                user_id=user_id,
-            ),
-            AddTaskToProjectTool(
-                add_task_to_project_use_case=self._add_task_to_project_use_case,
-                user_id=user_id,
-            ),
-            RemoveTaskFromProjectTool(
-                remove_task_from_project_use_case=self._remove_task_from_project_use_case,
-                user_id=user_id,
-            ),
-            GetProjectProgressTool(
-                get_project_progress_use_case=self._get_project_progress_use_case,
-                user_id=user_id,
-            ),
-            ListProjectsTool(
-                list_projects_use_case=self._list_projects_use_case,
-                user_id=user_id,
-            ),
-            ArchiveProjectTool(
-                archive_project_use_case=self._archive_project_use_case,
-                user_id=user_id,
-            ),
-        ]
+        return response_text
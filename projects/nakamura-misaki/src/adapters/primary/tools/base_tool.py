@@ -5,50 +5,32 @@ Claude Messages API Tool Use feature.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 
 class BaseTool(ABC):
     """抽象基底クラス for Claude Tool Use.
 
-    各Tool実装はこのクラスを継承し、name, description, input_schema, execute()を実装する。
-    """
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Tool名（Claude APIに渡す識別子）.
-
-        例: "register_task", "list_tasks"
-        """
-        pass
+    各Tool実装はこのクラスを継承し、クラス定数 name, description, input_schema と execute() を定義する。
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Toolの説明（Claudeがいつ使うべきか判断するための説明）.
+    Tool定義はクラス定数なので、依存を持つインスタンスを作らずに読める。
 
-        例: "ユーザーの新しいタスクを登録する"
-        """
-        pass
-
-    @property
-    @abstractmethod
-    def input_schema(self) -> dict[str, Any]:
-        """Tool入力のJSONスキーマ.
+    Attributes:
+        name: Tool名（Claude APIに渡す識別子）. 例: "register_task", "list_tasks"
+        description: Toolの説明（Claudeがいつ使うべきか判断するための説明）
+        input_schema: Tool入力のJSONスキーマ（Claude Messages API Tool Use形式）
+        uses_shared_session: メッセージ単位のDBセッションを使うTool。
+            同一ターン内で並列実行せず直列化される（AsyncSessionは並行利用不可）。
+        result_token_budget: Claudeに返す実行結果の推定トークン上限。
+            超過分はresult_encoderがリストを切り詰めて "<key>_more" で示す。
+    """
 
-        Claude Messages API Tool Use形式に準拠。
+    uses_shared_session: bool = True
+    result_token_budget: int = 800
 
-        例:
-        {
-            "type": "object",
-            "properties": {
-                "title": {"type": "string", "description": "タスクタイトル"}
-            },
-            "required": ["title"]
-        }
-        """
-        pass
+    name: ClassVar[str]
+    description: ClassVar[str]
+    input_schema: ClassVar[dict[str, Any]]
 
     @abstractmethod
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
@@ -64,14 +46,15 @@ class BaseTool(ABC):
         """
         pass
 
-    def to_tool_definition(self) -> dict[str, Any]:
-        """Claude API用のTool定義を生成.
+    @classmethod
+    def to_tool_definition(cls) -> dict[str, Any]:
+        """Claude API用のTool定義を生成（インスタンス不要）.
 
         Returns:
             dict: Claude Messages API Tool Use形式のTool定義
         """
         return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.input_schema,
+            "name": cls.name,
+            "description": cls.description,
+            "input_schema": cls.input_schema,
         }
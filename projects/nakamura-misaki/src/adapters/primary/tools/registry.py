@@ -0,0 +1,92 @@
+"""Process-wide tool registry for Claude Tool Use.
+
+Tool definitions (name / description / input_schema) are static, so they are
+built once per process and shared by every request: the ``tools`` array sent
+to Claude is the same list object on every call, which keeps the prompt cache
+prefix byte-identical.
+
+Tool instances are only created when Claude actually calls a tool, bound to
+the current request's dependencies and user_id at that point.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from .base_tool import BaseTool
+
+# (request dependencies, user_id) -> tool instance
+ToolFactory = Callable[[Any, str], BaseTool]
+
+
+class ToolRegistry:
+    """Tool classes, their precomputed definitions and factories"""
+
+    def __init__(self, factories: list[tuple[type[BaseTool], ToolFactory]]):
+        """Initialize registry (computes all tool definitions once)
+
+        Args:
+            factories: (tool class, factory) pairs in the order sent to Claude
+        """
+        self._factories: dict[str, ToolFactory] = {}
+        definitions = []
+        for tool_class, factory in factories:
+            definition = tool_class.to_tool_definition()
+            self._factories[definition["name"]] = factory
+            definitions.append(definition)
+        self._definitions = definitions
+
+    @property
+    def definitions(self) -> list[dict[str, Any]]:
+        """Tool definitions in Claude API format (shared; do not mutate)"""
+        return self._definitions
+
+    @property
+    def names(self) -> list[str]:
+        """Registered tool names"""
+        return list(self._factories)
+
+    def bind(self, dependencies: Any, user_id: str) -> "BoundTools":
+        """Bind request dependencies and the current user
+
+        Args:
+            dependencies: Object the factories take use cases/repositories from
+            user_id: Current user's Slack user ID
+
+        Returns:
+            BoundTools creating tools on first use
+        """
+        return BoundTools(
+            self._definitions,
+            lambda name: self._create(name, dependencies, user_id),
+        )
+
+    def _create(self, name: str, dependencies: Any, user_id: str) -> BaseTool | None:
+        factory = self._factories.get(name)
+        return factory(dependencies, user_id) if factory else None
+
+
+class BoundTools:
+    """Tools of one request: shared definitions + lazily created instances"""
+
+    def __init__(self, definitions: list[dict[str, Any]], create: Callable[[str], BaseTool | None]):
+        """Initialize bound tools
+
+        Args:
+            definitions: Tool definitions in Claude API format
+            create: Creates the tool with the given name (None if unknown)
+        """
+        self.definitions = definitions
+        self._create = create
+        self._instances: dict[str, BaseTool | None] = {}
+
+    @classmethod
+    def from_tools(cls, tools: list[BaseTool]) -> "BoundTools":
+        """Wrap already constructed tool instances"""
+        tool_map = {tool.name: tool for tool in tools}
+        return cls([tool.to_tool_definition() for tool in tools], tool_map.get)
+
+    def get(self, name: str) -> BaseTool | None:
+        """Get the tool with the given name, creating it on first use"""
+        if name not in self._instances:
+            self._instances[name] = self._create(name)
+        return self._instances[name]
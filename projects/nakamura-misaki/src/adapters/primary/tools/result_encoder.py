@@ -0,0 +1,91 @@
+"""Compact tool-result encoding for Claude.
+
+Tool results are sent as compact JSON instead of a Python repr:
+- null fields are dropped
+- ISO timestamps lose seconds/microseconds ("2026-10-17T09:00Z")
+- output is capped at the tool's ``result_token_budget``: the longest lists
+  are cut and marked with ``"<key>_more": <remaining count>``
+"""
+
+import json
+import re
+from typing import Any
+
+from src.domain.services.conversation_window import estimate_tokens
+
+_ISO_TIMESTAMP = re.compile(
+    r"^(?P<minute>\d{4}-\d{2}-\d{2}T\d{2}:\d{2})(:\d{2}(\.\d+)?)?(?P<tz>Z|[+-]\d{2}:\d{2})?$"
+)
+
+# Suffix used when a result cannot be cut at a list boundary
+TRUNCATED_MARKER = "…(truncated)"
+
+
+def encode_tool_result(result: Any, token_budget: int) -> tuple[str, bool]:
+    """Encode a tool result as compact JSON within a token budget
+
+    Args:
+        result: Tool result ({"success": ..., "data": ...})
+        token_budget: Maximum estimated tokens of the encoded result
+
+    Returns:
+        (encoded text, True if anything was cut)
+    """
+    value = _compact(result)
+    encoded = _dumps(value)
+    if estimate_tokens(encoded) <= token_budget:
+        return encoded, False
+
+    for parent, key in sorted(_lists(value), key=lambda ref: -len(_dumps(ref[0][ref[1]]))):
+        items = parent[key]
+        # Largest prefix of the list that fits (binary search on item count)
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high + 1) // 2
+            parent[key] = items[:mid]
+            parent[f"{key}_more"] = len(items) - mid
+            if estimate_tokens(_dumps(value)) <= token_budget:
+                low = mid
+            else:
+                high = mid - 1
+        parent[key] = items[:low]
+        parent[f"{key}_more"] = len(items) - low
+        encoded = _dumps(value)
+        if estimate_tokens(encoded) <= token_budget:
+            return encoded, True
+
+    # No list left to cut: hard-truncate the text
+    max_chars = max(int(token_budget / 0.35) - len(TRUNCATED_MARKER), 0)
+    return encoded[:max_chars] + TRUNCATED_MARKER, True
+
+
+def _compact(value: Any) -> Any:
+    """Drop None fields and abbreviate timestamps (returns a copy)"""
+    if isinstance(value, dict):
+        return {key: _compact(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list | tuple):
+        return [_compact(item) for item in value]
+    if isinstance(value, str):
+        match = _ISO_TIMESTAMP.match(value)
+        if match:
+            tz = match.group("tz") or ""
+            return match.group("minute") + ("Z" if tz == "+00:00" else tz)
+    return value
+
+
+def _lists(value: Any) -> list[tuple[dict[str, Any], str]]:
+    """(parent dict, key) of every list with more than one item"""
+    refs = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, list) and len(item) > 1:
+                refs.append((value, key))
+            refs.extend(_lists(item))
+    elif isinstance(value, list):
+        for item in value:
+            refs.extend(_lists(item))
+    return refs
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
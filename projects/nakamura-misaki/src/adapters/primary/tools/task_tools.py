@@ -20,6 +20,34 @@ class RegisterTaskTool(BaseTool):
     ユーザーの新しいタスクを登録する。
     """
 
+    name = "register_task"
+    description = "ユーザーの新しいタスクを登録する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "title": {
+                "type": "string",
+                "description": "タスクのタイトル",
+            },
+            "description": {
+                "type": "string",
+                "description": "タスクの詳細説明（任意）",
+            },
+            "assignee_user_id": {
+                "type": "string",
+                "description": "担当者のSlack User ID（任意、未指定の場合は依頼者自身に割り当て）",
+            },
+            "due_date": {
+                "type": "string",
+                "format": "date-time",
+                "description": "期限（ISO 8601形式、任意）",
+            },
+        },
+        "required": ["title"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, register_task_use_case: RegisterTaskUseCase, user_id: str):
         """Initialize RegisterTaskTool.
 
@@ -30,40 +58,6 @@ class RegisterTaskTool(BaseTool):
         self._register_task_use_case = register_task_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "register_task"
-
-    @property
-    def description(self) -> str:
-        return "ユーザーの新しいタスクを登録する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "description": "タスクのタイトル",
-                },
-                "description": {
-                    "type": "string",
-                    "description": "タスクの詳細説明（任意）",
-                },
-                "assignee_user_id": {
-                    "type": "string",
-                    "description": "担当者のSlack User ID（任意、未指定の場合は依頼者自身に割り当て）",
-                },
-                "due_date": {
-                    "type": "string",
-                    "format": "date-time",
-                    "description": "期限（ISO 8601形式、任意）",
-                },
-            },
-            "required": ["title"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク登録を実行.
 
@@ -139,6 +133,21 @@ class ListTasksTool(BaseTool):
     ユーザーのタスク一覧を取得する。
     """
 
+    name = "list_tasks"
+    description = "ユーザーのタスク一覧を取得する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "status": {
+                "type": "string",
+                "enum": ["pending", "in_progress", "completed"],
+                "description": "フィルタするステータス（任意）",
+            },
+        },
+    }
+
+    result_token_budget = 1500
+
     def __init__(self, query_user_tasks_use_case: QueryUserTasksUseCase, user_id: str):
         """Initialize ListTasksTool.
 
@@ -149,27 +158,6 @@ class ListTasksTool(BaseTool):
         self._query_user_tasks_use_case = query_user_tasks_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "list_tasks"
-
-    @property
-    def description(self) -> str:
-        return "ユーザーのタスク一覧を取得する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "status": {
-                    "type": "string",
-                    "enum": ["pending", "in_progress", "completed"],
-                    "description": "フィルタするステータス（任意）",
-                },
-            },
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク一覧を取得.
 
@@ -232,6 +220,21 @@ class CompleteTaskTool(BaseTool):
     task_identifierがUUIDでない場合、タイトル部分一致で検索する。
     """
 
+    name = "complete_task"
+    description = "タスクを完了済みにする"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "task_identifier": {
+                "type": "string",
+                "description": "タスクID（UUID）またはタスクタイトルの一部",
+            },
+        },
+        "required": ["task_identifier"],
+    }
+
+    result_token_budget = 300
+
     def __init__(
         self,
         complete_task_use_case: CompleteTaskUseCase,
@@ -249,27 +252,6 @@ class CompleteTaskTool(BaseTool):
         self._query_user_tasks_use_case = query_user_tasks_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "complete_task"
-
-    @property
-    def description(self) -> str:
-        return "タスクを完了済みにする"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "task_identifier": {
-                    "type": "string",
-                    "description": "タスクID（UUID）またはタスクタイトルの一部",
-                },
-            },
-            "required": ["task_identifier"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク完了を実行.
 
@@ -356,6 +338,39 @@ class UpdateTaskTool(BaseTool):
     タスクの属性（タイトル、説明、ステータス、期限）を更新する。
     """
 
+    name = "update_task"
+    description = "タスクを更新する（タイトル、説明、ステータス、期限）"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "task_id": {
+                "type": "string",
+                "description": "タスクID（UUID）",
+            },
+            "title": {
+                "type": "string",
+                "description": "新しいタイトル（任意）",
+            },
+            "description": {
+                "type": "string",
+                "description": "新しい説明（任意）",
+            },
+            "status": {
+                "type": "string",
+                "enum": ["pending", "in_progress", "completed"],
+                "description": "新しいステータス（任意）",
+            },
+            "due_date": {
+                "type": "string",
+                "format": "date-time",
+                "description": "新しい期限（ISO 8601形式、任意）",
+            },
+        },
+        "required": ["task_id"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, update_task_use_case: UpdateTaskUseCase, user_id: str):
         """Initialize UpdateTaskTool.
 
@@ -366,45 +381,6 @@ class UpdateTaskTool(BaseTool):
         self._update_task_use_case = update_task_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "update_task"
-
-    @property
-    def description(self) -> str:
-        return "タスクを更新する（タイトル、説明、ステータス、期限）"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "task_id": {
-                    "type": "string",
-                    "description": "タスクID（UUID）",
-                },
-                "title": {
-                    "type": "string",
-                    "description": "新しいタイトル（任意）",
-                },
-                "description": {
-                    "type": "string",
-                    "description": "新しい説明（任意）",
-                },
-                "status": {
-                    "type": "string",
-                    "enum": ["pending", "in_progress", "completed"],
-                    "description": "新しいステータス（任意）",
-                },
-                "due_date": {
-                    "type": "string",
-                    "format": "date-time",
-                    "description": "新しい期限（ISO 8601形式、任意）",
-                },
-            },
-            "required": ["task_id"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク更新を実行.
 
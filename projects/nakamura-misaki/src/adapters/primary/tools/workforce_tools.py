@@ -17,6 +17,21 @@ class FindEmployeesWithSkillTool(BaseTool):
     ユーザーが「〜できる人は誰？」「〜を担当できるのは？」などの質問をした際に使用。
     """
 
+    name = "find_employees_with_skill"
+    description = "特定のスキル（例: 返信、査定、出品など）を持つ社員を検索する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "skill_name": {
+                "type": "string",
+                "description": "検索するスキル名（例: 返信、査定、出品）",
+            }
+        },
+        "required": ["skill_name"],
+    }
+
+    result_token_budget = 800
+
     def __init__(self, skill_repository: SkillRepository):
         """Initialize FindEmployeesWithSkillTool.
 
@@ -25,27 +40,6 @@ class FindEmployeesWithSkillTool(BaseTool):
         """
         self._skill_repository = skill_repository
 
-    @property
-    def name(self) -> str:
-        return "find_employees_with_skill"
-
-    @property
-    def description(self) -> str:
-        return "特定のスキル（例: 返信、査定、出品など）を持つ社員を検索する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "skill_name": {
-                    "type": "string",
-                    "description": "検索するスキル名（例: 返信、査定、出品）",
-                }
-            },
-            "required": ["skill_name"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """Execute the tool.
 
@@ -82,6 +76,21 @@ class GetEmployeeSkillsTool(BaseTool):
     ユーザーが「〜さんは何ができるの？」「〜さんのスキルは？」などの質問をした際に使用。
     """
 
+    name = "get_employee_skills"
+    description = "特定の社員が持つスキル一覧を取得する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "employee_name": {
+                "type": "string",
+                "description": "社員名（例: 江口 那都、野口 器）",
+            }
+        },
+        "required": ["employee_name"],
+    }
+
+    result_token_budget = 600
+
     def __init__(self, skill_repository: SkillRepository):
         """Initialize GetEmployeeSkillsTool.
 
@@ -90,27 +99,6 @@ class GetEmployeeSkillsTool(BaseTool):
         """
         self._skill_repository = skill_repository
 
-    @property
-    def name(self) -> str:
-        return "get_employee_skills"
-
-    @property
-    def description(self) -> str:
-        return "特定の社員が持つスキル一覧を取得する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "employee_name": {
-                    "type": "string",
-                    "description": "社員名（例: 江口 那都、野口 器）",
-                }
-            },
-            "required": ["employee_name"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """Execute the tool.
 
@@ -164,6 +152,27 @@ class SuggestAssigneesTool(BaseTool):
     ユーザーが「〜と〜ができる人は？」「このタスクは誰に任せれば？」などの質問をした際に使用。
     """
 
+    name = "suggest_assignees"
+    description = "タスクに必要な複数のスキルから、最適な担当者を提案する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "required_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "必要なスキルのリスト（例: ['返信', '査定']）",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "提案する候補者の最大数（デフォルト: 5）",
+                "default": 5,
+            },
+        },
+        "required": ["required_skills"],
+    }
+
+    result_token_budget = 600
+
     def __init__(self, suggest_assignees_use_case: SuggestAssigneesUseCase):
         """Initialize SuggestAssigneesTool.
 
@@ -172,33 +181,6 @@ class SuggestAssigneesTool(BaseTool):
         """
         self._suggest_assignees_use_case = suggest_assignees_use_case
 
-    @property
-    def name(self) -> str:
-        return "suggest_assignees"
-
-    @property
-    def description(self) -> str:
-        return "タスクに必要な複数のスキルから、最適な担当者を提案する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "required_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "必要なスキルのリスト（例: ['返信', '査定']）",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "提案する候補者の最大数（デフォルト: 5）",
-                    "default": 5,
-                },
-            },
-            "required": ["required_skills"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """Execute the tool.
 
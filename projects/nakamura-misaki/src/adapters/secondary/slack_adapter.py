@@ -1,9 +1,24 @@
-"""Slack API adapter"""
-
-import json
+"""Slack API adapter
+
+Async Slack Web API client on a shared aiohttp session:
+- Keep-alive connection pooling (one TCP/TLS handshake per connection, not per call)
+- Per-request timeouts that never block the event loop
+- ``close()`` releases pooled connections at application shutdown
+- ``iter_users()`` follows ``users.list`` cursors and honors Retry-After
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-import requests
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class SlackAPIError(Exception):
+    """Slack API returned ok=false (or a transport error) while paginating"""
 
 
 class SlackAdapter:
@@ -13,69 +28,141 @@ class SlackAdapter:
     DND_END_URL = "https://slack.com/api/dnd.endDnd"
     USERS_LIST_URL = "https://slack.com/api/users.list"
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 10,
+        keepalive_timeout_seconds: float = 30.0,
+    ) -> None:
+        """Initialize adapter
+
+        The HTTP session is created lazily on first use, inside the running
+        event loop, and reused by every later call.
+
+        Args:
+            token: Slack token (Bot or User Token)
+            timeout_seconds: Total timeout per request
+            max_connections: Connection pool size
+            keepalive_timeout_seconds: Idle time before a pooled connection is closed
+        """
         self.token = token.strip()
+        self._timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._max_connections = max_connections
+        self._keepalive_timeout = keepalive_timeout_seconds
+        self._session: aiohttp.ClientSession | None = None
 
     async def send_message(self, channel: str, text: str) -> dict[str, Any]:
         """Send message to channel or DM"""
-        if not self.token:
-            return {"ok": False, "error": "token_missing"}
-
-        payload = {"channel": channel, "text": text}
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json; charset=utf-8",
-        }
-
-        try:
-            response = requests.post(self.API_URL, headers=headers, json=payload, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as exc:
-            return {"ok": False, "error": str(exc)}
-        except json.JSONDecodeError:
-            return {"ok": False, "error": "invalid_json"}
-
-        return data
+        return await self._request("POST", self.API_URL, payload={"channel": channel, "text": text})
 
     async def end_dnd(self) -> dict[str, Any]:
         """End Do Not Disturb mode"""
+        return await self._request("POST", self.DND_END_URL)
+
+    async def users_list(self, cursor: str | None = None, limit: int | None = None) -> dict[str, Any]:
+        """Get one page of users in workspace
+
+        Args:
+            cursor: ``response_metadata.next_cursor`` of the previous page
+            limit: Page size (Slack recommends at most 200)
+        """
+        params: dict[str, Any] = {}
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+        return await self._request("GET", self.USERS_LIST_URL, params=params or None)
+
+    async def iter_users(
+        self, page_size: int = 200, max_rate_limit_retries: int = 5
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream all workspace members page by page
+
+        Args:
+            page_size: Members requested per page
+            max_rate_limit_retries: Consecutive ``ratelimited`` responses tolerated per page
+
+        Yields:
+            Member dicts of one page
+
+        Raises:
+            SlackAPIError: A page could not be fetched
+        """
+        cursor: str | None = None
+        retries = 0
+        while True:
+            data = await self.users_list(cursor=cursor, limit=page_size)
+            if data.get("error") == "ratelimited" and retries < max_rate_limit_retries:
+                retries += 1
+                retry_after = data.get("retry_after", 1.0)
+                logger.info(f"users.list rate limited, retrying in {retry_after}s ({retries}/{max_rate_limit_retries})")
+                await asyncio.sleep(retry_after)
+                continue
+            if not data.get("ok"):
+                raise SlackAPIError(data.get("error", "unknown"))
+
+            retries = 0
+            yield data.get("members", [])
+
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
+
+    async def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get (or create) the shared HTTP session"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Call a Slack Web API method
+
+        Args:
+            method: HTTP method
+            url: API method URL
+            payload: JSON body (POST only)
+            params: Query parameters
+
+        Returns:
+            Slack API response, or {"ok": False, "error": ...} on transport errors.
+            HTTP 429 yields {"ok": False, "error": "ratelimited", "retry_after": seconds}.
+        """
         if not self.token:
             return {"ok": False, "error": "token_missing"}
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json; charset=utf-8",
-        }
-
-        try:
-            response = requests.post(self.DND_END_URL, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as exc:
-            return {"ok": False, "error": str(exc)}
-        except json.JSONDecodeError:
-            return {"ok": False, "error": "invalid_json"}
-
-        return data
-
-    async def users_list(self) -> dict[str, Any]:
-        """Get list of users in workspace"""
-        if not self.token:
-            return {"ok": False, "error": "token_missing"}
-
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json; charset=utf-8",
-        }
-
+        headers = {"Content-Type": "application/json; charset=utf-8"}
         try:
-            response = requests.get(self.USERS_LIST_URL, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as exc:
-            return {"ok": False, "error": str(exc)}
-        except json.JSONDecodeError:
+            async with self._get_session().request(
+                method, url, headers=headers, json=payload, params=params
+            ) as response:
+                if response.status == 429:
+                    retry_after = float(response.headers.get("Retry-After", "1"))
+                    return {"ok": False, "error": "ratelimited", "retry_after": retry_after}
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            logger.warning(f"Slack API request failed: {url}: {exc!r}")
+            return {"ok": False, "error": str(exc) or type(exc).__name__}
+        except ValueError:
             return {"ok": False, "error": "invalid_json"}
-
-        return data
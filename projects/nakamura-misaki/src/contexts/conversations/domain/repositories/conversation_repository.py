@@ -65,8 +65,12 @@ class ConversationRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete_expired(self) -> int:
-        """Delete all expired conversations
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired conversations
+
+        Args:
+            limit: Maximum conversations deleted by this call (None = all);
+                callers loop until fewer than ``limit`` are deleted
 
         Returns:
             Number of conversations deleted
@@ -1,6 +1,5 @@
 """Conversations domain services."""
 
-from .claude_agent_service import ClaudeAgentService
 from .conversation_manager import ConversationManager
 
-__all__ = ["ClaudeAgentService", "ConversationManager"]
+__all__ = ["ConversationManager"]
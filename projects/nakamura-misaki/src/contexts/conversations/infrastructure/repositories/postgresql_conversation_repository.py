@@ -1,9 +1,9 @@
 """PostgreSQL Conversation Repository Implementation"""
 
-import json
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import case, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.contexts.conversations.domain.entities.conversation import Conversation
@@ -13,41 +13,52 @@ from src.contexts.conversations.domain.repositories.conversation_repository impo
 from src.contexts.conversations.domain.value_objects.conversation_id import ConversationId
 from src.contexts.conversations.domain.value_objects.message import Message
 from src.infrastructure.database.schema import ConversationTable
+from src.infrastructure.database.upsert import upsert
+from src.infrastructure.repositories.conversation_message_store import ConversationMessageStore
 from src.shared_kernel.domain.value_objects.user_id import UserId
 
 
 class PostgreSQLConversationRepository(ConversationRepository):
-    """PostgreSQL implementation of ConversationRepository"""
+    """PostgreSQL implementation of ConversationRepository
+
+    Messages are appended to conversation_messages. This context's entity has
+    no notion of a partially loaded history, so reads load every message.
+    """
 
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._messages = ConversationMessageStore(session)
+        self._stored_counts: dict[UUID, int] = {}
 
     async def save(self, conversation: Conversation) -> None:
         """Save conversation"""
-        # Check if exists
-        stmt = select(ConversationTable).where(ConversationTable.conversation_id == conversation.id.value)
-        result = await self._session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing
-            existing.messages = [self._message_to_dict(msg) for msg in conversation.messages]
-            existing.updated_at = conversation.updated_at
-            existing.last_message_at = conversation.updated_at
-        else:
-            # Create new
-            conversation_table = ConversationTable(
-                conversation_id=conversation.id.value,
-                user_id=conversation.user_id.value,
-                channel_id=conversation.channel_id,
-                messages=[self._message_to_dict(msg) for msg in conversation.messages],
-                created_at=conversation.created_at,
-                updated_at=conversation.updated_at,
-                last_message_at=conversation.updated_at,
-            )
-            self._session.add(conversation_table)
+        await upsert(
+            self._session,
+            ConversationTable,
+            {
+                "conversation_id": conversation.id.value,
+                "user_id": conversation.user_id.value,
+                "channel_id": conversation.channel_id,
+                "message_count": len(conversation.messages),
+                "created_at": conversation.created_at,
+                "updated_at": conversation.updated_at,
+                "last_message_at": conversation.updated_at,
+                "expires_at": conversation.expires_at,
+            },
+            insert_only=["user_id", "channel_id", "created_at"],
+            update_set=lambda excluded: {
+                "message_count": case(
+                    (excluded.message_count > ConversationTable.message_count, excluded.message_count),
+                    else_=ConversationTable.message_count,
+                )
+            },
+        )
 
-        await self._session.flush()
+        # Append only the messages added since this repository loaded / saved the conversation
+        # (unknown conversations resend everything; stored seqs are skipped)
+        stored_count = self._stored_counts.get(conversation.id.value, 0)
+        await self._messages.append(conversation.id.value, stored_count, conversation.messages[stored_count:])
+        self._stored_counts[conversation.id.value] = len(conversation.messages)
 
     async def find_by_id(self, conversation_id: ConversationId) -> Conversation | None:
         """Find conversation by ID"""
@@ -58,7 +69,7 @@ class PostgreSQLConversationRepository(ConversationRepository):
         if conversation_table is None:
             return None
 
-        return self._to_entity(conversation_table)
+        return await self._to_entity(conversation_table)
 
     async def find_by_user_and_channel(self, user_id: UserId, channel_id: str) -> Conversation | None:
         """Find conversation by user and channel"""
@@ -74,7 +85,7 @@ class PostgreSQLConversationRepository(ConversationRepository):
         if conversation_table is None:
             return None
 
-        return self._to_entity(conversation_table)
+        return await self._to_entity(conversation_table)
 
     async def delete(self, conversation_id: ConversationId) -> None:
         """Delete conversation"""
@@ -82,22 +93,15 @@ class PostgreSQLConversationRepository(ConversationRepository):
         await self._session.execute(stmt)
         await self._session.flush()
 
-    async def delete_expired(self) -> int:
-        """Delete all expired conversations"""
-        # Find all expired conversations
-        current_time = datetime.now(UTC)
-        stmt = select(ConversationTable)
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired conversations (indexed expires_at; messages cascade)"""
+        expired = select(ConversationTable.conversation_id).where(ConversationTable.expires_at < datetime.now(UTC))
+        if limit is not None:
+            expired = expired.limit(limit)
+        stmt = delete(ConversationTable).where(ConversationTable.conversation_id.in_(expired))
         result = await self._session.execute(stmt)
-        all_conversations = result.scalars().all()
-
-        deleted_count = 0
-        for conv_table in all_conversations:
-            conversation = self._to_entity(conv_table)
-            if conversation.is_expired(current_time):
-                await self.delete(conversation.id)
-                deleted_count += 1
-
-        return deleted_count
+        await self._session.flush()
+        return result.rowcount  # type: ignore[no-any-return]
 
     async def find_recent(self, limit: int = 50) -> list[Conversation]:
         """Find recent conversations ordered by last_message_at"""
@@ -105,26 +109,13 @@ class PostgreSQLConversationRepository(ConversationRepository):
         result = await self._session.execute(stmt)
         conversation_tables = result.scalars().all()
 
-        return [self._to_entity(conv_table) for conv_table in conversation_tables]
-
-    def _to_entity(self, conversation_table: ConversationTable) -> Conversation:
-        """Convert ConversationTable to Conversation entity"""
-        # Handle case where messages might be stored as JSON string
-        messages_data = conversation_table.messages
-        if isinstance(messages_data, str):
-            messages_data = json.loads(messages_data)
+        return [await self._to_entity(conv_table) for conv_table in conversation_tables]
 
-        messages = [
-            Message(
-                role=msg["role"],
-                content=msg["content"],
-                timestamp=datetime.fromisoformat(msg.get("timestamp", conversation_table.created_at.isoformat())),
-            )
-            for msg in messages_data
-        ]
-
-        # Calculate expires_at as created_at + 24 hours (default TTL)
-        expires_at = conversation_table.created_at + timedelta(hours=24)
+    async def _to_entity(self, conversation_table: ConversationTable) -> Conversation:
+        """Convert ConversationTable (and its message rows) to Conversation entity"""
+        rows = await self._messages.load_tail(conversation_table.conversation_id)
+        messages = [Message(role=row.role, content=row.content, timestamp=row.created_at) for row in rows]
+        self._stored_counts[conversation_table.conversation_id] = len(messages)
 
         return Conversation(
             id=ConversationId(value=conversation_table.conversation_id),
@@ -133,13 +124,5 @@ class PostgreSQLConversationRepository(ConversationRepository):
             messages=messages,
             created_at=conversation_table.created_at,
             updated_at=conversation_table.updated_at,
-            expires_at=expires_at,
+            expires_at=conversation_table.expires_at,
         )
-
-    def _message_to_dict(self, message: Message) -> dict:
-        """Convert Message to dict for storage"""
-        return {
-            "role": message.role,
-            "content": message.content,
-            "timestamp": message.timestamp.isoformat(),
-        }
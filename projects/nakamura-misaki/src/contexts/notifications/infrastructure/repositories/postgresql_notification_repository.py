@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.schema import NotificationTable
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.notification import Notification
 from ...domain.repositories.notification_repository import NotificationRepository
@@ -32,32 +33,21 @@ class PostgreSQLNotificationRepository(NotificationRepository):
         Returns:
             Saved notification entity
         """
-        # Check if notification exists
-        existing = await self._session.get(NotificationTable, notification.id)
-
-        if existing:
-            # Update existing
-            existing.user_id = notification.user_id
-            existing.notification_type = notification.notification_type.value
-            existing.task_id = notification.task_id
-            existing.content = notification.content
-            existing.sent_at = notification.sent_at
-            existing.read_at = notification.read_at
-        else:
-            # Insert new
-            table_row = NotificationTable(
-                id=notification.id,
-                user_id=notification.user_id,
-                notification_type=notification.notification_type.value,
-                task_id=notification.task_id,
-                content=notification.content,
-                sent_at=notification.sent_at,
-                read_at=notification.read_at,
-                created_at=notification.created_at,
-            )
-            self._session.add(table_row)
-
-        await self._session.flush()
+        await upsert(
+            self._session,
+            NotificationTable,
+            {
+                "id": notification.id,
+                "user_id": notification.user_id,
+                "notification_type": notification.notification_type.value,
+                "task_id": notification.task_id,
+                "content": notification.content,
+                "sent_at": notification.sent_at,
+                "read_at": notification.read_at,
+                "created_at": notification.created_at,
+            },
+            insert_only=["created_at"],
+        )
         return notification
 
     async def find_by_id(self, notification_id: UUID) -> Notification | None:
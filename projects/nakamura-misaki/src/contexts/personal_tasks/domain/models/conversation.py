@@ -1,6 +1,6 @@
 """Conversation domain model - Personal Tasks Context"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from uuid import UUID, uuid4
@@ -84,13 +84,18 @@ class Conversation:
         id: Unique identifier for the conversation
         user_id: Slack user ID who owns this conversation
         channel_id: Slack channel ID where conversation occurs
-        messages: List of messages in chronological order
+        messages: Loaded messages in chronological order (a tail of the full history)
         created_at: When the conversation was created
         updated_at: When the conversation was last updated
-        expires_at: When the conversation expires (for cleanup)
+        expires_at: When the conversation expires (for cleanup; slides forward on activity)
+        summary: Rolling summary of the oldest messages (None until first summarized)
+        summarized_count: Number of leading messages covered by ``summary``
+        message_offset: Position of messages[0] in the full history
+            (older messages are stored but not loaded)
+        stored_message_count: Messages already persisted (maintained by the repository)
 
     Business Rules:
-        - Conversations expire after a configurable TTL (default 24 hours)
+        - Conversations expire after a configurable TTL (default 24 hours) without activity
         - Messages are stored in chronological order
         - Expired conversations should be cleaned up
     """
@@ -102,6 +107,10 @@ class Conversation:
     created_at: datetime
     updated_at: datetime
     expires_at: datetime
+    summary: str | None = None
+    summarized_count: int = 0
+    message_offset: int = 0
+    stored_message_count: int = 0
 
     @classmethod
     def create(
@@ -144,6 +153,43 @@ class Conversation:
         self.messages.append(message)
         self.updated_at = datetime.now(UTC)
 
+    def extend_expiry(self, ttl_hours: int) -> None:
+        """Slide expires_at to ``ttl_hours`` from now (on activity)
+
+        Args:
+            ttl_hours: Time-to-live in hours
+        """
+        self.expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages in the full history (loaded or not)"""
+        return self.message_offset + len(self.messages)
+
+    def messages_between(self, start: int, end: int) -> list[Message]:
+        """Loaded messages at full-history positions [start, end)"""
+        return self.messages[max(start - self.message_offset, 0) : max(end - self.message_offset, 0)]
+
+    def apply_summary(self, summary: str, summarized_count: int) -> None:
+        """Replace the rolling summary
+
+        Args:
+            summary: Summary of the first ``summarized_count`` messages of the full history
+            summarized_count: Number of leading messages the summary covers
+        """
+        if not 0 <= summarized_count <= self.message_count:
+            raise ValueError(f"summarized_count out of range: {summarized_count}")
+        self.summary = summary
+        self.summarized_count = summarized_count
+
+    def copy(self) -> "Conversation":
+        """Copy that can be mutated independently (messages are immutable, the list is not)
+
+        Returns:
+            New Conversation with the same state and its own message list
+        """
+        return replace(self, messages=list(self.messages))
+
     def is_expired(self) -> bool:
         """Check if conversation has expired
 
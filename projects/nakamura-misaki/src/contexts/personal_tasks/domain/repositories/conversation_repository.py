@@ -56,6 +56,24 @@ class ConversationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> bool:
+        """Store a rolling summary unless a newer one is already stored
+
+        ``save()`` never overwrites the summary, so a summary written by a
+        background task survives concurrent saves of the conversation.
+
+        Args:
+            conversation_id: Conversation ID
+            summary: Summary of the first ``summarized_count`` messages
+            summarized_count: Number of leading messages the summary covers
+
+        Returns:
+            True if stored, False if the conversation is gone or already
+            summarized at least that far
+        """
+        pass
+
     @abstractmethod
     async def delete(self, conversation_id: UUID) -> None:
         """Delete a conversation
@@ -66,8 +84,12 @@ class ConversationRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete_expired(self) -> int:
-        """Delete all expired conversations
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired conversations
+
+        Args:
+            limit: Maximum conversations deleted by this call (None = all);
+                callers loop until fewer than ``limit`` are deleted
 
         Returns:
             Number of conversations deleted
@@ -1,10 +1,9 @@
 """PostgreSQL Conversation Repository for Personal Tasks Context"""
 
-import json
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import case, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
@@ -12,53 +11,54 @@ from src.contexts.personal_tasks.domain.repositories.conversation_repository imp
     ConversationRepository,
 )
 from src.infrastructure.database.schema import ConversationTable
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.database.upsert import upsert
+from src.infrastructure.repositories.conversation_message_store import ConversationMessageStore
 
 
 class PostgreSQLConversationRepository(ConversationRepository):
-    """PostgreSQL implementation of ConversationRepository for Personal Tasks context"""
+    """PostgreSQL implementation of ConversationRepository for Personal Tasks context
 
-    def __init__(self, session: AsyncSession):
+    Messages are appended to conversation_messages; reads load the messages
+    after the rolling summary, at most ``max_loaded_messages`` of them.
+    """
+
+    def __init__(self, session: AsyncSession | ScopedSession, max_loaded_messages: int = 200):
         self._session = session
+        self._messages = ConversationMessageStore(session)
+        self._max_loaded_messages = max_loaded_messages
 
     async def save(self, conversation: Conversation) -> None:
-        """Save conversation"""
-        # Check if exists
-        stmt = select(ConversationTable).where(
-            ConversationTable.conversation_id == conversation.id
-        )
-        result = await self._session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        # Serialize messages to JSON
-        messages_json = json.dumps([
+        """Save conversation (inserts only the messages added since the last save)"""
+        await upsert(
+            self._session,
+            ConversationTable,
             {
-                "role": msg.role,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat()
-            }
-            for msg in conversation.messages
-        ])
-
-        if existing:
-            # Update
-            existing.user_id = conversation.user_id
-            existing.channel_id = conversation.channel_id
-            existing.messages = messages_json
-            existing.updated_at = conversation.updated_at
-            # Note: expires_at is not stored in DB, calculated from created_at
-        else:
-            # Insert (note: expires_at not stored in DB, calculated from created_at)
-            new_conv = ConversationTable(
-                conversation_id=conversation.id,
-                user_id=conversation.user_id,
-                channel_id=conversation.channel_id,
-                messages=messages_json,
-                created_at=conversation.created_at,
-                updated_at=conversation.updated_at,
-            )
-            self._session.add(new_conv)
+                "conversation_id": conversation.id,
+                "user_id": conversation.user_id,
+                "channel_id": conversation.channel_id,
+                "message_count": conversation.message_count,
+                "created_at": conversation.created_at,
+                "updated_at": conversation.updated_at,
+                "last_message_at": conversation.updated_at,
+                "expires_at": conversation.expires_at,
+                "summary": conversation.summary,
+                "summarized_count": conversation.summarized_count,
+            },
+            # summary / summarized_count are only updated by save_summary()
+            insert_only=["created_at", "summary", "summarized_count"],
+            update_set=lambda excluded: {
+                "message_count": case(
+                    (excluded.message_count > ConversationTable.message_count, excluded.message_count),
+                    else_=ConversationTable.message_count,
+                )
+            },
+        )
 
-        await self._session.flush()
+        stored_count = conversation.stored_message_count
+        new_messages = conversation.messages_between(stored_count, conversation.message_count)
+        await self._messages.append(conversation.id, stored_count, new_messages)
+        conversation.stored_message_count = conversation.message_count
 
     async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
         """Get conversation by ID"""
@@ -70,30 +70,7 @@ class PostgreSQLConversationRepository(ConversationRepository):
 
         if not model:
             return None
-
-        # Deserialize messages from JSON
-        messages_data = json.loads(model.messages)
-        messages = [
-            Message(
-                role=msg["role"],
-                content=msg["content"],
-                timestamp=datetime.fromisoformat(msg["timestamp"]),
-            )
-            for msg in messages_data
-        ]
-
-        # Calculate expires_at as created_at + 24 hours (default TTL)
-        expires_at = model.created_at + timedelta(hours=24)
-
-        return Conversation(
-            id=model.conversation_id,
-            user_id=model.user_id,
-            channel_id=model.channel_id,
-            messages=messages,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            expires_at=expires_at,
-        )
+        return await self._to_entity(model)
 
     async def get_by_user_and_channel(
         self, user_id: str, channel_id: str
@@ -108,30 +85,20 @@ class PostgreSQLConversationRepository(ConversationRepository):
 
         if not model:
             return None
-
-        # Deserialize messages from JSON
-        messages_data = json.loads(model.messages)
-        messages = [
-            Message(
-                role=msg["role"],
-                content=msg["content"],
-                timestamp=datetime.fromisoformat(msg["timestamp"]),
+        return await self._to_entity(model)
+
+    async def save_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> bool:
+        """Store a rolling summary unless a newer one is already stored"""
+        stmt = (
+            update(ConversationTable)
+            .where(
+                ConversationTable.conversation_id == conversation_id,
+                ConversationTable.summarized_count < summarized_count,
             )
-            for msg in messages_data
-        ]
-
-        # Calculate expires_at as created_at + 24 hours (default TTL)
-        expires_at = model.created_at + timedelta(hours=24)
-
-        return Conversation(
-            id=model.conversation_id,
-            user_id=model.user_id,
-            channel_id=model.channel_id,
-            messages=messages,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            expires_at=expires_at,
+            .values(summary=summary, summarized_count=summarized_count)
         )
+        result = await self._session.execute(stmt)
+        return result.rowcount > 0  # type: ignore[no-any-return]
 
     async def delete(self, conversation_id: UUID) -> None:
         """Delete a conversation"""
@@ -141,15 +108,37 @@ class PostgreSQLConversationRepository(ConversationRepository):
         await self._session.execute(stmt)
         await self._session.flush()
 
-    async def delete_expired(self) -> int:
-        """Delete expired conversations (older than 24 hours)"""
-        current_time = datetime.now(UTC)
-        expiry_threshold = current_time - timedelta(hours=24)
-
-        # Delete conversations where created_at is older than 24 hours
-        stmt = delete(ConversationTable).where(
-            ConversationTable.created_at <= expiry_threshold
+    async def delete_expired(self, limit: int | None = None) -> int:
+        """Delete expired conversations (indexed expires_at; messages cascade)"""
+        expired = select(ConversationTable.conversation_id).where(
+            ConversationTable.expires_at < datetime.now(UTC)
         )
+        if limit is not None:
+            expired = expired.limit(limit)
+        stmt = delete(ConversationTable).where(ConversationTable.conversation_id.in_(expired))
         result = await self._session.execute(stmt)
         await self._session.flush()
         return result.rowcount  # type: ignore[no-any-return]
+
+    async def _to_entity(self, model: ConversationTable) -> Conversation:
+        """Build the entity with the unsummarized tail of its messages"""
+        rows = await self._messages.load_tail(
+            model.conversation_id,
+            from_seq=model.summarized_count or 0,
+            limit=self._max_loaded_messages,
+        )
+        messages = [Message(role=row.role, content=row.content, timestamp=row.created_at) for row in rows]
+
+        return Conversation(
+            id=model.conversation_id,
+            user_id=model.user_id,
+            channel_id=model.channel_id,
+            messages=messages,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            expires_at=model.expires_at,
+            summary=model.summary,
+            summarized_count=model.summarized_count or 0,
+            message_offset=rows[0].seq if rows else model.message_count,
+            stored_message_count=model.message_count,
+        )
@@ -8,6 +8,7 @@ from sqlalchemy import delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from .....infrastructure.database.upsert import upsert
 from .....shared_kernel.domain.value_objects.task_status import TaskStatus
 from ...domain.models.task import Task
 from ...domain.repositories.task_repository import TaskRepository
@@ -58,42 +59,26 @@ class PostgreSQLTaskRepository(TaskRepository):
         Args:
             task: Task domain entity to save
         """
-        # Check if task exists
-        stmt = select(TaskModel).where(TaskModel.id == task.id)
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing
-            existing.title = task.title
-            existing.description = task.description
-            existing.assignee_user_id = task.assignee_user_id
-            existing.creator_user_id = task.creator_user_id
-            existing.status = task.status.value
-            existing.due_at = task.due_at
-            existing.priority = task.priority
-            existing.progress_percent = task.progress_percent
-            existing.estimated_hours = task.estimated_hours
-            existing.completed_at = task.completed_at
-            existing.updated_at = task.updated_at
-        else:
-            # Create new
-            model = TaskModel(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                assignee_user_id=task.assignee_user_id,
-                creator_user_id=task.creator_user_id,
-                status=task.status.value,
-                due_at=task.due_at,
-                priority=task.priority,
-                progress_percent=task.progress_percent,
-                estimated_hours=task.estimated_hours,
-                completed_at=task.completed_at,
-                created_at=task.created_at,
-                updated_at=task.updated_at,
-            )
-            self.session.add(model)
+        await upsert(
+            self.session,
+            TaskModel,
+            {
+                "id": task.id,
+                "title": task.title,
+                "description": task.description,
+                "assignee_user_id": task.assignee_user_id,
+                "creator_user_id": task.creator_user_id,
+                "status": task.status.value,
+                "due_at": task.due_at,
+                "priority": task.priority,
+                "progress_percent": task.progress_percent,
+                "estimated_hours": task.estimated_hours,
+                "completed_at": task.completed_at,
+                "created_at": task.created_at,
+                "updated_at": task.updated_at,
+            },
+            insert_only=["created_at"],
+        )
 
     async def get_by_id(self, task_id: UUID) -> Task | None:
         """Get task by ID
@@ -22,6 +22,34 @@ class CreateProjectTool(BaseTool):
     新しいプロジェクトを作成する。
     """
 
+    name = "create_project"
+    description = "新しいプロジェクトを作成する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "プロジェクト名",
+            },
+            "description": {
+                "type": "string",
+                "description": "プロジェクトの説明（任意）",
+            },
+            "deadline": {
+                "type": "string",
+                "format": "date-time",
+                "description": "プロジェクト期限（ISO 8601形式、任意）",
+            },
+            "owner_user_id": {
+                "type": "string",
+                "description": "オーナーのSlack User ID（任意、未指定の場合は現在のユーザー）",
+            },
+        },
+        "required": ["name"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, create_project_use_case: CreateProjectUseCase, user_id: str):
         """Initialize CreateProjectTool.
 
@@ -32,40 +60,6 @@ class CreateProjectTool(BaseTool):
         self._create_project_use_case = create_project_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "create_project"
-
-    @property
-    def description(self) -> str:
-        return "新しいプロジェクトを作成する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "プロジェクト名",
-                },
-                "description": {
-                    "type": "string",
-                    "description": "プロジェクトの説明（任意）",
-                },
-                "deadline": {
-                    "type": "string",
-                    "format": "date-time",
-                    "description": "プロジェクト期限（ISO 8601形式、任意）",
-                },
-                "owner_user_id": {
-                    "type": "string",
-                    "description": "オーナーのSlack User ID（任意、未指定の場合は現在のユーザー）",
-                },
-            },
-            "required": ["name"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """プロジェクト作成を実行.
 
@@ -140,6 +134,25 @@ class AddTaskToProjectTool(BaseTool):
     既存のプロジェクトにタスクを追加する。
     """
 
+    name = "add_task_to_project"
+    description = "既存のプロジェクトにタスクを追加する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "project_id": {
+                "type": "string",
+                "description": "プロジェクトID（UUID）",
+            },
+            "task_id": {
+                "type": "string",
+                "description": "タスクID（UUID）",
+            },
+        },
+        "required": ["project_id", "task_id"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, add_task_to_project_use_case: AddTaskToProjectUseCase, user_id: str):
         """Initialize AddTaskToProjectTool.
 
@@ -150,31 +163,6 @@ class AddTaskToProjectTool(BaseTool):
         self._add_task_to_project_use_case = add_task_to_project_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "add_task_to_project"
-
-    @property
-    def description(self) -> str:
-        return "既存のプロジェクトにタスクを追加する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "プロジェクトID（UUID）",
-                },
-                "task_id": {
-                    "type": "string",
-                    "description": "タスクID（UUID）",
-                },
-            },
-            "required": ["project_id", "task_id"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク追加を実行.
 
@@ -223,6 +211,25 @@ class RemoveTaskFromProjectTool(BaseTool):
     プロジェクトからタスクを削除する。
     """
 
+    name = "remove_task_from_project"
+    description = "プロジェクトからタスクを削除する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "project_id": {
+                "type": "string",
+                "description": "プロジェクトID（UUID）",
+            },
+            "task_id": {
+                "type": "string",
+                "description": "タスクID（UUID）",
+            },
+        },
+        "required": ["project_id", "task_id"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, remove_task_from_project_use_case: RemoveTaskFromProjectUseCase, user_id: str):
         """Initialize RemoveTaskFromProjectTool.
 
@@ -233,31 +240,6 @@ class RemoveTaskFromProjectTool(BaseTool):
         self._remove_task_from_project_use_case = remove_task_from_project_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "remove_task_from_project"
-
-    @property
-    def description(self) -> str:
-        return "プロジェクトからタスクを削除する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "プロジェクトID（UUID）",
-                },
-                "task_id": {
-                    "type": "string",
-                    "description": "タスクID（UUID）",
-                },
-            },
-            "required": ["project_id", "task_id"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """タスク削除を実行.
 
@@ -306,6 +288,21 @@ class GetProjectProgressTool(BaseTool):
     プロジェクトの進捗状況を取得する。
     """
 
+    name = "get_project_progress"
+    description = "プロジェクトの進捗状況を取得する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "project_id": {
+                "type": "string",
+                "description": "プロジェクトID（UUID）",
+            },
+        },
+        "required": ["project_id"],
+    }
+
+    result_token_budget = 1000
+
     def __init__(self, get_project_progress_use_case: GetProjectProgressUseCase, user_id: str):
         """Initialize GetProjectProgressTool.
 
@@ -316,27 +313,6 @@ class GetProjectProgressTool(BaseTool):
         self._get_project_progress_use_case = get_project_progress_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "get_project_progress"
-
-    @property
-    def description(self) -> str:
-        return "プロジェクトの進捗状況を取得する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "プロジェクトID（UUID）",
-                },
-            },
-            "required": ["project_id"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """進捗取得を実行.
 
@@ -400,6 +376,25 @@ class ListProjectsTool(BaseTool):
     ユーザーのプロジェクト一覧を取得する。
     """
 
+    name = "list_projects"
+    description = "ユーザーのプロジェクト一覧を取得する"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "owner_user_id": {
+                "type": "string",
+                "description": "オーナーのSlack User ID（任意、未指定の場合は現在のユーザー）",
+            },
+            "status": {
+                "type": "string",
+                "enum": ["active", "completed", "archived"],
+                "description": "フィルタするステータス（任意）",
+            },
+        },
+    }
+
+    result_token_budget = 1000
+
     def __init__(self, list_projects_use_case: ListProjectsUseCase, user_id: str):
         """Initialize ListProjectsTool.
 
@@ -410,31 +405,6 @@ class ListProjectsTool(BaseTool):
         self._list_projects_use_case = list_projects_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "list_projects"
-
-    @property
-    def description(self) -> str:
-        return "ユーザーのプロジェクト一覧を取得する"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "owner_user_id": {
-                    "type": "string",
-                    "description": "オーナーのSlack User ID（任意、未指定の場合は現在のユーザー）",
-                },
-                "status": {
-                    "type": "string",
-                    "enum": ["active", "completed", "archived"],
-                    "description": "フィルタするステータス（任意）",
-                },
-            },
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """プロジェクト一覧を取得.
 
@@ -498,6 +468,21 @@ class ArchiveProjectTool(BaseTool):
     プロジェクトをアーカイブする。
     """
 
+    name = "archive_project"
+    description = "プロジェクトをアーカイブする"
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "project_id": {
+                "type": "string",
+                "description": "プロジェクトID（UUID）",
+            },
+        },
+        "required": ["project_id"],
+    }
+
+    result_token_budget = 300
+
     def __init__(self, archive_project_use_case: ArchiveProjectUseCase, user_id: str):
         """Initialize ArchiveProjectTool.
 
@@ -508,27 +493,6 @@ class ArchiveProjectTool(BaseTool):
         self._archive_project_use_case = archive_project_use_case
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "archive_project"
-
-    @property
-    def description(self) -> str:
-        return "プロジェクトをアーカイブする"
-
-    @property
-    def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_id": {
-                    "type": "string",
-                    "description": "プロジェクトID（UUID）",
-                },
-            },
-            "required": ["project_id"],
-        }
-
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """プロジェクトアーカイブを実行.
 
@@ -7,6 +7,7 @@ from sqlalchemy import and_, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.schema import ProjectTable, ProjectTaskTable
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.project import Project
 from ...domain.repositories.project_repository import ProjectRepository
@@ -26,33 +27,21 @@ class PostgreSQLProjectRepository(ProjectRepository):
 
     async def save(self, project: Project) -> Project:
         """Save a project"""
-        # Check if project exists
-        stmt = select(ProjectTable).where(ProjectTable.project_id == project.project_id)
-        result = await self._session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing project
-            existing.name = project.name
-            existing.description = project.description
-            existing.owner_user_id = project.owner_user_id
-            existing.deadline = project.deadline
-            existing.status = project.status.value
-            existing.updated_at = project.updated_at
-        else:
-            # Create new project
-            project_row = ProjectTable(
-                project_id=project.project_id,
-                name=project.name,
-                description=project.description,
-                owner_user_id=project.owner_user_id,
-                deadline=project.deadline,
-                status=project.status.value,
-                created_at=project.created_at,
-                updated_at=project.updated_at,
-            )
-            self._session.add(project_row)
-
+        await upsert(
+            self._session,
+            ProjectTable,
+            {
+                "project_id": project.project_id,
+                "name": project.name,
+                "description": project.description,
+                "owner_user_id": project.owner_user_id,
+                "deadline": project.deadline,
+                "status": project.status.value,
+                "created_at": project.created_at,
+                "updated_at": project.updated_at,
+            },
+            insert_only=["created_at"],
+        )
         await self._session.commit()
         return project
 
@@ -6,6 +6,7 @@ from sqlalchemy import and_, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.schema import TaskDependencyTable
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.task_dependency import TaskDependency
 from ...domain.repositories.dependency_repository import DependencyRepository
@@ -25,27 +26,18 @@ class PostgreSQLDependencyRepository(DependencyRepository):
 
     async def save(self, dependency: TaskDependency) -> TaskDependency:
         """Save a task dependency"""
-        # Check if dependency exists
-        stmt = select(TaskDependencyTable).where(TaskDependencyTable.id == dependency.id)
-        result = await self._session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing (unlikely for immutable dependencies, but included for completeness)
-            existing.blocking_task_id = dependency.blocking_task_id
-            existing.blocked_task_id = dependency.blocked_task_id
-            existing.dependency_type = dependency.dependency_type.value
-        else:
-            # Create new dependency
-            dependency_row = TaskDependencyTable(
-                id=dependency.id,
-                blocking_task_id=dependency.blocking_task_id,
-                blocked_task_id=dependency.blocked_task_id,
-                dependency_type=dependency.dependency_type.value,
-                created_at=dependency.created_at,
-            )
-            self._session.add(dependency_row)
-
+        await upsert(
+            self._session,
+            TaskDependencyTable,
+            {
+                "id": dependency.id,
+                "blocking_task_id": dependency.blocking_task_id,
+                "blocked_task_id": dependency.blocked_task_id,
+                "dependency_type": dependency.dependency_type.value,
+                "created_at": dependency.created_at,
+            },
+            insert_only=["created_at"],
+        )
         await self._session.commit()
         return dependency
 
@@ -6,6 +6,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.schema import DailySummaryTable
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.daily_summary import DailySummary
 from ...domain.repositories.daily_summary_repository import DailySummaryRepository
@@ -19,30 +20,20 @@ class PostgreSQLDailySummaryRepository(DailySummaryRepository):
 
     async def save(self, daily_summary: DailySummary) -> None:
         """Save or update a daily summary"""
-        # Check if summary already exists
-        existing = await self._session.get(DailySummaryTable, daily_summary.id)
-
-        if existing:
-            # Update existing
-            existing.date = daily_summary.date
-            existing.user_id = daily_summary.user_id
-            existing.tasks_completed = daily_summary.tasks_completed
-            existing.tasks_pending = daily_summary.tasks_pending
-            existing.summary_text = daily_summary.summary_text
-        else:
-            # Insert new
-            table_obj = DailySummaryTable(
-                id=daily_summary.id,
-                date=daily_summary.date,
-                user_id=daily_summary.user_id,
-                tasks_completed=daily_summary.tasks_completed,
-                tasks_pending=daily_summary.tasks_pending,
-                summary_text=daily_summary.summary_text,
-                created_at=daily_summary.created_at,
-            )
-            self._session.add(table_obj)
-
-        await self._session.flush()
+        await upsert(
+            self._session,
+            DailySummaryTable,
+            {
+                "id": daily_summary.id,
+                "date": daily_summary.date,
+                "user_id": daily_summary.user_id,
+                "tasks_completed": daily_summary.tasks_completed,
+                "tasks_pending": daily_summary.tasks_pending,
+                "summary_text": daily_summary.summary_text,
+                "created_at": daily_summary.created_at,
+            },
+            insert_only=["created_at"],
+        )
 
     async def find_by_date_and_user(self, summary_date: date, user_id: str | None) -> DailySummary | None:
         """Find daily summary by date and user"""
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.schema import EmployeeTable
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.employee import Employee
 from ...domain.repositories.employee_repository import EmployeeRepository
@@ -44,25 +45,19 @@ class PostgreSQLEmployeeRepository(EmployeeRepository):
 
     async def save(self, employee: Employee) -> None:
         """Save employee"""
-        existing = await self._session.get(EmployeeTable, employee.employee_id)
-
-        if existing:
-            # Update
-            existing.name = employee.name
-            existing.is_active = employee.is_active
-            existing.updated_at = datetime.now()
-        else:
-            # Insert
-            new_employee = EmployeeTable(
-                employee_id=employee.employee_id,
-                name=employee.name,
-                is_active=employee.is_active,
-                created_at=employee.created_at,
-                updated_at=employee.updated_at,
-            )
-            self._session.add(new_employee)
-
-        await self._session.flush()
+        await upsert(
+            self._session,
+            EmployeeTable,
+            {
+                "employee_id": employee.employee_id,
+                "name": employee.name,
+                "is_active": employee.is_active,
+                "created_at": employee.created_at,
+                "updated_at": employee.updated_at,
+            },
+            insert_only=["created_at"],
+            update_set=lambda excluded: {"updated_at": datetime.now()},
+        )
 
     async def delete(self, employee_id: UUID) -> None:
         """Delete employee"""
@@ -11,6 +11,7 @@ from src.infrastructure.database.schema import (
     EmployeeSkillTable,
     EmployeeTable,
 )
+from src.infrastructure.database.upsert import upsert
 
 from ...domain.entities.business_skill import BusinessSkill
 from ...domain.entities.employee import Employee
@@ -52,29 +53,21 @@ class PostgreSQLSkillRepository(SkillRepository):
 
     async def save_skill(self, skill: BusinessSkill) -> None:
         """Save business skill"""
-        existing = await self._session.get(BusinessSkillTable, skill.skill_id)
-
-        if existing:
-            # Update
-            existing.skill_name = skill.skill_name
-            existing.category = skill.category
-            existing.display_order = skill.display_order
-            existing.is_active = skill.is_active
-            existing.updated_at = datetime.now()
-        else:
-            # Insert
-            new_skill = BusinessSkillTable(
-                skill_id=skill.skill_id,
-                skill_name=skill.skill_name,
-                category=skill.category,
-                display_order=skill.display_order,
-                is_active=skill.is_active,
-                created_at=skill.created_at,
-                updated_at=skill.updated_at,
-            )
-            self._session.add(new_skill)
-
-        await self._session.flush()
+        await upsert(
+            self._session,
+            BusinessSkillTable,
+            {
+                "skill_id": skill.skill_id,
+                "skill_name": skill.skill_name,
+                "category": skill.category,
+                "display_order": skill.display_order,
+                "is_active": skill.is_active,
+                "created_at": skill.created_at,
+                "updated_at": skill.updated_at,
+            },
+            insert_only=["created_at"],
+            update_set=lambda excluded: {"updated_at": datetime.now()},
+        )
 
     async def find_employees_with_skill(self, skill_name: str) -> list[Employee]:
         """Find all employees who have a specific skill"""
@@ -9,8 +9,8 @@ class SlackUserRepository(ABC):
     """Repository interface for SlackUser persistence"""
 
     @abstractmethod
-    async def save_all(self, users: list[SlackUser]) -> None:
-        """Save or update multiple users (upsert)"""
+    async def save_all(self, users: list[SlackUser]) -> int:
+        """Save or update multiple users (upsert), returning the number of changed rows"""
         pass
 
     @abstractmethod
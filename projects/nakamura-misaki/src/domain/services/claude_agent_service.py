@@ -4,22 +4,34 @@ This service acts as the orchestrator for Claude Tool Use API integration,
 managing conversation flow and tool execution.
 """
 
+import asyncio
+import contextlib
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
-from anthropic import AsyncAnthropic
 from anthropic.types import Message as AnthropicMessage
 
 from ...adapters.primary.tools.base_tool import BaseTool
+from ...adapters.primary.tools.registry import BoundTools
+from ...adapters.primary.tools.result_encoder import encode_tool_result
 from ...contexts.personal_tasks.domain.models.conversation import Conversation, Message
 from ...infrastructure.metrics import get_metrics
+from .conversation_window import ConversationWindow, HistoryWindow
+from .messages_client import MessagesClient
+from .model_router import ModelRouter, RoutingDecision, record_model_usage
 
 logger = logging.getLogger(__name__)
 metrics = get_metrics()
 
-SYSTEM_PROMPT_TEMPLATE = """
+# Receives streamed text deltas (streaming mode)
+TextCallback = Callable[[str], Awaitable[None]]
+
+# Static system prompt. Must stay byte-stable: together with the tool
+# definitions it forms the cached prompt prefix (see _build_system_prompt).
+SYSTEM_PROMPT = """
 あなたは中村美咲というタスク管理AIアシスタントです。草薙素子のような冷静で効率的な性格で、ユーザーのタスク管理をサポートします。
 
 # あなたの役割
@@ -34,7 +46,7 @@ SYSTEM_PROMPT_TEMPLATE = """
 2. **タスク確認**: 「今日のタスク」「タスク一覧」等でlist_tasksを呼び出し
 3. **タスク完了**: 「〜終わった」「〜完了」等でcomplete_taskを呼び出し
 4. **タスク更新**: タスクの内容変更やタスクを他のユーザーに引き継ぐ場合はupdate_taskを呼び出し
-5. **曖昧な識別子**: ユーザーがタスクを「あのレポート」等と表現した場合、list_tasksで候補を確認してから操作
+5. **曖昧な識別子**: ユーザーがタスクを「あのレポート」等と表現した場合、「ユーザーの未完了タスク」が提示されていればそこから特定する。提示がない・見つからない場合のみlist_tasksで候補を確認してから操作
 6. **日時解釈**: 「明日」「来週」「3日後」等を適切にISO 8601形式に変換
 7. **雑談対応**: タスク関連でない雑談にも自然に応答（Toolは呼ばない）
 
@@ -43,51 +55,96 @@ SYSTEM_PROMPT_TEMPLATE = """
 - 簡潔（1-2文）
 - 草薙素子風の口調（「了解した」「把握した」「確認する」等）
 - タスク操作結果を明確に伝える
+"""
 
-# 現在時刻
+# Volatile context, sent after the cache breakpoint
+CURRENT_TIME_TEMPLATE = """# 現在時刻
 
 {current_time}
 """
 
+# Rolling summary of messages outside the history window (also after the breakpoint)
+CONVERSATION_SUMMARY_TEMPLATE = """# これまでの会話の要約
+
+{summary}
+"""
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Reply when the agent loop runs out of iterations/tokens while Claude still wants tools
+LOOP_EXHAUSTED_MESSAGE = "処理が長くなったため途中で打ち切った。もう少し具体的に指示してくれ。"
+
+# Streaming mode: inserted between the text of successive agent-loop rounds
+ROUND_SEPARATOR = "\n"
+
 
 class ClaudeAgentService:
     """Claude Agent Service for managing conversation with Tool Use."""
 
     def __init__(
         self,
-        anthropic_client: AsyncAnthropic,
-        tools: list[BaseTool],
+        anthropic_client: MessagesClient,
+        tools: list[BaseTool] | BoundTools,
         model: str = "claude-3-5-sonnet-20241022",
         max_tokens: int = 4096,
+        max_iterations: int = 5,
+        token_budget: int = 60_000,
+        tool_timeout_seconds: float = 20.0,
+        history_window: ConversationWindow | None = None,
+        model_router: ModelRouter | None = None,
     ):
         """Initialize ClaudeAgentService.
 
         Args:
-            anthropic_client: Anthropic async client
-            tools: List of available tools
-            model: Claude model to use
+            anthropic_client: Messages API client (AsyncAnthropic or ResilientAnthropicClient)
+            tools: Available tools (BoundTools from the tool registry, or instances)
+            model: Claude model to use (when no router is given)
             max_tokens: Maximum tokens for response
+            max_iterations: Maximum Claude API calls per user message
+            token_budget: Input + output tokens per user message before the loop stops
+            tool_timeout_seconds: Timeout of a single tool execution
+            history_window: Token-budgeted history selection (None = send full history)
+            model_router: Chooses fast/default model per turn (None = always ``model``)
         """
         self._client = anthropic_client
-        self._tools = tools
-        self._tool_map = {tool.name: tool for tool in tools}
+        self._tools = tools if isinstance(tools, BoundTools) else BoundTools.from_tools(tools)
+        # Identical on every call so the prompt cache prefix matches
+        self._tool_definitions = self._tools.definitions
         self.model = model
         self._max_tokens = max_tokens
+        self._max_iterations = max_iterations
+        self._token_budget = token_budget
+        self._tool_timeout = tool_timeout_seconds
+        self._history_window = history_window
+        self._model_router = model_router
+        self._session_lock = asyncio.Lock()
 
     async def process_message(
-        self, conversation: Conversation, user_message: str
+        self,
+        conversation: Conversation,
+        user_message: str,
+        on_text: TextCallback | None = None,
+        task_snapshot: str | None = None,
+        model: str | None = None,
     ) -> str:
         """Process user message and return assistant response.
 
-        This method:
+        This method runs a bounded agent loop:
         1. Adds user message to conversation
         2. Calls Claude API with conversation history and tools
-        3. Handles tool use if requested by Claude
+        3. While Claude requests tools, executes them (concurrently) and calls
+           Claude again with the results, up to ``max_iterations`` calls or
+           ``token_budget`` tokens
         4. Returns final text response
 
         Args:
             conversation: Conversation entity (will be mutated)
             user_message: User's message text
+            on_text: Streaming mode: called with each text delta as it is
+                generated (uses the streaming Messages API); the text of
+                successive agent-loop rounds is separated by ROUND_SEPARATOR
+            task_snapshot: Prefetched open tasks of the user (see TaskSnapshotBuilder)
+            model: Model for this request (overrides routing)
 
         Returns:
             str: Assistant's response text
@@ -95,146 +152,233 @@ class ClaudeAgentService:
         # Add user message to conversation
         conversation.add_message(Message.user(content=user_message))
 
-        # Build messages for Claude API
-        messages = self._build_messages(conversation)
+        # Build messages for Claude API (recent messages + rolling summary)
+        history = self._build_history(conversation)
+        messages = history.messages
+        system = self._build_system_prompt(history.summary, task_snapshot)
+        routing = self._route(user_message, model)
+
+        tokens_used = 0
+        stream_text = on_text
+        for iteration in range(1, self._max_iterations + 1):
+            # Call Claude API
+            response = await self._create_message(messages, stream_text, system, routing.model)
+            tokens_used += response.usage.input_tokens + response.usage.output_tokens
+
+            if response.stop_reason != "tool_use":
+                break
+
+            if iteration == self._max_iterations or tokens_used >= self._token_budget:
+                # Claude still wants tools but the loop budget is spent
+                logger.warning(
+                    "Agent loop budget exhausted",
+                    extra={"iterations": iteration, "tokens_used": tokens_used},
+                )
+                metrics.increment("claude_agent_loop_truncated")
+                response_text = self._extract_text_from_response(response) or LOOP_EXHAUSTED_MESSAGE
+                conversation.add_message(Message.assistant(content=response_text))
+                return response_text
+
+            # Execute requested tools and feed the results back
+            tool_results = await self._execute_tools(response)
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
+            routing = self._escalate_if_needed(routing, tool_results)
+            if on_text is not None and self._extract_text_from_response(response):
+                # The caller receives one stream per turn: start the next round's text on a new line
+                stream_text = _separated(on_text, ROUND_SEPARATOR)
 
-        # Build tool definitions
-        tool_definitions = [tool.to_tool_definition() for tool in self._tools]
+        # Extract text response
+        response_text = self._extract_text_from_response(response)
 
-        # Build system prompt
-        system_prompt = self._build_system_prompt()
+        # Add assistant response to conversation (skip if empty after tool use)
+        if response_text or iteration == 1:
+            conversation.add_message(Message.assistant(content=response_text))
 
-        # Call Claude API
-        start_time = time.time()
-        response = await self._client.messages.create(
-            model=self.model,
-            max_tokens=self._max_tokens,
-            system=system_prompt,
-            messages=messages,
-            tools=tool_definitions,
-        )
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        return response_text
 
-        # Log Claude API call
-        logger.info(
-            "Claude API call completed",
-            extra={
-                "model": self.model,
-                "stop_reason": response.stop_reason,
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-                "response_time_ms": elapsed_ms,
-                "tool_count": len(tool_definitions),
-            },
-        )
+    def _route(self, user_message: str, model: str | None) -> RoutingDecision:
+        """Choose the model for this turn.
 
-        # Record metrics
-        metrics.increment("claude_api_calls")
-        metrics.increment("claude_input_tokens", response.usage.input_tokens)
-        metrics.increment("claude_output_tokens", response.usage.output_tokens)
-        metrics.record_time("claude_api_response_time", elapsed_ms)
+        Args:
+            user_message: User's message text
+            model: Explicit model for this request
 
-        # Handle tool use if present
-        if response.stop_reason == "tool_use":
-            return await self._handle_tool_use(conversation, response)
+        Returns:
+            RoutingDecision
+        """
+        if self._model_router is None:
+            return RoutingDecision(model or self.model, "override" if model else "default")
+        return self._model_router.route(user_message, model)
 
-        # Extract text response
-        response_text = self._extract_text_from_response(response)
+    def _escalate_if_needed(
+        self, routing: RoutingDecision, tool_results: list[dict[str, Any]]
+    ) -> RoutingDecision:
+        """Move a fast-model turn to the default model after a failed or multi-tool step.
 
-        # Add assistant response to conversation
-        conversation.add_message(Message.assistant(content=response_text))
+        Args:
+            routing: Current routing decision
+            tool_results: tool_result blocks of the step just executed
 
-        return response_text
+        Returns:
+            RoutingDecision for the next call
+        """
+        if self._model_router is None:
+            return routing
+        if any(result.get("is_error") for result in tool_results):
+            return self._model_router.escalate(routing, "tool_error")
+        if len(tool_results) > 1:
+            return self._model_router.escalate(routing, "multi_tool")
+        return routing
 
-    async def _handle_tool_use(
-        self, conversation: Conversation, response: AnthropicMessage
-    ) -> str:
-        """Handle tool use from Claude response.
+    async def _execute_tools(self, response: AnthropicMessage) -> list[dict[str, Any]]:
+        """Execute all tool_use blocks of a response concurrently.
+
+        Tools that share the message's DB session are serialized by
+        ``_session_lock``; the others run in parallel. Cancelling the caller
+        cancels every running tool.
 
         Args:
-            conversation: Current conversation
             response: Claude response with tool_use
 
         Returns:
-            str: Final assistant response after tool execution
+            list: tool_result blocks in tool_use order
         """
-        # Extract tool use blocks
         tool_use_blocks = [
             block for block in response.content if block.type == "tool_use"
         ]
+        return list(await asyncio.gather(*(self._execute_tool(block) for block in tool_use_blocks)))
+
+    async def _execute_tool(self, tool_use: Any) -> dict[str, Any]:
+        """Execute one tool_use block with a timeout.
+
+        Args:
+            tool_use: tool_use content block
 
-        # Execute tools and collect results
-        tool_results = []
-        for tool_use in tool_use_blocks:
-            tool_name = tool_use.name
-            tool_input = tool_use.input
-            tool_id = tool_use.id
-
-            # Execute tool
-            tool_start = time.time()
-            tool = self._tool_map.get(tool_name)
-            if tool:
-                result = await tool.execute(**tool_input)
-                success = True
-            else:
-                result = {"success": False, "error": f"Unknown tool: {tool_name}"}
-                success = False
-            tool_elapsed_ms = int((time.time() - tool_start) * 1000)
-
-            # Log tool execution
-            logger.info(
-                f"Tool executed: {tool_name}",
-                extra={
-                    "tool_name": tool_name,
-                    "tool_id": tool_id,
-                    "success": success,
-                    "execution_time_ms": tool_elapsed_ms,
-                },
-            )
-
-            # Record metrics
-            metrics.increment(f"tool_executions.{tool_name}")
-            metrics.record_time(f"tool_execution_time.{tool_name}", tool_elapsed_ms)
-            if not success:
-                metrics.record_error(f"tool_error.{tool_name}")
-
-            tool_results.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": tool_id,
-                    "content": str(result),
-                }
-            )
-
-        # Build messages with tool results
-        messages = self._build_messages(conversation)
-
-        # Add assistant's tool use response
-        messages.append({"role": "assistant", "content": response.content})
-
-        # Add tool results
-        messages.append({"role": "user", "content": tool_results})
-
-        # Call Claude again with tool results
-        system_prompt = self._build_system_prompt()
-        tool_definitions = [tool.to_tool_definition() for tool in self._tools]
-
-        final_response = await self._client.messages.create(
-            model=self.model,
-            max_tokens=self._max_tokens,
-            system=system_prompt,
-            messages=messages,
-            tools=tool_definitions,
+        Returns:
+            dict: tool_result block (``is_error`` set on failure)
+        """
+        tool_name = tool_use.name
+        tool_start = time.time()
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            result: dict[str, Any] = {"success": False, "error": f"Unknown tool: {tool_name}"}
+        else:
+            lock = self._session_lock if tool.uses_shared_session else contextlib.nullcontext()
+            try:
+                async with lock:
+                    result = await asyncio.wait_for(tool.execute(**tool_use.input), timeout=self._tool_timeout)
+            except TimeoutError:
+                result = {"success": False, "error": f"Tool timed out after {self._tool_timeout:.0f}s"}
+                metrics.increment(f"tool_timeouts.{tool_name}")
+            except Exception as e:
+                logger.error(f"Tool {tool_name} raised: {e}", exc_info=True)
+                result = {"success": False, "error": str(e)}
+        success = result.get("success", True) is not False
+        tool_elapsed_ms = int((time.time() - tool_start) * 1000)
+
+        # Log tool execution
+        logger.info(
+            f"Tool executed: {tool_name}",
+            extra={
+                "tool_name": tool_name,
+                "tool_id": tool_use.id,
+                "success": success,
+                "execution_time_ms": tool_elapsed_ms,
+            },
         )
 
-        # Extract final text response
-        response_text = self._extract_text_from_response(final_response)
+        # Record metrics
+        metrics.increment(f"tool_executions.{tool_name}")
+        metrics.record_time(f"tool_execution_time.{tool_name}", tool_elapsed_ms)
+        if not success:
+            metrics.record_error(f"tool_error.{tool_name}")
+
+        # Compact JSON capped at the tool's token budget
+        budget = tool.result_token_budget if tool is not None else BaseTool.result_token_budget
+        content, truncated = encode_tool_result(result, budget)
+        if truncated:
+            metrics.increment(f"tool_result_truncated.{tool_name}")
+
+        tool_result: dict[str, Any] = {
+            "type": "tool_result",
+            "tool_use_id": tool_use.id,
+            "content": content,
+        }
+        if not success:
+            tool_result["is_error"] = True
+        return tool_result
+
+    async def _create_message(
+        self,
+        messages: list[dict[str, Any]],
+        on_text: TextCallback | None = None,
+        system: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+    ) -> AnthropicMessage:
+        """Call the Messages API and record usage metrics.
 
-        # Add assistant response to conversation (skip if empty)
-        if response_text:
-            conversation.add_message(Message.assistant(content=response_text))
+        Args:
+            messages: Messages in Claude API format
+            on_text: If given, stream the response and pass each text delta
+            system: System prompt blocks (default: _build_system_prompt())
+            model: Claude model (default: ``self.model``)
 
-        return response_text
+        Returns:
+            AnthropicMessage: Claude API response (final message when streaming)
+        """
+        model = model or self.model
+        request = {
+            "model": model,
+            "max_tokens": self._max_tokens,
+            "system": system or self._build_system_prompt(),
+            "messages": messages,
+            "tools": self._tool_definitions,
+        }
+        start_time = time.time()
+        if on_text is None:
+            response: AnthropicMessage = await self._client.messages.create(**request)
+        else:
+            async with self._client.messages.stream(**request) as stream:
+                first_token = True
+                async for text in stream.text_stream:
+                    if first_token:
+                        first_token = False
+                        metrics.record_time("claude_api_time_to_first_token", (time.time() - start_time) * 1000)
+                    await on_text(text)
+                response = await stream.get_final_message()
+        elapsed_ms = int((time.time() - start_time) * 1000)
+
+        usage = response.usage
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_creation_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+
+        # Log Claude API call
+        logger.info(
+            "Claude API call completed",
+            extra={
+                "model": model,
+                "stop_reason": response.stop_reason,
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cache_read_input_tokens": cache_read_tokens,
+                "cache_creation_input_tokens": cache_creation_tokens,
+                "response_time_ms": elapsed_ms,
+                "tool_count": len(self._tool_definitions),
+            },
+        )
+
+        # Record metrics (input_tokens excludes cached tokens)
+        metrics.increment("claude_api_calls")
+        metrics.increment("claude_input_tokens", usage.input_tokens)
+        metrics.increment("claude_output_tokens", usage.output_tokens)
+        metrics.increment("claude_cache_read_input_tokens", cache_read_tokens)
+        metrics.increment("claude_cache_creation_input_tokens", cache_creation_tokens)
+        metrics.increment("claude_prompt_cache_hits" if cache_read_tokens else "claude_prompt_cache_misses")
+        metrics.record_time("claude_api_response_time", elapsed_ms)
+        record_model_usage(model, usage, elapsed_ms)
+
+        return response
 
     def _build_messages(self, conversation: Conversation) -> list[dict[str, Any]]:
         """Build messages array for Claude API from conversation history.
@@ -245,19 +389,54 @@ class ClaudeAgentService:
         Returns:
             list: Messages in Claude API format
         """
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in conversation.messages
-        ]
+        return self._build_history(conversation).messages
+
+    def _build_history(self, conversation: Conversation) -> HistoryWindow:
+        """Select the history sent to Claude.
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt with current time.
+        Args:
+            conversation: Conversation entity
 
         Returns:
-            str: System prompt with current time injected
+            HistoryWindow: Full history, or the token-budgeted window
+        """
+        if self._history_window is None:
+            messages = [{"role": msg.role, "content": msg.content} for msg in conversation.messages]
+            return HistoryWindow(messages=messages, summary=None, start=0, estimated_tokens=0)
+
+        history = self._history_window.build(conversation)
+        if history.start > conversation.summarized_count:
+            # Dropped messages are not summarized yet (background refresh pending)
+            metrics.increment("conversation_history_unsummarized_gap")
+        metrics.increment("conversation_history_messages_dropped", history.start)
+        return history
+
+    def _build_system_prompt(
+        self, summary: str | None = None, task_snapshot: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Build system prompt blocks.
+
+        The static prompt carries the cache breakpoint, so tools + static
+        prompt are cached as one prefix. The current time, the conversation
+        summary and the task snapshot follow it and never invalidate the cache.
+
+        Args:
+            summary: Rolling summary of older messages
+            task_snapshot: Prefetched open tasks of the user
+
+        Returns:
+            list: System prompt text blocks
         """
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return SYSTEM_PROMPT_TEMPLATE.format(current_time=current_time)
+        blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": CACHE_CONTROL},
+            {"type": "text", "text": CURRENT_TIME_TEMPLATE.format(current_time=current_time)},
+        ]
+        if summary:
+            blocks.append({"type": "text", "text": CONVERSATION_SUMMARY_TEMPLATE.format(summary=summary)})
+        if task_snapshot:
+            blocks.append({"type": "text", "text": task_snapshot})
+        return blocks
 
     def _extract_text_from_response(self, response: AnthropicMessage) -> str:
         """Extract text content from Claude response.
@@ -272,3 +451,17 @@ class ClaudeAgentService:
             block.text for block in response.content if block.type == "text"
         ]
         return " ".join(text_blocks) if text_blocks else ""
+
+
+def _separated(on_text: TextCallback, separator: str) -> TextCallback:
+    """Text callback that prefixes its first delta with ``separator``"""
+    pending = True
+
+    async def callback(delta: str) -> None:
+        nonlocal pending
+        if pending:
+            pending = False
+            delta = separator + delta
+        await on_text(delta)
+
+    return callback
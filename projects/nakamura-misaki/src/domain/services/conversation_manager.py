@@ -79,7 +79,7 @@ class ConversationManager:
             raise ValueError(f"No conversation found for user_id={user_id}, channel_id={channel_id}")
 
         conversation.add_message(Message(role=MessageRole.USER, content=message, timestamp=datetime.now()))
-        await self._repository.save(conversation)
+        await self.save(conversation)
 
     async def add_assistant_message(self, user_id: str, channel_id: str, message: str) -> None:
         """アシスタントメッセージを追加.
@@ -95,7 +95,7 @@ class ConversationManager:
             raise ValueError(f"No conversation found for user_id={user_id}, channel_id={channel_id}")
 
         conversation.add_message(Message(role=MessageRole.ASSISTANT, content=message, timestamp=datetime.now()))
-        await self._repository.save(conversation)
+        await self.save(conversation)
 
     async def get_conversation_history(self, user_id: str, channel_id: str) -> list[dict[str, str]]:
         """会話履歴を取得（Claude API形式）.
@@ -116,11 +116,12 @@ class ConversationManager:
         return conversation.get_messages_for_api()
 
     async def save(self, conversation: Conversation) -> None:
-        """会話を保存.
+        """会話を保存（有効期限を延長）.
 
         Args:
             conversation: 保存する会話
         """
+        conversation.extend_expiry(self._ttl_hours)
         await self._repository.save(conversation)
 
     async def cleanup_expired(self) -> int:
@@ -0,0 +1,140 @@
+"""Background rolling summary of long conversations.
+
+Summaries are generated off the request path: the reply is sent first, then a
+background task folds the messages that fell out of the history window into
+the conversation's summary and stores it in its own unit of work.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+from uuid import UUID
+
+from ...contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from ...contexts.personal_tasks.domain.repositories.conversation_repository import ConversationRepository
+from ...infrastructure.metrics import get_metrics
+from .messages_client import MessagesClient
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+SUMMARY_PROMPT = """以下はタスク管理アシスタントとユーザーの会話です。
+既存の要約と新しいメッセージを統合し、以降の応答に必要な情報だけを残した要約を作成してください。
+
+- 登録・完了・更新したタスク、決定事項、未解決の依頼、ユーザーの意図を残す
+- 箇条書き、300トークン以内
+- 要約本文のみを出力する
+
+<previous_summary>
+{previous_summary}
+</previous_summary>
+
+<new_messages>
+{messages}
+</new_messages>
+"""
+
+
+class ConversationSummarizer:
+    """Refreshes conversation summaries in background tasks"""
+
+    def __init__(
+        self,
+        anthropic_client: MessagesClient,
+        repository: ConversationRepository,
+        unit_of_work: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+        model: str = "claude-3-5-haiku-20241022",
+        max_tokens: int = 500,
+        max_concurrent: int = 2,
+    ):
+        """Initialize summarizer
+
+        Args:
+            anthropic_client: Messages API client (AsyncAnthropic or ResilientAnthropicClient)
+            repository: Conversation repository the summary is saved with
+            unit_of_work: Opens the DB scope for saving (e.g. DatabaseManager.request_scope)
+            model: Model used for summaries (a small, fast one is enough)
+            max_tokens: Maximum summary tokens
+            max_concurrent: Summaries generated at the same time
+        """
+        self._client = anthropic_client
+        self._repository = repository
+        self._unit_of_work = unit_of_work or nullcontext
+        self._model = model
+        self._max_tokens = max_tokens
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pending: dict[UUID, asyncio.Task] = {}
+
+    def schedule(self, conversation: Conversation, summarized_count: int) -> bool:
+        """Summarize messages[:summarized_count] in the background
+
+        Args:
+            conversation: Conversation entity (its current state is snapshotted)
+            summarized_count: New number of leading messages the summary covers
+
+        Returns:
+            False if a refresh for this conversation is already running
+        """
+        if conversation.id in self._pending:
+            return False
+        messages = conversation.messages_between(conversation.summarized_count, summarized_count)
+        task = asyncio.create_task(
+            self._refresh(conversation.id, conversation.summary, messages, summarized_count)
+        )
+        self._pending[conversation.id] = task
+        task.add_done_callback(lambda _: self._pending.pop(conversation.id, None))
+        return True
+
+    async def summarize(self, previous_summary: str | None, messages: list[Message]) -> str:
+        """Fold messages into the previous summary
+
+        Args:
+            previous_summary: Current summary (None if there is none yet)
+            messages: Messages to add to the summary
+
+        Returns:
+            New summary text
+        """
+        formatted = "\n".join(f"<message role=\"{msg.role}\">\n{msg.content}\n</message>" for msg in messages)
+        prompt = SUMMARY_PROMPT.format(previous_summary=previous_summary or "(なし)", messages=formatted)
+        response = await self._client.messages.create(
+            model=self._model,
+            max_tokens=self._max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        metrics.increment("claude_summary_input_tokens", response.usage.input_tokens)
+        metrics.increment("claude_summary_output_tokens", response.usage.output_tokens)
+        return "".join(block.text for block in response.content if block.type == "text").strip()
+
+    async def close(self, timeout_seconds: float = 10.0) -> None:
+        """Wait for running refreshes (up to ``timeout_seconds``), then cancel the rest"""
+        tasks = list(self._pending.values())
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _refresh(
+        self,
+        conversation_id: UUID,
+        previous_summary: str | None,
+        messages: list[Message],
+        summarized_count: int,
+    ) -> None:
+        try:
+            async with self._semaphore:
+                summary = await self.summarize(previous_summary, messages)
+            if not summary:
+                metrics.increment("conversation_summary.failed")
+                return
+            async with self._unit_of_work():
+                saved = await self._repository.save_summary(conversation_id, summary, summarized_count)
+            metrics.increment("conversation_summary.refreshed" if saved else "conversation_summary.stale")
+            logger.info(f"Conversation {conversation_id} summarized up to message {summarized_count} (saved={saved})")
+        except Exception as e:
+            metrics.increment("conversation_summary.failed")
+            logger.warning(f"Conversation summary failed for {conversation_id}: {e}")
@@ -0,0 +1,107 @@
+"""Token-budgeted conversation history window.
+
+Claude receives the rolling summary plus only the most recent messages that
+fit the history token budget, so per-call input stays bounded however long a
+conversation grows during its TTL.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from ...contexts.personal_tasks.domain.models.conversation import Conversation
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (Japanese/English mix: 1 char ≈ 0.35 tokens)"""
+    return int(len(text) * 0.35) + 1
+
+
+@dataclass(frozen=True)
+class HistoryWindow:
+    """History sent to Claude for one request
+
+    Attributes:
+        messages: Recent messages in Claude API format (starts with a user turn)
+        summary: Rolling summary of older messages (None if nothing is summarized)
+        start: Position of the first verbatim message in the full history
+        estimated_tokens: Estimated tokens of messages + summary
+    """
+
+    messages: list[dict[str, Any]]
+    summary: str | None
+    start: int
+    estimated_tokens: int
+
+
+class ConversationWindow:
+    """Selects the verbatim tail of a conversation under a token budget"""
+
+    def __init__(
+        self,
+        max_history_tokens: int = 6000,
+        min_recent_messages: int = 2,
+        summary_batch_messages: int = 6,
+    ):
+        """Initialize window
+
+        Args:
+            max_history_tokens: Budget for summary + verbatim messages
+            min_recent_messages: Messages always kept verbatim, even over budget
+            summary_batch_messages: Refresh the summary once this many messages
+                have fallen out of the window unsummarized
+        """
+        self._max_tokens = max_history_tokens
+        self._min_recent = min_recent_messages
+        self._summary_batch = summary_batch_messages
+
+    def build(self, conversation: Conversation) -> HistoryWindow:
+        """Build the history window for the next Claude call
+
+        Messages that fell out of the window but are not summarized yet are
+        left out until the background summary catches up (see ``needs_summary``).
+
+        Args:
+            conversation: Conversation entity
+
+        Returns:
+            HistoryWindow
+        """
+        messages = conversation.messages
+        summary = conversation.summary
+        used = estimate_tokens(summary) if summary else 0
+
+        # Local indexes into the loaded tail
+        first_unsummarized = max(conversation.summarized_count - conversation.message_offset, 0)
+        start = len(messages)
+        while start > first_unsummarized:
+            cost = estimate_tokens(messages[start - 1].content)
+            if len(messages) - start >= self._min_recent and used + cost > self._max_tokens:
+                break
+            used += cost
+            start -= 1
+
+        # The Messages API requires the first message to be a user turn
+        while start < len(messages) - 1 and messages[start].role != "user":
+            used -= estimate_tokens(messages[start].content)
+            start += 1
+
+        return HistoryWindow(
+            messages=[msg.to_dict() for msg in messages[start:]],
+            summary=summary,
+            start=conversation.message_offset + start,
+            estimated_tokens=used,
+        )
+
+    def needs_summary(self, conversation: Conversation) -> int | None:
+        """Check whether the rolling summary should be refreshed
+
+        Args:
+            conversation: Conversation entity (after the assistant reply was added)
+
+        Returns:
+            New ``summarized_count`` to summarize up to, or None if not needed yet
+        """
+        start = self.build(conversation).start
+        if start - conversation.summarized_count >= self._summary_batch:
+            return start
+        return None
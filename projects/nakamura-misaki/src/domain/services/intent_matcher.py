@@ -0,0 +1,205 @@
+"""Rule-based intent matching for formulaic Japanese task commands.
+
+Recognizes the most common commands ("今日のタスク", "〜完了", "タスク追加: 〜")
+locally so they can be answered without a Claude call. Anything ambiguous is
+reported with low confidence and left to the LLM.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+LIST_TASKS = "list_tasks"
+COMPLETE_TASK = "complete_task"
+REGISTER_TASK = "register_task"
+
+# Default due time for date-only expressions ("明日まで" = end of that day)
+DUE_HOUR = 23
+DUE_MINUTE = 59
+
+WEEKDAYS = "月火水木金土日"
+
+_POLITE_SUFFIX = re.compile(r"(を)?(見せて|教えて|確認して|出して|表示して)?(ください|下さい|くれ|ほしい)?$")
+_TRAILING_PUNCTUATION = re.compile(r"[。．.!！?？〜~ー]+$")
+# "資料作成終わった？" asks about a task, it does not complete it
+_QUESTION = re.compile(r"[?？][。．.!！?？〜~ー\s]*$")
+
+_LIST_PATTERN = re.compile(
+    r"^(?P<scope>今日の|本日の|今の|自分の|私の|俺の)?(?P<status>未完了の|完了した|完了済みの|完了済み)?"
+    r"(タスク|todo)(一覧|リスト|確認|は|ある|何)*$"
+)
+_COMPLETE_PATTERN = re.compile(
+    r"^(?P<title>.+?)(?P<particle>を|が|は|、)?(完了|終わった|終わりました|終了|済み|done)(した|しました|です|だ|にして)?$"
+)
+# Case-insensitive so the title can be taken from the original (not lowercased) message
+_REGISTER_PATTERNS = (
+    re.compile(r"^(タスク|todo)(を)?(追加|登録)[:：、\s]*(?P<title>.+)$", re.IGNORECASE),
+    re.compile(r"^(?P<title>.+?)(を)?(タスク|todo)(に|として)?(追加|登録)(して|する)?$", re.IGNORECASE),
+)
+
+# Titles that only refer to something earlier in the conversation
+_DEICTIC_TITLES = frozenset({"それ", "あれ", "これ", "さっきの", "例の", "全部", "タスク", "todo", "あのタスク", "その件"})
+
+_RELATIVE_DATE = re.compile(
+    r"(?P<expr>今日|本日|明日|あした|明後日|あさって|(?P<days>\d+)日後|(?P<weeks>\d+)週間後"
+    r"|(?P<week>来週|今週)(の)?((?P<weekday>[月火水木金土日])曜(日)?)?"
+    r"|(?P<bare_weekday>[月火水木金土日])曜(日)?)"
+    r"(まで(に)?|中(に)?|に|の)?"
+)
+
+
+@dataclass(frozen=True)
+class Intent:
+    """A locally recognized command
+
+    Attributes:
+        name: Tool name (list_tasks / complete_task / register_task)
+        arguments: Tool arguments
+        confidence: 0.0 - 1.0; below the configured threshold the LLM handles the message
+        due_by: list_tasks only: keep tasks due by this time ("今日のタスク"; applied by the caller)
+    """
+
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+    confidence: float = 1.0
+    due_by: datetime | None = None
+
+
+def normalize(text: str) -> str:
+    """NFKC-normalize, lowercase and strip whitespace, polite suffixes and trailing punctuation"""
+    return _strip_affixes(unicodedata.normalize("NFKC", text).lower())
+
+
+def _strip_affixes(text: str) -> str:
+    """Strip whitespace, polite suffixes and trailing punctuation (case and width are kept)"""
+    text = _TRAILING_PUNCTUATION.sub("", text.strip())
+    text = _POLITE_SUFFIX.sub("", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def parse_relative_date(text: str, now: datetime) -> tuple[datetime | None, str]:
+    """Extract a relative date expression (明日 / 3日後 / 来週 / 金曜 ...)
+
+    Args:
+        text: Text possibly containing a date expression
+        now: Reference time
+
+    Returns:
+        (due datetime at DUE_HOUR:DUE_MINUTE or None, text without the expression)
+    """
+    match = _RELATIVE_DATE.search(text)
+    if not match:
+        return None, text
+
+    today = now.replace(hour=DUE_HOUR, minute=DUE_MINUTE, second=0, microsecond=0)
+    expr = match.group("expr")
+    if expr in ("今日", "本日"):
+        due = today
+    elif expr in ("明日", "あした"):
+        due = today + timedelta(days=1)
+    elif expr in ("明後日", "あさって"):
+        due = today + timedelta(days=2)
+    elif match.group("days"):
+        due = today + timedelta(days=int(match.group("days")))
+    elif match.group("weeks"):
+        due = today + timedelta(weeks=int(match.group("weeks")))
+    elif match.group("week"):
+        monday = today - timedelta(days=today.weekday())
+        if match.group("week") == "来週":
+            monday += timedelta(weeks=1)
+        weekday = match.group("weekday")
+        if weekday:
+            due = monday + timedelta(days=WEEKDAYS.index(weekday))
+        elif match.group("week") == "来週":
+            due = monday
+        else:
+            # 今週 = end of this week (Friday, or today if already past it)
+            due = max(today, monday + timedelta(days=4))
+    else:
+        # Bare weekday: its next occurrence (today counts)
+        days_ahead = (WEEKDAYS.index(match.group("bare_weekday")) - today.weekday()) % 7
+        due = today + timedelta(days=days_ahead)
+
+    remaining = (text[: match.start()] + text[match.end() :]).strip(" 、,")
+    return due, remaining
+
+
+class IntentMatcher:
+    """Matches normalized text against the fast-path command patterns"""
+
+    def __init__(self, max_length: int = 60):
+        """Initialize matcher
+
+        Args:
+            max_length: Longer messages are never matched (left to the LLM)
+        """
+        self._max_length = max_length
+
+    def match(self, text: str, now: datetime | None = None) -> Intent | None:
+        """Recognize a fast-path command
+
+        Args:
+            text: Raw message text
+            now: Reference time for relative dates (default: now)
+
+        Returns:
+            Intent (check ``confidence``), or None if no pattern applies
+        """
+        if "\n" in text.strip() or len(text) > self._max_length:
+            return None
+        normalized = normalize(text)
+        if not normalized:
+            return None
+        now = now or datetime.now()
+
+        listed = self._match_list(normalized, now)
+        if listed or _QUESTION.search(unicodedata.normalize("NFKC", text)):
+            # Questions only ever list; "〜終わった？" is not a command
+            return listed
+        return self._match_register(normalized, text, now) or self._match_complete(normalized)
+
+    def _match_list(self, text: str, now: datetime) -> Intent | None:
+        match = _LIST_PATTERN.match(text)
+        if not match:
+            return None
+        due_by = None
+        if match.group("scope") in ("今日の", "本日の"):
+            due_by = now.replace(hour=DUE_HOUR, minute=DUE_MINUTE, second=0, microsecond=0)
+        status = match.group("status")
+        if status and status.startswith("完了"):
+            return Intent(LIST_TASKS, {"status": "completed"}, due_by=due_by)
+        return Intent(LIST_TASKS, due_by=due_by)
+
+    def _match_register(self, text: str, original: str, now: datetime) -> Intent | None:
+        for pattern in _REGISTER_PATTERNS:
+            match = pattern.match(text)
+            if match:
+                break
+        else:
+            return None
+
+        # Match on the normalized text, but keep the user's spelling of the title
+        match = pattern.match(_strip_affixes(original)) or match
+        due, title = parse_relative_date(match.group("title"), now)
+        title = title.strip(" 「」『』\"'")
+        arguments: dict[str, Any] = {"title": title}
+        if due is not None:
+            arguments["due_date"] = due.isoformat()
+        # Very short or referential titles usually need the conversation context
+        confidence = 0.4 if len(title) < 2 or title in _DEICTIC_TITLES else 0.9
+        return Intent(REGISTER_TASK, arguments, confidence)
+
+    def _match_complete(self, text: str) -> Intent | None:
+        match = _COMPLETE_PATTERN.match(text)
+        if not match:
+            return None
+        title = match.group("title").strip(" 「」『』\"'")
+        if title in _DEICTIC_TITLES or len(title) < 2:
+            return Intent(COMPLETE_TASK, {"task_identifier": title}, 0.3)
+        if match.group("particle") == "が":
+            # "会議が終わった" reports an event rather than completing a task
+            return Intent(COMPLETE_TASK, {"task_identifier": title}, 0.5)
+        # The fast path additionally requires exactly one matching open task
+        return Intent(COMPLETE_TASK, {"task_identifier": title}, 0.9)
@@ -0,0 +1,24 @@
+"""Anthropic Messages API client interface
+
+Domain services depend on this protocol rather than ``AsyncAnthropic`` so the
+same code runs on the raw SDK client and on ``ResilientAnthropicClient``
+(which wraps it with a concurrency cap, retries and a circuit breaker).
+"""
+
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Protocol
+
+
+class MessagesAPI(Protocol):
+    """``client.messages``: create / stream with Messages API parameters"""
+
+    async def create(self, *args: Any, **kwargs: Any) -> Any: ...
+
+    def stream(self, *args: Any, **kwargs: Any) -> AbstractAsyncContextManager[Any]: ...
+
+
+class MessagesClient(Protocol):
+    """Client exposing the Messages API (``AsyncAnthropic``, ``ResilientAnthropicClient``)"""
+
+    @property
+    def messages(self) -> MessagesAPI: ...
@@ -0,0 +1,153 @@
+"""Adaptive model routing between a fast model and the default model.
+
+Short, self-contained turns (small talk, single commands) go to the fast
+model. Long, multi-part or referential requests go to the default model, and
+a turn started on the fast model escalates when it needs several tools at
+once or a tool call fails.
+
+Metrics:
+    model_routing.{reason}: Initial routing decisions
+    model_routing.escalated.{reason}: Mid-turn escalations
+    claude_api_calls.{model} / claude_api_response_time.{model}: Per-model calls and latency
+    claude_{input,output}_tokens.{model}, claude_cost_microusd.{model}: Per-model usage and cost
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from ...infrastructure.metrics import get_metrics
+
+metrics = get_metrics()
+
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+FAST_MODEL = "claude-3-5-haiku-20241022"
+
+# USD per million tokens: (input, output). Cache reads cost 0.1x input, cache writes 1.25x.
+MODEL_PRICING: dict[str, tuple[float, float]] = {
+    "claude-3-5-sonnet-20241022": (3.0, 15.0),
+    "claude-3-5-haiku-20241022": (0.8, 4.0),
+}
+
+# Requests that usually need planning or several tools
+COMPLEX_KEYWORDS = (
+    "プロジェクト",
+    "担当",
+    "割り当て",
+    "引き継",
+    "進捗",
+    "スキル",
+    "依存",
+    "まとめて",
+    "それぞれ",
+    "全部",
+    "すべて",
+    "比較",
+    "分析",
+    "提案",
+    "相談",
+    "なぜ",
+    "どうすれば",
+)
+
+# References that need the conversation context to resolve
+AMBIGUOUS_KEYWORDS = ("あれ", "それ", "これ", "さっき", "例の", "あの", "その件", "前の")
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Model chosen for (the rest of) a turn
+
+    Attributes:
+        model: Claude model name
+        reason: Why it was chosen (metric suffix)
+    """
+
+    model: str
+    reason: str
+
+
+class ModelRouter:
+    """Chooses the Claude model per turn"""
+
+    def __init__(
+        self,
+        default_model: str = DEFAULT_MODEL,
+        fast_model: str = FAST_MODEL,
+        max_fast_chars: int = 80,
+    ):
+        """Initialize router
+
+        Args:
+            default_model: Model for complex or ambiguous turns
+            fast_model: Smaller, faster model for simple turns
+            max_fast_chars: Longer messages go to the default model
+        """
+        self.default_model = default_model
+        self.fast_model = fast_model
+        self._max_fast_chars = max_fast_chars
+
+    def route(self, user_message: str, model: str | None = None) -> RoutingDecision:
+        """Choose the model for a new turn
+
+        Args:
+            user_message: User's message text
+            model: Explicit model for this request (skips routing)
+
+        Returns:
+            RoutingDecision
+        """
+        if model:
+            decision = RoutingDecision(model, "override")
+        elif len(user_message) > self._max_fast_chars or "\n" in user_message.strip():
+            decision = RoutingDecision(self.default_model, "long")
+        elif any(keyword in user_message for keyword in COMPLEX_KEYWORDS):
+            decision = RoutingDecision(self.default_model, "complex")
+        elif any(keyword in user_message for keyword in AMBIGUOUS_KEYWORDS):
+            decision = RoutingDecision(self.default_model, "ambiguous")
+        else:
+            decision = RoutingDecision(self.fast_model, "simple")
+        metrics.increment(f"model_routing.{decision.reason}")
+        return decision
+
+    def escalate(self, decision: RoutingDecision, reason: str) -> RoutingDecision:
+        """Move a fast-model turn to the default model
+
+        Args:
+            decision: Current decision
+            reason: "multi_tool" or "tool_error"
+
+        Returns:
+            The default-model decision (unchanged if not on the fast model)
+        """
+        if decision.model != self.fast_model:
+            return decision
+        metrics.increment(f"model_routing.escalated.{reason}")
+        return RoutingDecision(self.default_model, f"escalated_{reason}")
+
+
+def record_model_usage(model: str, usage: Any, elapsed_ms: float) -> None:
+    """Export per-model latency, tokens and estimated cost
+
+    Args:
+        model: Claude model name
+        usage: Response usage (input/output/cache token counts)
+        elapsed_ms: API call latency
+    """
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    metrics.increment(f"claude_api_calls.{model}")
+    metrics.increment(f"claude_input_tokens.{model}", usage.input_tokens)
+    metrics.increment(f"claude_output_tokens.{model}", usage.output_tokens)
+    metrics.record_time(f"claude_api_response_time.{model}", elapsed_ms)
+
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        return
+    input_price, output_price = pricing
+    cost_usd = (
+        usage.input_tokens * input_price
+        + cache_read * input_price * 0.1
+        + cache_write * input_price * 1.25
+        + usage.output_tokens * output_price
+    ) / 1_000_000
+    metrics.increment(f"claude_cost_microusd.{model}", round(cost_usd * 1_000_000))
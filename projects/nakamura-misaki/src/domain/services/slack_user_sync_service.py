@@ -3,7 +3,7 @@
 import logging
 from datetime import UTC, datetime
 
-from src.adapters.secondary.slack_adapter import SlackAdapter
+from src.adapters.secondary.slack_adapter import SlackAdapter, SlackAPIError
 from src.domain.repositories.slack_user_repository import SlackUserRepository
 from src.domain.slack_user import SlackUser
 
@@ -11,71 +11,81 @@ logger = logging.getLogger(__name__)
 
 
 class SlackUserSyncService:
-    """Service for synchronizing Slack user data to database cache"""
+    """Service for synchronizing Slack user data to database cache
 
-    def __init__(self, slack_adapter: SlackAdapter, slack_user_repository: SlackUserRepository):
+    ``users.list`` pages are streamed and upserted in fixed-size batches as
+    they arrive, so memory and statement size stay bounded for any workspace
+    size. Unchanged users are skipped by the repository (content hash).
+    """
+
+    def __init__(
+        self,
+        slack_adapter: SlackAdapter,
+        slack_user_repository: SlackUserRepository,
+        page_size: int = 200,
+        batch_size: int = 100,
+    ):
         """Initialize sync service
 
         Args:
             slack_adapter: SlackAdapter for calling Slack API
             slack_user_repository: Repository for persisting user data
+            page_size: Members requested per users.list page
+            batch_size: Users per upsert statement
         """
         self.slack_adapter = slack_adapter
         self.slack_user_repository = slack_user_repository
+        self.page_size = page_size
+        self.batch_size = batch_size
 
     async def sync_users(self) -> dict[str, int | str]:
         """Sync users from Slack API to database
 
         Returns:
             Dictionary with sync result statistics
+            (synced_count = rows inserted/updated, total_fetched = members seen)
         """
         logger.info("Starting Slack user sync")
 
-        # Fetch users from Slack API
+        now = datetime.now(UTC)
+        total_fetched = 0
+        synced_count = 0
+
         try:
-            response = await self.slack_adapter.users_list()
+            async for members in self.slack_adapter.iter_users(page_size=self.page_size):
+                total_fetched += len(members)
+                users = [user for user in (self._to_user(member, now) for member in members) if user]
+                for start in range(0, len(users), self.batch_size):
+                    synced_count += await self.slack_user_repository.save_all(users[start : start + self.batch_size])
+        except SlackAPIError as e:
+            logger.error(f"Slack API error: {e}")
+            return {"status": "error", "message": f"Slack API error: {e}", "synced_count": synced_count}
         except Exception as e:
-            logger.error(f"Failed to fetch users from Slack API: {e}", exc_info=True)
-            return {"status": "error", "message": str(e), "synced_count": 0}
-
-        if not response.get("ok"):
-            error = response.get("error", "unknown")
-            logger.error(f"Slack API error: {error}")
-            return {"status": "error", "message": f"Slack API error: {error}", "synced_count": 0}
-
-        members = response.get("members", [])
-        logger.info(f"Fetched {len(members)} users from Slack API")
-
-        # Convert to domain entities
-        now = datetime.now(UTC)
-        users = []
+            logger.error(f"Failed to sync users: {e}", exc_info=True)
+            return {"status": "error", "message": str(e), "synced_count": synced_count}
 
-        for member in members:
-            try:
-                user = SlackUser(
-                    user_id=member["id"],
-                    name=member.get("name", ""),
-                    real_name=member.get("real_name"),
-                    display_name=member.get("profile", {}).get("display_name") or member.get("name", ""),
-                    email=member.get("profile", {}).get("email"),
-                    is_admin=member.get("is_admin", False),
-                    is_bot=member.get("is_bot", False),
-                    deleted=member.get("deleted", False),
-                    slack_created_at=datetime.fromtimestamp(member.get("updated", 0), tz=UTC),
-                    synced_at=now,
-                    created_at=now,
-                    updated_at=now,
-                )
-                users.append(user)
-            except Exception as e:
-                logger.warning(f"Failed to convert user {member.get('id', 'unknown')}: {e}")
-                continue
+        logger.info(f"Successfully synced {synced_count} changed users ({total_fetched} fetched)")
+        return {"status": "success", "synced_count": synced_count, "total_fetched": total_fetched}
 
-        # Save to database
+    @staticmethod
+    def _to_user(member: dict, now: datetime) -> SlackUser | None:
+        """Convert a users.list member to a domain entity (None if malformed)"""
         try:
-            await self.slack_user_repository.save_all(users)
-            logger.info(f"Successfully synced {len(users)} users to database")
-            return {"status": "success", "synced_count": len(users), "total_fetched": len(members)}
+            profile = member.get("profile", {})
+            return SlackUser(
+                user_id=member["id"],
+                name=member.get("name", ""),
+                real_name=member.get("real_name"),
+                display_name=profile.get("display_name") or member.get("name", ""),
+                email=profile.get("email"),
+                is_admin=member.get("is_admin", False),
+                is_bot=member.get("is_bot", False),
+                deleted=member.get("deleted", False),
+                slack_created_at=datetime.fromtimestamp(member.get("updated", 0), tz=UTC),
+                synced_at=now,
+                created_at=now,
+                updated_at=now,
+            )
         except Exception as e:
-            logger.error(f"Failed to save users to database: {e}", exc_info=True)
-            return {"status": "error", "message": str(e), "synced_count": 0}
+            logger.warning(f"Failed to convert user {member.get('id', 'unknown')}: {e}")
+            return None
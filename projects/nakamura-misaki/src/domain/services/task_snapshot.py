@@ -0,0 +1,101 @@
+"""Compact snapshot of a user's open tasks for the system prompt.
+
+With the open tasks already in the prompt, Claude can resolve references like
+"あのレポート" directly instead of calling list_tasks first, which saves a
+tool round-trip and a second full-context API call.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+
+from ...contexts.personal_tasks.application.dto.task_dto import TaskDTO
+from ...contexts.personal_tasks.application.use_cases.query_user_tasks import QueryUserTasksUseCase
+from ...infrastructure.metrics import get_metrics
+from .conversation_window import estimate_tokens
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+SNAPSHOT_HEADER = """# ユーザーの未完了タスク（{count}件）
+
+id|タイトル|状態|期限"""
+
+STATUS_LABELS = {"pending": "未着手", "in_progress": "進行中"}
+
+
+class TaskSnapshotBuilder:
+    """Prefetches a user's open tasks and renders them as a token-capped table"""
+
+    def __init__(
+        self,
+        query_user_tasks_use_case: QueryUserTasksUseCase,
+        unit_of_work: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+        max_tokens: int = 600,
+    ):
+        """Initialize builder
+
+        Args:
+            query_user_tasks_use_case: QueryUserTasksUseCase instance
+            unit_of_work: Opens a separate DB scope so the prefetch can run
+                concurrently with conversation loading (None = current session)
+            max_tokens: Estimated token cap of the rendered table
+        """
+        self._query_user_tasks_use_case = query_user_tasks_use_case
+        self._unit_of_work = unit_of_work or nullcontext
+        self._max_tokens = max_tokens
+
+    @property
+    def concurrent(self) -> bool:
+        """True if build() uses its own DB session (safe to run alongside other queries)"""
+        return self._unit_of_work is not nullcontext
+
+    async def build(self, user_id: str) -> str | None:
+        """Fetch and render the user's open tasks
+
+        Args:
+            user_id: Slack user ID
+
+        Returns:
+            Rendered snapshot, or None on failure (the prompt then goes without it)
+        """
+        started = time.time()
+        try:
+            async with self._unit_of_work():
+                tasks = await self._query_user_tasks_use_case.execute(user_id=user_id)
+        except Exception as e:
+            metrics.increment("task_snapshot.failed")
+            logger.warning(f"Task snapshot prefetch failed: {e}")
+            return None
+        metrics.record_time("task_snapshot_prefetch_time", (time.time() - started) * 1000)
+        return self.render([task for task in tasks if task.status != "completed"])
+
+    def render(self, tasks: list[TaskDTO]) -> str:
+        """Render open tasks (earliest due first) within the token cap
+
+        Args:
+            tasks: Open tasks
+
+        Returns:
+            Snapshot text
+        """
+        tasks = sorted(tasks, key=lambda task: (task.due_at is None, task.due_at or task.created_at))
+        lines = [SNAPSHOT_HEADER.format(count=len(tasks))]
+        used = estimate_tokens(lines[0])
+        for shown, task in enumerate(tasks):
+            row = self._render_row(task)
+            cost = estimate_tokens(row)
+            if used + cost > self._max_tokens:
+                lines.append(f"…ほか{len(tasks) - shown}件（必要ならlist_tasksで確認）")
+                metrics.increment("task_snapshot.truncated")
+                break
+            lines.append(row)
+            used += cost
+        return "\n".join(lines)
+
+    def _render_row(self, task: TaskDTO) -> str:
+        title = task.title.replace("|", "/").replace("\n", " ")
+        due = task.due_at.strftime("%m/%d %H:%M") if task.due_at else "-"
+        return f"{task.id}|{title}|{STATUS_LABELS.get(task.status, task.status)}|{due}"
@@ -1,5 +1,6 @@
 """SlackUser Entity - Shared Kernel for caching Slack user data"""
 
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -20,3 +21,25 @@ class SlackUser:
     synced_at: datetime  # Last sync timestamp from Slack API
     created_at: datetime  # First cached timestamp in our DB
     updated_at: datetime  # Last updated timestamp in our DB
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of the Slack-sourced fields (excludes our own sync timestamps)
+
+        Used by the user sync to skip rows that did not change since the last sync.
+        """
+        content = "\x1f".join(
+            str(value)
+            for value in (
+                self.user_id,
+                self.name,
+                self.real_name,
+                self.display_name,
+                self.email,
+                self.is_admin,
+                self.is_bot,
+                self.deleted,
+                self.slack_created_at.isoformat(),
+            )
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
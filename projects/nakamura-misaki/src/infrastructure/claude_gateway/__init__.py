@@ -0,0 +1,6 @@
+"""Resilient Anthropic API access package"""
+
+from .circuit_breaker import CircuitBreaker
+from .resilient_client import ClaudeUnavailableError, ResilientAnthropicClient
+
+__all__ = ["CircuitBreaker", "ClaudeUnavailableError", "ResilientAnthropicClient"]
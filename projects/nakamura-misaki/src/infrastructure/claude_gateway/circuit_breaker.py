@@ -0,0 +1,79 @@
+"""Consecutive-failure circuit breaker"""
+
+import time
+from collections.abc import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures
+
+    While open, calls are rejected without reaching the provider. After
+    ``reset_timeout_seconds`` one trial call is let through (half-open): its
+    success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_seconds: Open period before a trial call is allowed
+            clock: Monotonic clock (for tests)
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._changed_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """closed / open / half_open"""
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until a trial call is allowed (0 if not open)"""
+        if self._state == CLOSED:
+            return 0.0
+        return max(self._changed_at + self._reset_timeout - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        """Return True if a call may go to the provider now"""
+        if self._state == CLOSED:
+            return True
+        # Open: wait out the reset timeout. Half-open: one trial at a time,
+        # re-armed if the trial never reported back (e.g. cancelled)
+        if self.retry_after > 0:
+            return False
+        self._state = HALF_OPEN
+        self._changed_at = self._clock()
+        return True
+
+    def record_success(self) -> None:
+        """The provider answered (any non-retryable outcome counts)"""
+        self._state = CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> bool:
+        """Record a retryable failure
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        self._failures += 1
+        if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self._failure_threshold):
+            self._state = OPEN
+            self._changed_at = self._clock()
+            return True
+        return False
@@ -0,0 +1,241 @@
+"""Resilient wrapper around the Anthropic client
+
+Every Claude call goes through ``ResilientAnthropicClient``:
+- A global in-flight semaphore caps concurrent calls; callers that cannot get
+  a slot within their deadline are shed instead of piling up
+- Overload / rate-limit / transport errors (408, 409, 429, 5xx incl. 529) are
+  retried with full-jitter exponential backoff, honoring Retry-After
+- Each call has a deadline budget covering queueing, attempts and backoff
+- A circuit breaker rejects calls immediately during provider brownouts
+
+Calls that cannot be served raise ``ClaudeUnavailableError`` so the caller can
+answer "busy, retrying" right away. The wrapper exposes the same
+``messages.create`` / ``messages.stream`` interface as ``AsyncAnthropic``;
+construct the underlying client with ``max_retries=0`` so retries are not doubled.
+
+Metrics:
+    claude_gateway.retries: Retried attempts
+    claude_gateway.shed.{circuit_open,queue_timeout,deadline,retries_exhausted}: Rejected calls
+    claude_gateway.circuit_opened: Circuit transitions to open
+    claude_gateway_queue_wait_time: Time spent waiting for an in-flight slot
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+import anthropic
+from anthropic import AsyncAnthropic
+
+from ..metrics import get_metrics
+from .circuit_breaker import CLOSED, CircuitBreaker
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+class ClaudeUnavailableError(Exception):
+    """Claude could not be reached within the call's budget (overload, open circuit)"""
+
+    def __init__(self, reason: str, retry_after: float | None = None):
+        super().__init__(f"Claude unavailable: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ResilientAnthropicClient:
+    """Concurrency-capped, retrying, circuit-breaking Anthropic client"""
+
+    def __init__(
+        self,
+        client: AsyncAnthropic,
+        max_concurrent: int = 8,
+        max_retries: int = 3,
+        base_backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 8.0,
+        deadline_seconds: float = 90.0,
+        breaker: CircuitBreaker | None = None,
+    ):
+        """Initialize client
+
+        Args:
+            client: Underlying AsyncAnthropic (with ``max_retries=0``)
+            max_concurrent: Maximum in-flight calls
+            max_retries: Retries per call after the first attempt
+            base_backoff_seconds: Base of the exponential backoff
+            max_backoff_seconds: Upper bound of one backoff delay
+            deadline_seconds: Default budget per call (queueing + attempts + backoff)
+            breaker: CircuitBreaker (default: 5 failures, 30s reset)
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._deadline_seconds = deadline_seconds
+        self._breaker = breaker or CircuitBreaker()
+        self.messages = _ResilientMessages(self)
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    async def close(self) -> None:
+        """Close the underlying client"""
+        await self._client.close()
+
+    async def create(self, deadline_seconds: float | None = None, **kwargs: Any) -> Any:
+        """messages.create with the resilience policy
+
+        Args:
+            deadline_seconds: Budget for this call (default: client default)
+            **kwargs: Messages API parameters
+
+        Returns:
+            Message
+
+        Raises:
+            ClaudeUnavailableError: Overloaded, circuit open or budget exhausted
+        """
+        deadline = time.monotonic() + (deadline_seconds or self._deadline_seconds)
+        async with self._slot(deadline):
+            return await self._with_retries(lambda: self._client.messages.create(**kwargs), deadline)
+
+    @contextlib.asynccontextmanager
+    async def stream(self, deadline_seconds: float | None = None, **kwargs: Any) -> AsyncIterator[Any]:
+        """messages.stream with the resilience policy
+
+        Opening the stream is retried; once events flow, a failure is not
+        retried (text may already have been delivered) but still feeds the
+        circuit breaker.
+
+        Args:
+            deadline_seconds: Budget for opening the stream (default: client default)
+            **kwargs: Messages API parameters
+
+        Yields:
+            MessageStream
+
+        Raises:
+            ClaudeUnavailableError: Overloaded, circuit open or budget exhausted
+        """
+        deadline = time.monotonic() + (deadline_seconds or self._deadline_seconds)
+        async with self._slot(deadline), contextlib.AsyncExitStack() as stack:
+            stream = await self._with_retries(
+                lambda: stack.enter_async_context(self._client.messages.stream(**kwargs)), deadline
+            )
+            try:
+                yield stream
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
+                self._record_failure()
+                raise ClaudeUnavailableError(f"stream interrupted ({type(e).__name__})") from e
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, deadline: float) -> AsyncIterator[None]:
+        """Admission control: circuit breaker, then an in-flight slot within the deadline"""
+        if not self._breaker.allow():
+            metrics.increment("claude_gateway.shed.circuit_open")
+            raise ClaudeUnavailableError("circuit open", retry_after=self._breaker.retry_after)
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=max(deadline - started, 0))
+        except TimeoutError:
+            metrics.increment("claude_gateway.shed.queue_timeout")
+            raise ClaudeUnavailableError("too many in-flight calls") from None
+        metrics.record_time("claude_gateway_queue_wait_time", (time.monotonic() - started) * 1000)
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    async def _with_retries(self, operation: Callable[[], Awaitable[T]], deadline: float) -> T:
+        """Run ``operation`` until it succeeds, fails permanently or the budget runs out"""
+        attempt = 0
+        while True:
+            try:
+                result = await asyncio.wait_for(operation(), timeout=max(deadline - time.monotonic(), 0))
+            except TimeoutError:
+                self._record_failure()
+                metrics.increment("claude_gateway.shed.deadline")
+                raise ClaudeUnavailableError("deadline exceeded") from None
+            except Exception as e:
+                if not _is_retryable(e):
+                    # The provider answered; the request itself is at fault
+                    self._breaker.record_success()
+                    raise
+                self._record_failure()
+                delay = self._backoff(attempt, _retry_after(e))
+                if attempt >= self._max_retries or self._breaker.state != CLOSED:
+                    metrics.increment("claude_gateway.shed.retries_exhausted")
+                    raise ClaudeUnavailableError(f"{type(e).__name__} after {attempt + 1} attempts") from e
+                if time.monotonic() + delay >= deadline:
+                    metrics.increment("claude_gateway.shed.deadline")
+                    raise ClaudeUnavailableError("deadline exceeded", retry_after=delay) from e
+                attempt += 1
+                metrics.increment("claude_gateway.retries")
+                logger.warning(f"Claude call failed ({type(e).__name__}), retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            else:
+                self._breaker.record_success()
+                return result
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """Full-jitter exponential backoff, at least Retry-After when the server sent one"""
+        jittered = random.uniform(0, min(self._base_backoff * (2**attempt), self._max_backoff))
+        if retry_after is not None:
+            return retry_after + jittered
+        return jittered
+
+    def _record_failure(self) -> None:
+        if self._breaker.record_failure():
+            metrics.increment("claude_gateway.circuit_opened")
+            logger.error(f"Claude circuit opened for {self._breaker.retry_after:.0f}s")
+
+
+class _ResilientMessages:
+    """``client.messages`` facade"""
+
+    def __init__(self, client: ResilientAnthropicClient):
+        self._client = client
+
+    async def create(self, **kwargs: Any) -> Any:
+        return await self._client.create(**kwargs)
+
+    def stream(self, **kwargs: Any) -> contextlib.AbstractAsyncContextManager[Any]:
+        return self._client.stream(**kwargs)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Overload, rate limit, server and transport errors"""
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Retry-After of an API error response, in seconds"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
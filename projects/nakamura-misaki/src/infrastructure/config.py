@@ -15,6 +15,41 @@ class AppConfig:
     database_url: str
     nakamura_user_id: str
     conversation_ttl_hours: int = 24
+    conversation_history_max_tokens: int = 6000  # 0 sends the full history
+    conversation_summary_batch_messages: int = 6
+    conversation_summary_model: str = "claude-3-5-haiku-20241022"
+    # In-process LRU of active conversations (0 disables). Not invalidated across processes:
+    # enable only when a single app process serves all conversations
+    conversation_cache_size: int = 0
+    conversation_write_behind_enabled: bool = False  # reply before the conversation is written (lost on crash)
+    conversation_write_behind_interval_ms: int = 5
+    conversation_cleanup_interval_minutes: int = 60
+    conversation_cleanup_batch_size: int = 500  # expired conversations deleted per transaction
+    intent_fast_path_enabled: bool = True  # answer formulaic commands without Claude
+    intent_fast_path_min_confidence: float = 0.8
+    task_snapshot_max_tokens: int = 600  # open tasks in the prompt; 0 disables
+    claude_default_model: str = "claude-3-5-sonnet-20241022"
+    claude_fast_model: str = "claude-3-5-haiku-20241022"
+    model_routing_enabled: bool = True  # simple turns go to claude_fast_model
+    claude_max_concurrent_calls: int = 8  # in-flight Anthropic calls across all workers
+    claude_max_retries: int = 3
+    claude_call_deadline_seconds: float = 90.0  # queueing + attempts + backoff per call
+    claude_circuit_failure_threshold: int = 5
+    claude_circuit_reset_seconds: float = 30.0
+    # API endpoints (point at local cassette servers to replay recorded traffic)
+    anthropic_base_url: str | None = None
+    slack_api_base_url: str = "https://slack.com/api/"
+    worker_concurrency: int = 4
+    job_visibility_timeout_seconds: int = 300
+    job_max_attempts: int = 5
+    max_concurrent_messages: int = 4
+    max_concurrent_messages_per_user: int = 2
+    message_coalesce_window_ms: int = 1500  # 0 disables burst coalescing
+    message_coalesce_max_wait_ms: int = 5000
+    slack_streaming_replies: bool = True  # placeholder + throttled chat.update while generating
+    slack_stream_update_interval_ms: int = 1000
+    event_dedup_backend: str = "postgres"  # "postgres" (shared across workers) or "memory"
+    event_dedup_ttl_seconds: int = 3600
     debug: bool = False
 
     @classmethod
@@ -28,6 +63,38 @@ class AppConfig:
             database_url=os.getenv("DATABASE_URL", ""),
             nakamura_user_id=os.getenv("NAKAMURA_USER_ID", ""),
             conversation_ttl_hours=int(os.getenv("CONVERSATION_TTL_HOURS", "24")),
+            conversation_history_max_tokens=int(os.getenv("CONVERSATION_HISTORY_MAX_TOKENS", "6000")),
+            conversation_summary_batch_messages=int(os.getenv("CONVERSATION_SUMMARY_BATCH_MESSAGES", "6")),
+            conversation_summary_model=os.getenv("CONVERSATION_SUMMARY_MODEL", "claude-3-5-haiku-20241022"),
+            conversation_cache_size=int(os.getenv("CONVERSATION_CACHE_SIZE", "0")),
+            conversation_write_behind_enabled=os.getenv("CONVERSATION_WRITE_BEHIND_ENABLED", "false").lower() == "true",
+            conversation_write_behind_interval_ms=int(os.getenv("CONVERSATION_WRITE_BEHIND_INTERVAL_MS", "5")),
+            conversation_cleanup_interval_minutes=int(os.getenv("CONVERSATION_CLEANUP_INTERVAL_MINUTES", "60")),
+            conversation_cleanup_batch_size=int(os.getenv("CONVERSATION_CLEANUP_BATCH_SIZE", "500")),
+            intent_fast_path_enabled=os.getenv("INTENT_FAST_PATH_ENABLED", "true").lower() == "true",
+            intent_fast_path_min_confidence=float(os.getenv("INTENT_FAST_PATH_MIN_CONFIDENCE", "0.8")),
+            task_snapshot_max_tokens=int(os.getenv("TASK_SNAPSHOT_MAX_TOKENS", "600")),
+            claude_default_model=os.getenv("CLAUDE_DEFAULT_MODEL", "claude-3-5-sonnet-20241022"),
+            claude_fast_model=os.getenv("CLAUDE_FAST_MODEL", "claude-3-5-haiku-20241022"),
+            model_routing_enabled=os.getenv("MODEL_ROUTING_ENABLED", "true").lower() == "true",
+            claude_max_concurrent_calls=int(os.getenv("CLAUDE_MAX_CONCURRENT_CALLS", "8")),
+            claude_max_retries=int(os.getenv("CLAUDE_MAX_RETRIES", "3")),
+            claude_call_deadline_seconds=float(os.getenv("CLAUDE_CALL_DEADLINE_SECONDS", "90")),
+            claude_circuit_failure_threshold=int(os.getenv("CLAUDE_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            claude_circuit_reset_seconds=float(os.getenv("CLAUDE_CIRCUIT_RESET_SECONDS", "30")),
+            anthropic_base_url=os.getenv("ANTHROPIC_BASE_URL") or None,
+            slack_api_base_url=os.getenv("SLACK_API_BASE_URL", "https://slack.com/api/"),
+            worker_concurrency=int(os.getenv("WORKER_CONCURRENCY", "4")),
+            job_visibility_timeout_seconds=int(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300")),
+            job_max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "5")),
+            max_concurrent_messages=int(os.getenv("MAX_CONCURRENT_MESSAGES", "4")),
+            max_concurrent_messages_per_user=int(os.getenv("MAX_CONCURRENT_MESSAGES_PER_USER", "2")),
+            message_coalesce_window_ms=int(os.getenv("MESSAGE_COALESCE_WINDOW_MS", "1500")),
+            message_coalesce_max_wait_ms=int(os.getenv("MESSAGE_COALESCE_MAX_WAIT_MS", "5000")),
+            slack_streaming_replies=os.getenv("SLACK_STREAMING_REPLIES", "true").lower() == "true",
+            slack_stream_update_interval_ms=int(os.getenv("SLACK_STREAM_UPDATE_INTERVAL_MS", "1000")),
+            event_dedup_backend=os.getenv("EVENT_DEDUP_BACKEND", "postgres").lower(),
+            event_dedup_ttl_seconds=int(os.getenv("EVENT_DEDUP_TTL_SECONDS", "3600")),
             debug=os.getenv("DEBUG", "false").lower() == "true",
         )
 
@@ -43,3 +110,5 @@ class AppConfig:
             raise RuntimeError("DATABASE_URL environment variable is required")
         if not self.nakamura_user_id:
             raise RuntimeError("NAKAMURA_USER_ID environment variable is required")
+        if self.event_dedup_backend not in ("postgres", "memory"):
+            raise RuntimeError("EVENT_DEDUP_BACKEND must be 'postgres' or 'memory'")
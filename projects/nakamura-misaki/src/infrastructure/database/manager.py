@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from .schema import Base
+from .session_scope import session_scope
 
 
 class DatabaseManager:
@@ -48,6 +49,18 @@ class DatabaseManager:
                 await session.rollback()
                 raise
 
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[AsyncSession]:
+        """Open a session and bind it for ScopedSession users (unit of work)
+
+        Usage:
+            async with db_manager.request_scope():
+                await handler.handle_message(...)
+        """
+        async with self.session() as session:
+            with session_scope(session):
+                yield session
+
     async def create_tables(self) -> None:
         """Create all tables"""
         async with self._engine.begin() as conn:
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Column,
     Date,
@@ -66,8 +67,9 @@ class TaskTable(Base):
 class ConversationTable(Base):
     """Conversations table for managing chat history with Claude.
 
-    Stores conversation history with 24-hour TTL.
-    Messages are stored in JSONB format compatible with Claude Messages API.
+    Stores conversation history with a sliding TTL (``expires_at`` moves
+    forward on activity; cleanup deletes by the indexed column).
+    Messages live in conversation_messages (one row per message).
     """
 
     __tablename__ = "conversations"
@@ -75,18 +77,43 @@ class ConversationTable(Base):
     conversation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(String(100), nullable=False, index=True)
     channel_id = Column(String(100), nullable=False, index=True)
-    # Use JSON type (compatible with both PostgreSQL JSONB and SQLite JSON)
-    messages = Column(JSON, nullable=False)
+    # Number of rows in conversation_messages (next seq to append)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
     last_message_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(), index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    # Rolling summary of messages[:summarized_count] (token-budgeted history window)
+    summary = Column(Text, nullable=True)
+    summarized_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     __table_args__ = (
         Index("idx_conversations_user_channel", "user_id", "channel_id"),
         Index("idx_conversations_last_message", "last_message_at"),
+        Index("idx_conversations_expires_at", "expires_at"),
     )
 
 
+class ConversationMessageTable(Base):
+    """Append-only conversation messages.
+
+    Saving a turn inserts only its new messages, and history reads load a
+    bounded tail by ``seq``, so neither grows with the conversation length.
+    """
+
+    __tablename__ = "conversation_messages"
+
+    conversation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.conversation_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True)  # 0-based position in the conversation
+    role = Column(String(20), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class EmployeeTable(Base):
     """Employees table for workforce management"""
 
@@ -320,3 +347,53 @@ class NotificationTable(Base):
             postgresql_where="read_at IS NULL",
         ),
     )
+
+
+class SlackJobTable(Base):
+    """Durable work queue for Slack message processing.
+
+    Jobs are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so that several
+    workers (and several uvicorn processes) can dequeue concurrently.
+    A claimed job is leased until ``locked_until``; if the worker dies the lease
+    expires and the job becomes claimable again (visibility timeout).
+    Only the oldest unfinished job of a ``conversation_key`` is claimable.
+    """
+
+    __tablename__ = "slack_jobs"
+
+    # BIGSERIAL on PostgreSQL, INTEGER PRIMARY KEY (rowid alias) on SQLite
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    job_type = Column(String(50), nullable=False)
+    # Jobs sharing a key run strictly in order (e.g. "U123:C456" for one conversation)
+    conversation_key = Column(String(200), nullable=True)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending / running / done / dead
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    available_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
+
+    __table_args__ = (
+        Index("idx_slack_jobs_status_available", "status", "available_at"),
+        Index("idx_slack_jobs_locked_until", "locked_until"),
+        Index("idx_slack_jobs_conversation_key", "conversation_key", "id"),
+    )
+
+
+class SlackProcessedEventTable(Base):
+    """Slack event IDs already accepted by the webhook (cross-worker deduplication).
+
+    Created as an UNLOGGED table by the migration: losing it on crash only
+    re-opens a short dedup window, so WAL writes are not worth paying for.
+    """
+
+    __tablename__ = "slack_processed_events"
+
+    event_id = Column(String(100), primary_key=True)
+    received_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now())
+
+    __table_args__ = (Index("idx_slack_processed_events_received", "received_at"),)
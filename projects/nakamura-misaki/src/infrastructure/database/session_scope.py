@@ -0,0 +1,62 @@
+"""Request-scoped AsyncSession
+
+Long-lived objects (repositories, use cases, the Slack event handler) are built
+once per process with a ``ScopedSession``. Each unit of work binds its own
+``AsyncSession`` with ``session_scope()``; every call through the proxy goes to
+the session bound in the current context.
+
+Context variables are copied into tasks created inside the scope, so
+``asyncio.gather`` of tools still sees the request's session, while
+concurrently processed messages never share one.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+
+class NoActiveSessionError(RuntimeError):
+    """A ScopedSession was used outside of ``session_scope()``"""
+
+
+@contextmanager
+def session_scope(session: AsyncSession) -> Iterator[AsyncSession]:
+    """Bind ``session`` to the current context
+
+    Usage:
+        async with db_manager.session() as session:
+            with session_scope(session):
+                await handler.handle_message(...)
+    """
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+
+def current_session() -> AsyncSession:
+    """Get the session bound to the current context
+
+    Raises:
+        NoActiveSessionError: No session is bound
+    """
+    session = _current_session.get()
+    if session is None:
+        raise NoActiveSessionError("No AsyncSession bound; wrap the call in session_scope()")
+    return session
+
+
+class ScopedSession:
+    """AsyncSession stand-in delegating to the context's current session"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(current_session(), name)
+
+    def __repr__(self) -> str:
+        return f"<ScopedSession current={_current_session.get()!r}>"
@@ -0,0 +1,76 @@
+"""Single round-trip upserts (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+
+Repositories used to SELECT a row and then mutate the ORM object or add a new
+one: two round-trips per save, plus the identity-map bookkeeping of the
+loaded object. ``upsert`` writes the row in one statement instead.
+
+- PostgreSQL / SQLite >= 3.35: ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+  with ``populate_existing``, so an instance already loaded in the session is
+  refreshed with the written values (later reads in the session stay correct)
+- SQLite without RETURNING: the same upsert, then ``session.get(..., populate_existing=True)``
+- Other dialects: ``session.merge`` (SELECT + INSERT/UPDATE, as before)
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper
+
+from .session_scope import ScopedSession
+
+_ON_CONFLICT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def on_conflict_insert(session: AsyncSession | ScopedSession) -> Callable[..., Any] | None:
+    """``insert`` construct with ON CONFLICT support for the session's dialect (None if unsupported)"""
+    # get_bind() rather than .bind: never None (raises if the session has no engine)
+    return _ON_CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+
+
+async def upsert[ModelT](
+    session: AsyncSession | ScopedSession,
+    model: type[ModelT],
+    values: Mapping[str, Any],
+    *,
+    insert_only: Iterable[str] = (),
+    update_set: Callable[[Any], Mapping[str, Any]] | None = None,
+) -> ModelT:
+    """Insert a row or update it on primary-key conflict
+
+    Args:
+        session: Session or ScopedSession (the statement runs in its transaction)
+        model: ORM model class
+        values: Column values of the row (must include the primary key)
+        insert_only: Columns written on insert but kept on update (e.g. created_at)
+        update_set: Builds update expressions from the ``excluded`` row, overriding
+            the default "take the new value" of those columns
+
+    Returns:
+        The ORM instance with the stored values
+    """
+    mapper = class_mapper(model)
+    key_columns = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+    insert = on_conflict_insert(session)
+    if insert is None:
+        return await session.merge(model(**values))
+
+    stmt = insert(model).values(**values)
+    skipped = set(key_columns) | set(insert_only)
+    update = {column: stmt.excluded[column] for column in values if column not in skipped}
+    if update_set is not None:
+        update.update(update_set(stmt.excluded))
+    stmt = stmt.on_conflict_do_update(index_elements=key_columns, set_=update)
+
+    if session.get_bind().dialect.insert_returning:
+        result = await session.execute(stmt.returning(model), execution_options={"populate_existing": True})
+        written: ModelT = result.scalar_one()
+        return written
+
+    await session.execute(stmt)
+    identity = tuple(values[column] for column in key_columns)
+    instance = await session.get(model, identity if len(identity) > 1 else identity[0], populate_existing=True)
+    assert instance is not None
+    return instance
@@ -0,0 +1,5 @@
+"""Slack event deduplication package"""
+
+from .event_dedup_store import EventDedupStore, InMemoryEventDedupStore, PostgreSQLEventDedupStore
+
+__all__ = ["EventDedupStore", "InMemoryEventDedupStore", "PostgreSQLEventDedupStore"]
@@ -0,0 +1,177 @@
+"""Slack event deduplication stores
+
+Slack retries a webhook delivery (same ``event_id``) when it does not get a
+200 within 3 seconds. These stores remember accepted event IDs for a bounded
+time so that a retry never triggers a second Claude round-trip:
+
+- InMemoryEventDedupStore: per-process ordered ring with TTL and LRU-size cap
+- PostgreSQLEventDedupStore: shared across uvicorn workers, keyed by event_id,
+  fronted by the in-memory ring
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..database.manager import DatabaseManager
+from ..database.schema import SlackProcessedEventTable
+from ..metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+
+class EventDedupStore(ABC):
+    """Event deduplication store interface"""
+
+    @abstractmethod
+    async def mark_seen(self, event_id: str) -> bool:
+        """Record an event ID
+
+        Args:
+            event_id: Slack event ID
+
+        Returns:
+            True if the event was not seen within the TTL (process it),
+            False if it is a duplicate (ignore it)
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, event_id: str) -> None:
+        """Forget an event ID (e.g. when enqueueing it failed, so a retry is processed)
+
+        Args:
+            event_id: Slack event ID
+        """
+        pass
+
+
+class InMemoryEventDedupStore(EventDedupStore):
+    """Per-process dedup store: insertion-ordered ring with TTL
+
+    Entries are kept in first-seen order, so both TTL expiry and the size cap
+    evict the oldest entries first.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 3600):
+        """Initialize in-memory store
+
+        Args:
+            max_size: Maximum number of remembered event IDs
+            ttl_seconds: How long an event ID is remembered
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    async def mark_seen(self, event_id: str) -> bool:
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        if event_id in self._entries:
+            return False
+
+        self._entries[event_id] = now
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return True
+
+    async def release(self, event_id: str) -> None:
+        self._entries.pop(event_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries older than the TTL (oldest first)"""
+        threshold = now - self._ttl_seconds
+        while self._entries:
+            oldest_seen_at = next(iter(self._entries.values()))
+            if oldest_seen_at > threshold:
+                break
+            self._entries.popitem(last=False)
+
+
+class PostgreSQLEventDedupStore(EventDedupStore):
+    """Dedup store shared by all workers via the ``slack_processed_events`` table
+
+    A local InMemoryEventDedupStore answers repeats seen by this process
+    without a DB round-trip. New IDs are claimed with
+    ``INSERT ... ON CONFLICT DO UPDATE ... WHERE received_at < cutoff RETURNING``,
+    which only returns a row when the ID is new or its previous entry expired.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        ttl_seconds: float = 3600,
+        local_cache: InMemoryEventDedupStore | None = None,
+        purge_interval_seconds: float = 300,
+    ):
+        """Initialize PostgreSQL store
+
+        Args:
+            db_manager: DatabaseManager
+            ttl_seconds: How long an event ID is remembered
+            local_cache: Per-process front cache (created if omitted)
+            purge_interval_seconds: Minimum interval between expired-row purges
+        """
+        self._db_manager = db_manager
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._local = local_cache or InMemoryEventDedupStore(ttl_seconds=ttl_seconds)
+        self._purge_interval_seconds = purge_interval_seconds
+        self._last_purge = time.monotonic()
+
+    async def mark_seen(self, event_id: str) -> bool:
+        if not await self._local.mark_seen(event_id):
+            metrics.increment("event_dedup.local_hits")
+            return False
+
+        try:
+            is_new = await self._claim(event_id)
+        except Exception:
+            # Not recorded anywhere: let Slack's retry of this event through
+            await self._local.release(event_id)
+            raise
+
+        if not is_new:
+            metrics.increment("event_dedup.shared_hits")
+        return is_new
+
+    async def release(self, event_id: str) -> None:
+        await self._local.release(event_id)
+        async with self._db_manager.session() as session:
+            await session.execute(
+                delete(SlackProcessedEventTable).where(SlackProcessedEventTable.event_id == event_id)
+            )
+
+    async def _claim(self, event_id: str) -> bool:
+        """Insert the event ID (or take over its expired row); True if it was new"""
+        now = datetime.now(UTC)
+        cutoff = now - self._ttl
+        async with self._db_manager.session() as session:
+            insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+            stmt = insert(SlackProcessedEventTable).values(event_id=event_id, received_at=now)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SlackProcessedEventTable.event_id],
+                set_={"received_at": now},
+                where=SlackProcessedEventTable.received_at < cutoff,
+            ).returning(SlackProcessedEventTable.event_id)
+            result = await session.execute(stmt)
+            is_new = result.scalar_one_or_none() is not None
+
+            if time.monotonic() - self._last_purge >= self._purge_interval_seconds:
+                self._last_purge = time.monotonic()
+                purged = await session.execute(
+                    delete(SlackProcessedEventTable).where(SlackProcessedEventTable.received_at < cutoff)
+                )
+                if purged.rowcount:
+                    logger.info(f"Purged {purged.rowcount} expired Slack event IDs")
+        return is_new
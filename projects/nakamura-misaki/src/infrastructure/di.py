@@ -7,6 +7,7 @@ from anthropic import Anthropic, AsyncAnthropic
 from slack_sdk.web.async_client import AsyncWebClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.primary.intent_fast_path import IntentFastPath
 from src.adapters.primary.slack_event_handler import SlackEventHandlerV5
 
 # Conversations context use cases
@@ -153,19 +154,52 @@ from src.contexts.workforce_management.infrastructure.repositories.postgresql_sk
     PostgreSQLSkillRepository,
 )
 
+# Domain services
+from src.domain.services.conversation_summarizer import ConversationSummarizer
+from src.domain.services.conversation_window import ConversationWindow
+from src.domain.services.messages_client import MessagesClient
+from src.domain.services.model_router import ModelRouter
+from src.domain.services.task_snapshot import TaskSnapshotBuilder
+
+# Infrastructure
+from src.infrastructure.claude_gateway import CircuitBreaker, ResilientAnthropicClient
+from src.infrastructure.config import AppConfig
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.jobs import ConversationCleanupJob
+from src.infrastructure.repositories.cached_conversation_repository import (
+    CachedConversationRepository,
+    ConversationCache,
+)
+from src.infrastructure.repositories.write_behind_conversation_repository import (
+    ConversationWriteBehind,
+    WriteBehindConversationRepository,
+)
+
 
 class DIContainer:
-    """DI Container"""
+    """DI Container
+
+    With a concrete ``AsyncSession`` the container serves one unit of work.
+    With a ``ScopedSession`` it is the long-lived application graph: built once,
+    and every repository uses the session bound by ``session_scope()``.
+    """
 
     def __init__(
         self,
-        session: AsyncSession,
+        session: AsyncSession | ScopedSession,
         slack_client: AsyncWebClient,
         claude_client: Anthropic | None = None,
+        anthropic_client: MessagesClient | None = None,
+        conversation_cache: ConversationCache | None = None,
+        conversation_write_behind: ConversationWriteBehind | None = None,
     ):
         self._session = session
         self._claude_client = claude_client
+        self._anthropic_client = anthropic_client
         self._slack_client = slack_client
+        self._conversation_cache = conversation_cache
+        self._conversation_write_behind = conversation_write_behind
 
         # リポジトリ
         self._task_repository = None
@@ -193,7 +227,12 @@ class DIContainer:
     def conversation_repository(self):
         """Get ConversationRepository"""
         if self._conversation_repository is None:
-            self._conversation_repository = PostgreSQLConversationRepository(self._session)
+            repository = PostgreSQLConversationRepository(self._session)
+            if self._conversation_cache is not None:
+                repository = CachedConversationRepository(repository, self._conversation_cache, self._session)
+            if self._conversation_write_behind is not None:
+                repository = WriteBehindConversationRepository(repository, self._conversation_write_behind)
+            self._conversation_repository = repository
         return self._conversation_repository
 
     @property
@@ -429,22 +468,35 @@ class DIContainer:
     # SlackEventHandler v5.0.0
 
     def build_slack_event_handler(
-        self, anthropic_api_key: str, conversation_ttl_hours: int = 24
+        self,
+        anthropic_api_key: str,
+        conversation_ttl_hours: int = 24,
+        conversation_window: ConversationWindow | None = None,
+        conversation_summarizer: ConversationSummarizer | None = None,
+        intent_fast_path: IntentFastPath | None = None,
+        task_snapshot_builder: TaskSnapshotBuilder | None = None,
+        model_router: ModelRouter | None = None,
     ) -> SlackEventHandlerV5:
         """Build SlackEventHandlerV5 for v5.0.0.
 
         Args:
-            anthropic_api_key: Anthropic API key
+            anthropic_api_key: Anthropic API key (used if no shared client was given)
             conversation_ttl_hours: Conversation TTL in hours
+            conversation_window: Token-budgeted history window (None = full history)
+            conversation_summarizer: Background rolling summary refresher
+            intent_fast_path: Local answers for formulaic commands (None = always Claude)
+            task_snapshot_builder: Prefetches the user's open tasks into the prompt
+            model_router: Chooses fast/default Claude model per turn (None = default model)
 
         Returns:
             SlackEventHandlerV5: Event handler instance
         """
-        # Create AsyncAnthropic client
-        anthropic_client = AsyncAnthropic(api_key=anthropic_api_key)
+        # Reuse one AsyncAnthropic (and its connection pool) per container
+        if self._anthropic_client is None:
+            self._anthropic_client = AsyncAnthropic(api_key=anthropic_api_key)
 
         return SlackEventHandlerV5(
-            anthropic_client=anthropic_client,
+            anthropic_client=self._anthropic_client,
             slack_client=self._slack_client,
             conversation_repository=self.conversation_repository,
             # Personal Tasks use cases
@@ -463,6 +515,11 @@ class DIContainer:
             list_projects_use_case=self.build_list_projects_use_case(),
             archive_project_use_case=self.build_archive_project_use_case(),
             conversation_ttl_hours=conversation_ttl_hours,
+            conversation_window=conversation_window,
+            conversation_summarizer=conversation_summarizer,
+            intent_fast_path=intent_fast_path,
+            task_snapshot_builder=task_snapshot_builder,
+            model_router=model_router,
         )
 
 
@@ -500,3 +557,134 @@ def initialize_di_container(
     global _di_container_instance
     _di_container_instance = DIContainer(session, slack_client)
     return _di_container_instance
+
+
+def create_anthropic_client(config: AppConfig) -> ResilientAnthropicClient:
+    """Create the shared Anthropic client
+
+    One connection pool for every Claude call, behind a concurrency cap,
+    jittered retries and a circuit breaker (SDK-level retries disabled).
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        ResilientAnthropicClient
+    """
+    return ResilientAnthropicClient(
+        AsyncAnthropic(api_key=config.anthropic_api_key.strip(), base_url=config.anthropic_base_url, max_retries=0),
+        max_concurrent=config.claude_max_concurrent_calls,
+        max_retries=config.claude_max_retries,
+        deadline_seconds=config.claude_call_deadline_seconds,
+        breaker=CircuitBreaker(
+            failure_threshold=config.claude_circuit_failure_threshold,
+            reset_timeout_seconds=config.claude_circuit_reset_seconds,
+        ),
+    )
+
+
+def create_slack_event_handler(
+    config: AppConfig,
+    db_manager: DatabaseManager,
+    slack_client: AsyncWebClient,
+    anthropic_client: ResilientAnthropicClient,
+) -> tuple[SlackEventHandlerV5, ConversationSummarizer | None, ConversationWriteBehind | None]:
+    """Build the process-wide message handler graph (app startup, benchmarks)
+
+    The graph is built once on a ScopedSession; repositories use the session
+    bound per job by ``db_manager.request_scope()``.
+
+    Args:
+        config: Application configuration
+        db_manager: DatabaseManager (unit of work for background/concurrent DB access)
+        slack_client: Slack async web client
+        anthropic_client: Shared Anthropic client
+
+    Returns:
+        (SlackEventHandlerV5, ConversationSummarizer and ConversationWriteBehind to close at
+        shutdown or None)
+    """
+    # Active conversations are served from memory (written through on save; single process only)
+    conversation_cache = None
+    if config.conversation_cache_size > 0:
+        conversation_cache = ConversationCache(max_size=config.conversation_cache_size)
+
+    # Conversation saves flushed in batches after the reply (unflushed turns are lost on a crash)
+    conversation_write_behind = None
+    if config.conversation_write_behind_enabled:
+        conversation_write_behind = ConversationWriteBehind(
+            unit_of_work=db_manager.request_scope,
+            flush_interval_seconds=config.conversation_write_behind_interval_ms / 1000,
+        )
+
+    container = DIContainer(
+        session=ScopedSession(),
+        slack_client=slack_client,
+        anthropic_client=anthropic_client,
+        conversation_cache=conversation_cache,
+        conversation_write_behind=conversation_write_behind,
+    )
+
+    # Token-budgeted history; older messages are folded into a background summary
+    conversation_window = None
+    conversation_summarizer = None
+    if config.conversation_history_max_tokens > 0:
+        conversation_window = ConversationWindow(
+            max_history_tokens=config.conversation_history_max_tokens,
+            summary_batch_messages=config.conversation_summary_batch_messages,
+        )
+        conversation_summarizer = ConversationSummarizer(
+            anthropic_client,
+            container.conversation_repository,
+            unit_of_work=db_manager.request_scope,
+            model=config.conversation_summary_model,
+        )
+
+    # Formulaic commands answered without Claude
+    intent_fast_path = None
+    if config.intent_fast_path_enabled:
+        intent_fast_path = IntentFastPath(min_confidence=config.intent_fast_path_min_confidence)
+
+    # Open tasks prefetched into the prompt (own session, concurrent with conversation loading)
+    task_snapshot_builder = None
+    if config.task_snapshot_max_tokens > 0:
+        task_snapshot_builder = TaskSnapshotBuilder(
+            container.build_query_user_tasks_use_case(),
+            unit_of_work=db_manager.request_scope,
+            max_tokens=config.task_snapshot_max_tokens,
+        )
+
+    # Simple turns on the fast model, complex ones (and escalations) on the default model
+    model_router = None
+    if config.model_routing_enabled:
+        model_router = ModelRouter(default_model=config.claude_default_model, fast_model=config.claude_fast_model)
+
+    handler = container.build_slack_event_handler(
+        anthropic_api_key=config.anthropic_api_key,
+        conversation_ttl_hours=config.conversation_ttl_hours,
+        conversation_window=conversation_window,
+        conversation_summarizer=conversation_summarizer,
+        intent_fast_path=intent_fast_path,
+        task_snapshot_builder=task_snapshot_builder,
+        model_router=model_router,
+    )
+    return handler, conversation_summarizer, conversation_write_behind
+
+
+def create_conversation_cleanup_job(config: AppConfig, db_manager: DatabaseManager) -> ConversationCleanupJob:
+    """Build the expired-conversation cleanup job (each batch in its own unit of work)
+
+    Args:
+        config: Application configuration
+        db_manager: DatabaseManager
+
+    Returns:
+        ConversationCleanupJob (not started)
+    """
+    return ConversationCleanupJob(
+        PostgreSQLConversationRepository(ScopedSession()),
+        ttl_hours=config.conversation_ttl_hours,
+        cleanup_interval_minutes=config.conversation_cleanup_interval_minutes,
+        batch_size=config.conversation_cleanup_batch_size,
+        unit_of_work=db_manager.request_scope,
+    )
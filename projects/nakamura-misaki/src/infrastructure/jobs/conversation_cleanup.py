@@ -1,14 +1,22 @@
 """Conversation TTL cleanup job
 
 Periodically removes expired conversations based on TTL.
+Deletes by the indexed ``expires_at`` in batches (one transaction per batch),
+so a run costs O(expired rows) and never holds long locks.
 """
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
 
 from ...contexts.personal_tasks.domain.repositories.conversation_repository import ConversationRepository
+from ..metrics import get_metrics
 
 logger = logging.getLogger(__name__)
+metrics = get_metrics()
 
 
 class ConversationCleanupJob:
@@ -19,17 +27,23 @@ class ConversationCleanupJob:
         conversation_repository: ConversationRepository,
         ttl_hours: int = 24,
         cleanup_interval_minutes: int = 60,
+        batch_size: int = 500,
+        unit_of_work: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
     ):
         """Initialize cleanup job
 
         Args:
             conversation_repository: Conversation repository
-            ttl_hours: Time-to-live in hours
+            ttl_hours: Time-to-live in hours (expiry itself is stored per conversation)
             cleanup_interval_minutes: How often to run cleanup
+            batch_size: Conversations deleted per statement / transaction
+            unit_of_work: Opens the DB scope of one batch (e.g. DatabaseManager.request_scope)
         """
         self._repository = conversation_repository
         self._ttl_hours = ttl_hours
         self._cleanup_interval = cleanup_interval_minutes * 60  # Convert to seconds
+        self._batch_size = batch_size
+        self._unit_of_work = unit_of_work or nullcontext
         self._task: asyncio.Task | None = None
         self._running = False
 
@@ -72,12 +86,28 @@ class ConversationCleanupJob:
                 # Continue running even if cleanup fails
                 await asyncio.sleep(self._cleanup_interval)
 
-    async def _cleanup_expired_conversations(self) -> None:
-        """Remove expired conversations"""
+    async def _cleanup_expired_conversations(self) -> int:
+        """Remove expired conversations batch by batch
+
+        Returns:
+            Number of conversations deleted
+        """
+        started = time.perf_counter()
+        deleted_count = 0
         try:
-            deleted_count = await self._repository.delete_expired()
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} expired conversations")
+            while True:
+                async with self._unit_of_work():
+                    deleted = await self._repository.delete_expired(limit=self._batch_size)
+                deleted_count += deleted
+                metrics.increment("conversation_cleanup.deleted", deleted)
+                if deleted < self._batch_size:
+                    break
         except Exception as e:
             logger.error(f"Failed to clean up conversations: {e}", exc_info=True)
             raise
+        finally:
+            metrics.record_time("conversation_cleanup_time", (time.perf_counter() - started) * 1000)
+
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} expired conversations")
+        return deleted_count
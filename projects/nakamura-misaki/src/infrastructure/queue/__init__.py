@@ -0,0 +1,7 @@
+"""Durable job queue package"""
+
+from .job_queue import Job, JobStatus, PayloadMerger, PostgreSQLJobQueue
+from .keyed_executor import KeyedExecutor
+from .worker_pool import JobHandler, JobWorkerPool
+
+__all__ = ["Job", "JobHandler", "JobStatus", "JobWorkerPool", "KeyedExecutor", "PayloadMerger", "PostgreSQLJobQueue"]
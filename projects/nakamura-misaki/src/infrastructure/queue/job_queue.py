@@ -0,0 +1,354 @@
+"""PostgreSQL-backed durable job queue
+
+Replaces FastAPI BackgroundTasks for Slack message processing:
+- Jobs survive process restarts (rows in ``slack_jobs``)
+- Concurrent dequeue via ``FOR UPDATE SKIP LOCKED``
+- Visibility timeout: a claimed job is leased until ``locked_until``
+- Failed jobs are retried with exponential backoff until ``max_attempts``
+- Jobs sharing a ``conversation_key`` are processed strictly in order
+- Bursts of jobs sharing a ``conversation_key`` can be debounced and merged
+  into one job (see ``payload_mergers``)
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, exists, insert, or_, select, update
+from sqlalchemy.orm import aliased
+
+from ..database.manager import DatabaseManager
+from ..database.schema import SlackJobTable
+from ..metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+# Merges the payloads of a burst (oldest first) into a single payload
+PayloadMerger = Callable[[list[dict[str, Any]]], dict[str, Any]]
+
+
+class JobStatus:
+    """Job status values stored in ``slack_jobs.status``"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DEAD = "dead"
+
+
+@dataclass(frozen=True)
+class Job:
+    """A claimed job
+
+    Attributes:
+        id: Job ID
+        job_type: Job type (handler routing key)
+        payload: JSON payload
+        attempts: Attempt number of this claim (1-based). Also acts as the lease token.
+        max_attempts: Attempts allowed before the job is marked dead
+        coalesced_ids: IDs of later jobs merged into this one at claim time
+    """
+
+    id: int
+    job_type: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    coalesced_ids: tuple[int, ...] = ()
+
+
+class PostgreSQLJobQueue:
+    """Durable job queue on top of the ``slack_jobs`` table"""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        visibility_timeout_seconds: int = 300,
+        max_attempts: int = 5,
+        retry_backoff_seconds: float = 5.0,
+        max_retry_backoff_seconds: float = 300.0,
+        payload_mergers: dict[str, PayloadMerger] | None = None,
+        coalesce_window_seconds: float = 0.0,
+        coalesce_max_wait_seconds: float = 5.0,
+    ):
+        """Initialize job queue
+
+        Args:
+            db_manager: DatabaseManager (each operation uses its own short transaction)
+            visibility_timeout_seconds: Lease duration of a claimed job
+            max_attempts: Default attempts before a job is marked dead
+            retry_backoff_seconds: Base delay for exponential retry backoff
+            max_retry_backoff_seconds: Upper bound of the retry delay
+            payload_mergers: job_type -> merger. Jobs of these types that share a
+                ``conversation_key`` are debounced and merged into one job.
+            coalesce_window_seconds: Debounce window; each new job of a key
+                postpones the pending burst by this much (0 = no debounce)
+            coalesce_max_wait_seconds: A burst older than this is no longer
+                postponed, which bounds the added latency
+        """
+        self._db_manager = db_manager
+        self._visibility_timeout = timedelta(seconds=visibility_timeout_seconds)
+        self._max_attempts = max_attempts
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._max_retry_backoff_seconds = max_retry_backoff_seconds
+        self._payload_mergers = payload_mergers or {}
+        self._coalesce_window = timedelta(seconds=coalesce_window_seconds)
+        self._coalesce_max_wait = timedelta(seconds=coalesce_max_wait_seconds)
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: dict[str, Any],
+        delay_seconds: float = 0,
+        conversation_key: str | None = None,
+    ) -> int:
+        """Add a job to the queue
+
+        Args:
+            job_type: Job type
+            payload: JSON-serializable payload
+            delay_seconds: Delay before the job becomes available
+            conversation_key: Ordering key; jobs with the same key never run concurrently
+
+        Returns:
+            New job ID
+        """
+        now = datetime.now(UTC)
+        debounce = (
+            conversation_key is not None
+            and job_type in self._payload_mergers
+            and self._coalesce_window > timedelta(0)
+        )
+        if debounce:
+            delay_seconds = max(delay_seconds, self._coalesce_window.total_seconds())
+        stmt = (
+            insert(SlackJobTable)
+            .values(
+                job_type=job_type,
+                conversation_key=conversation_key,
+                payload=payload,
+                status=JobStatus.PENDING,
+                attempts=0,
+                max_attempts=self._max_attempts,
+                available_at=now + timedelta(seconds=delay_seconds),
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(SlackJobTable.id)
+        )
+        async with self._db_manager.session() as session:
+            if debounce:
+                await self._postpone_burst(session, job_type, conversation_key, now)
+            result = await session.execute(stmt)
+            job_id = result.scalar_one()
+
+        metrics.increment("job_queue.enqueued")
+        return job_id
+
+    async def dequeue(self, worker_id: str, limit: int = 1) -> list[Job]:
+        """Claim up to ``limit`` available jobs
+
+        Pending jobs whose ``available_at`` has passed and running jobs whose
+        lease has expired are both claimable. Rows locked by another
+        transaction are skipped, so concurrent workers never claim the same job.
+        A job is only claimable while no older job with the same
+        ``conversation_key`` is pending or running, which serializes each
+        conversation across all workers and processes.
+
+        For job types with a payload merger, the later pending jobs of the
+        claimed job's conversation are deleted in the same transaction and
+        their payloads merged into the claimed job, so a burst is handled once.
+
+        Args:
+            worker_id: Identifier of the claiming worker (for diagnostics)
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs in enqueue order
+        """
+        now = datetime.now(UTC)
+        earlier = aliased(SlackJobTable)
+        blocked_by_earlier_job = exists().where(
+            earlier.conversation_key == SlackJobTable.conversation_key,
+            earlier.id < SlackJobTable.id,
+            earlier.status.in_([JobStatus.PENDING, JobStatus.RUNNING]),
+        )
+        claimable = or_(
+            and_(SlackJobTable.status == JobStatus.PENDING, SlackJobTable.available_at <= now),
+            and_(
+                SlackJobTable.status == JobStatus.RUNNING,
+                SlackJobTable.locked_until < now,
+                SlackJobTable.attempts < SlackJobTable.max_attempts,
+            ),
+        )
+        candidates = (
+            select(SlackJobTable.id)
+            .where(claimable, ~blocked_by_earlier_job)
+            .order_by(SlackJobTable.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(SlackJobTable)
+            .where(SlackJobTable.id.in_(candidates))
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=SlackJobTable.attempts + 1,
+                locked_until=now + self._visibility_timeout,
+                locked_by=worker_id,
+                updated_at=now,
+            )
+            .returning(
+                SlackJobTable.id,
+                SlackJobTable.job_type,
+                SlackJobTable.payload,
+                SlackJobTable.attempts,
+                SlackJobTable.max_attempts,
+                SlackJobTable.conversation_key,
+            )
+        )
+
+        jobs = []
+        async with self._db_manager.session() as session:
+            await self._bury_expired_leases(session, now)
+            result = await session.execute(stmt)
+            for row in result.all():
+                job = Job(
+                    id=row.id,
+                    job_type=row.job_type,
+                    payload=row.payload,
+                    attempts=row.attempts,
+                    max_attempts=row.max_attempts,
+                )
+                if row.conversation_key is not None and row.job_type in self._payload_mergers:
+                    job = await self._coalesce(session, job, row.conversation_key)
+                jobs.append(job)
+
+        jobs.sort(key=lambda job: job.id)
+        if jobs:
+            metrics.increment("job_queue.claimed", len(jobs))
+        return jobs
+
+    async def complete(self, job: Job) -> None:
+        """Remove a successfully processed job
+
+        Args:
+            job: Claimed job
+        """
+        stmt = delete(SlackJobTable).where(
+            SlackJobTable.id == job.id,
+            SlackJobTable.attempts == job.attempts,
+        )
+        async with self._db_manager.session() as session:
+            result = await session.execute(stmt)
+
+        if result.rowcount == 0:
+            # Lease expired and another worker re-claimed the job
+            logger.warning(f"Job {job.id} completed after its lease was lost")
+        metrics.increment("job_queue.completed")
+
+    async def fail(self, job: Job, error: str) -> None:
+        """Record a failed attempt and schedule a retry (or mark dead)
+
+        Args:
+            job: Claimed job
+            error: Error description
+        """
+        now = datetime.now(UTC)
+        if job.attempts >= job.max_attempts:
+            values: dict[str, Any] = {"status": JobStatus.DEAD}
+            metrics.increment("job_queue.dead")
+            logger.error(f"Job {job.id} exhausted {job.attempts} attempts: {error}")
+        else:
+            delay = min(
+                self._retry_backoff_seconds * (2 ** (job.attempts - 1)),
+                self._max_retry_backoff_seconds,
+            )
+            values = {"status": JobStatus.PENDING, "available_at": now + timedelta(seconds=delay)}
+            metrics.increment("job_queue.retried")
+            logger.warning(f"Job {job.id} failed (attempt {job.attempts}/{job.max_attempts}), retry in {delay:.0f}s: {error}")
+
+        stmt = (
+            update(SlackJobTable)
+            .where(SlackJobTable.id == job.id, SlackJobTable.attempts == job.attempts)
+            .values(locked_until=None, locked_by=None, last_error=error[:2000], updated_at=now, **values)
+        )
+        async with self._db_manager.session() as session:
+            await session.execute(stmt)
+
+    async def _postpone_burst(self, session, job_type: str, conversation_key: str, now: datetime) -> None:
+        """Push back the pending burst of a conversation by the debounce window
+
+        Only bursts younger than ``coalesce_max_wait_seconds`` are postponed.
+        """
+        stmt = (
+            update(SlackJobTable)
+            .where(
+                SlackJobTable.conversation_key == conversation_key,
+                SlackJobTable.job_type == job_type,
+                SlackJobTable.status == JobStatus.PENDING,
+                SlackJobTable.attempts == 0,
+                SlackJobTable.created_at >= now - self._coalesce_max_wait,
+            )
+            .values(available_at=now + self._coalesce_window, updated_at=now)
+        )
+        await session.execute(stmt)
+
+    async def _coalesce(self, session, job: Job, conversation_key: str) -> Job:
+        """Merge later pending jobs of the same conversation into a claimed job
+
+        The merged payload is stored on the claimed row, so a retry replays
+        the whole burst.
+        """
+        stmt = (
+            delete(SlackJobTable)
+            .where(
+                SlackJobTable.conversation_key == conversation_key,
+                SlackJobTable.job_type == job.job_type,
+                SlackJobTable.status == JobStatus.PENDING,
+                SlackJobTable.attempts == 0,
+                SlackJobTable.id > job.id,
+            )
+            .returning(SlackJobTable.id, SlackJobTable.payload)
+        )
+        followers = sorted((await session.execute(stmt)).all(), key=lambda row: row.id)
+        if not followers:
+            return job
+
+        payload = self._payload_mergers[job.job_type]([job.payload, *(row.payload for row in followers)])
+        await session.execute(
+            update(SlackJobTable).where(SlackJobTable.id == job.id).values(payload=payload)
+        )
+        metrics.increment("job_queue.coalesced", len(followers))
+        logger.info(f"Job {job.id} coalesced {len(followers)} later job(s) of {conversation_key}")
+        return Job(
+            id=job.id,
+            job_type=job.job_type,
+            payload=payload,
+            attempts=job.attempts,
+            max_attempts=job.max_attempts,
+            coalesced_ids=tuple(row.id for row in followers),
+        )
+
+    async def _bury_expired_leases(self, session, now: datetime) -> None:
+        """Mark jobs dead whose lease expired on their final attempt"""
+        stmt = (
+            update(SlackJobTable)
+            .where(
+                SlackJobTable.status == JobStatus.RUNNING,
+                SlackJobTable.locked_until < now,
+                SlackJobTable.attempts >= SlackJobTable.max_attempts,
+            )
+            .values(
+                status=JobStatus.DEAD,
+                locked_until=None,
+                last_error="visibility timeout exceeded",
+                updated_at=now,
+            )
+        )
+        result = await session.execute(stmt)
+        if result.rowcount:
+            metrics.increment("job_queue.dead", result.rowcount)
+            logger.error(f"{result.rowcount} job(s) timed out on their final attempt")
@@ -0,0 +1,87 @@
+"""Keyed async executor
+
+Runs coroutines serialized per key (e.g. one conversation = (user_id, channel_id))
+and in parallel across keys, bounded by a global and a per-user semaphore.
+
+Lock order is key lock -> user semaphore -> global semaphore, so a message
+waiting behind an earlier message of the same conversation holds no
+concurrency slot while it waits.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from ..metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+T = TypeVar("T")
+
+
+class KeyedExecutor:
+    """Per-key serialized, globally bounded executor"""
+
+    def __init__(self, max_concurrency: int = 4, max_concurrency_per_user: int = 2):
+        """Initialize executor
+
+        Args:
+            max_concurrency: Maximum coroutines running at once (all keys)
+            max_concurrency_per_user: Maximum coroutines running at once for one user
+        """
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._max_per_user = max_concurrency_per_user
+        # key -> [lock, number of holders/waiters]
+        self._key_locks: dict[Hashable, list] = {}
+        # user_id -> [semaphore, number of holders/waiters]
+        self._user_semaphores: dict[str, list] = {}
+
+    async def run(self, key: Hashable, user_id: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` after all earlier submissions with the same key
+
+        Args:
+            key: Serialization key (submissions with the same key run in order)
+            user_id: User whose per-user limit applies
+            func: Zero-argument coroutine function
+
+        Returns:
+            Result of ``func``
+        """
+        queued_at = time.time()
+        key_entry = self._acquire_entry(self._key_locks, key, asyncio.Lock)
+        user_entry = self._acquire_entry(
+            self._user_semaphores, user_id, lambda: asyncio.Semaphore(self._max_per_user)
+        )
+        try:
+            async with key_entry[0], user_entry[0], self._global:
+                metrics.record_time("keyed_executor_wait_time", (time.time() - queued_at) * 1000)
+                return await func()
+        finally:
+            self._release_entry(self._key_locks, key)
+            self._release_entry(self._user_semaphores, user_id)
+
+    @property
+    def active_keys(self) -> int:
+        """Number of keys with running or waiting submissions"""
+        return len(self._key_locks)
+
+    @staticmethod
+    def _acquire_entry(registry: dict, key: Hashable, factory: Callable) -> list:
+        """Get (or create) a reference-counted primitive for key"""
+        entry = registry.get(key)
+        if entry is None:
+            entry = [factory(), 0]
+            registry[key] = entry
+        entry[1] += 1
+        return entry
+
+    @staticmethod
+    def _release_entry(registry: dict, key: Hashable) -> None:
+        """Drop a reference; forget the primitive when nobody uses it"""
+        entry = registry[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del registry[key]
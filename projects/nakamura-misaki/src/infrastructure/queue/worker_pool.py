@@ -0,0 +1,126 @@
+"""Async worker pool for the durable job queue
+
+A fixed number of worker coroutines poll the queue. The pool size is the
+hard ceiling on concurrent job processing (and therefore on concurrent
+Claude API calls / DB sessions opened by jobs).
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+
+from ..metrics import get_metrics
+from .job_queue import Job, PostgreSQLJobQueue
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+JobHandler = Callable[[Job], Awaitable[None]]
+
+
+class JobWorkerPool:
+    """Pool of async workers consuming ``PostgreSQLJobQueue``"""
+
+    def __init__(
+        self,
+        queue: PostgreSQLJobQueue,
+        handler: JobHandler,
+        concurrency: int = 4,
+        poll_interval_seconds: float = 1.0,
+        shutdown_timeout_seconds: float = 25.0,
+    ):
+        """Initialize worker pool
+
+        Args:
+            queue: Job queue to consume
+            handler: Coroutine called for each claimed job (raise to trigger a retry)
+            concurrency: Number of worker coroutines
+            poll_interval_seconds: Idle poll interval when the queue is empty
+            shutdown_timeout_seconds: Grace period for in-flight jobs on stop()
+        """
+        self._queue = queue
+        self._handler = handler
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval_seconds
+        self._shutdown_timeout = shutdown_timeout_seconds
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    async def start(self) -> None:
+        """Start worker coroutines"""
+        if self._running:
+            logger.warning("Worker pool already running")
+            return
+
+        self._running = True
+        self._tasks = [asyncio.create_task(self._run(index)) for index in range(self._concurrency)]
+        logger.info(f"Job worker pool started (concurrency: {self._concurrency})")
+
+    async def stop(self) -> None:
+        """Stop workers, letting in-flight jobs finish within the grace period
+
+        Jobs still running after the grace period are cancelled; their lease
+        expires and another process picks them up.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        self._wakeup.set()
+        done, pending = await asyncio.wait(self._tasks, timeout=self._shutdown_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"Cancelled {len(pending)} in-flight job(s) at shutdown")
+        self._tasks = []
+        logger.info("Job worker pool stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers (call after enqueueing in this process)"""
+        self._wakeup.set()
+
+    async def _run(self, index: int) -> None:
+        """Worker loop"""
+        worker_id = f"{self._worker_prefix}:{index}"
+        while self._running:
+            try:
+                jobs = await self._queue.dequeue(worker_id, limit=1)
+            except Exception as e:
+                logger.error(f"Failed to dequeue jobs: {e}", exc_info=True)
+                jobs = []
+
+            if not jobs:
+                await self._wait_for_work()
+                continue
+
+            for job in jobs:
+                await self._process(job)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until notified or the poll interval elapses"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _process(self, job: Job) -> None:
+        """Run the handler for one job and record the outcome"""
+        start_time = time.time()
+        try:
+            await self._handler(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.job_type}) failed: {e}", exc_info=True)
+            await self._queue.fail(job, f"{type(e).__name__}: {e}")
+        else:
+            await self._queue.complete(job)
+        finally:
+            metrics.record_time(f"job_processing_time.{job.job_type}", (time.time() - start_time) * 1000)
@@ -0,0 +1,6 @@
+"""Record/replay of Anthropic and Slack API traffic (offline benchmarks)"""
+
+from .cassette import Cassette, Interaction
+from .server import CassetteServer, LatencyModel, ReplayStats
+
+__all__ = ["Cassette", "CassetteServer", "Interaction", "LatencyModel", "ReplayStats"]
@@ -0,0 +1,142 @@
+"""Cassette: recorded HTTP exchanges matched by a normalized request fingerprint
+
+Requests are fingerprinted after masking values that change between runs
+(timestamps, UUIDs, Slack IDs and message ts), so a replay matches the
+recorded exchange even on another day or for another benchmark user. No
+request headers are stored (API keys stay out of cassette files).
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_VOLATILE_PATTERNS = (
+    # ISO / "YYYY-MM-DD HH:MM:SS" timestamps and dates
+    (re.compile(r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?(Z|[+-]\d{2}:\d{2})?"), "<time>"),
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE), "<uuid>"),
+    # Slack message ts and user/channel IDs
+    (re.compile(r"\b\d{10}\.\d{6}\b"), "<ts>"),
+    (re.compile(r"\b[UWCDG][A-Z0-9]{8,}\b"), "<id>"),
+)
+
+
+def normalize_body(body: str) -> str:
+    """Mask run-dependent values of a request body"""
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        body = pattern.sub(replacement, body)
+    return body
+
+
+def fingerprint(method: str, path: str, body: str) -> str:
+    """Stable identity of a request across runs"""
+    digest = hashlib.sha256(f"{method.upper()} {path}\n{normalize_body(body)}".encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair
+
+    Attributes:
+        method: HTTP method
+        path: Request path including the query string
+        request_body: Request body (text)
+        status: Response status code
+        headers: Response headers (hop-by-hop headers removed)
+        body: Response body (text; SSE streams are stored whole)
+        elapsed_ms: Upstream latency when recorded
+        fingerprint: fingerprint(method, path, request_body)
+    """
+
+    method: str
+    path: str
+    request_body: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    elapsed_ms: float = 0.0
+    fingerprint: str = ""
+
+    def __post_init__(self):
+        if not self.fingerprint:
+            self.fingerprint = fingerprint(self.method, self.path, self.request_body)
+
+
+class Cassette:
+    """Ordered list of interactions with replay matching"""
+
+    def __init__(self, interactions: list[Interaction] | None = None):
+        """Initialize cassette
+
+        Args:
+            interactions: Recorded interactions (in recording order)
+        """
+        self.interactions = list(interactions or [])
+        self._used: set[int] = set()
+
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        """Load a cassette file (JSON)"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls([Interaction(**item) for item in data["interactions"]])
+
+    def save(self, path: Path) -> None:
+        """Write the cassette file (JSON)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"interactions": [asdict(interaction) for interaction in self.interactions]}
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def record(self, interaction: Interaction) -> None:
+        self.interactions.append(interaction)
+
+    def rewind(self) -> None:
+        """Mark every interaction unused (start of a new replay run)"""
+        self._used.clear()
+
+    def match(self, method: str, path: str, body: str, strict: bool = True) -> Interaction | None:
+        """Find the recorded response for a request
+
+        Preference order:
+        1. The first unused interaction with the same fingerprint
+        2. The last interaction with the same fingerprint (repeats / concurrent copies)
+        3. Non-strict only: the first unused interaction with the same method and path
+           (recording order)
+        4. Non-strict only: the last interaction with the same method and path
+
+        Args:
+            method: HTTP method
+            path: Request path including the query string
+            body: Request body
+            strict: Only match the fingerprint; a diverged request (e.g. another
+                prompt after a tool error) misses instead of getting a wrong response
+
+        Returns:
+            Interaction, or None on a miss
+        """
+        key = fingerprint(method, path, body)
+        same_request = [i for i, interaction in enumerate(self.interactions) if interaction.fingerprint == key]
+        same_endpoint = [
+            i
+            for i, interaction in enumerate(self.interactions)
+            if interaction.method == method.upper() and interaction.path == path
+        ]
+
+        unused_request = [i for i in same_request if i not in self._used]
+        unused_endpoint = [i for i in same_endpoint if i not in self._used]
+        if unused_request:
+            index = unused_request[0]
+        elif same_request:
+            index = same_request[-1]
+        elif strict:
+            return None
+        elif unused_endpoint:
+            index = unused_endpoint[0]
+        elif same_endpoint:
+            index = same_endpoint[-1]
+        else:
+            return None
+        self._used.add(index)
+        return self.interactions[index]
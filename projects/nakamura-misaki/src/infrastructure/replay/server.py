@@ -0,0 +1,220 @@
+"""Local HTTP server that records API traffic to a cassette or replays it
+
+Point an SDK client's base URL at the server:
+- Record mode (``upstream`` given): requests are forwarded to the real API and
+  every exchange is appended to the cassette
+- Replay mode: responses come from the cassette after an injected delay, so
+  the agent loop runs offline and deterministically
+
+Both the Anthropic SDK (httpx) and slack_sdk's AsyncWebClient (aiohttp) only
+need ``base_url`` changed, so no SDK internals are patched.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from .cassette import Cassette, Interaction
+
+logger = logging.getLogger(__name__)
+
+# Not replayed: recomputed by the server for the stored (decoded) body
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding", "date", "server"}
+)
+# Not forwarded upstream
+_SKIPPED_REQUEST_HEADERS = frozenset({"host", "content-length", "accept-encoding", "connection"})
+
+
+@dataclass
+class LatencyModel:
+    """Injected response delay in replay mode
+
+    delay = recorded latency * scale + extra_ms + uniform(0, jitter_ms)
+
+    Attributes:
+        scale: Multiplier of the recorded upstream latency (0 = no recorded delay)
+        extra_ms: Constant delay added to every response
+        jitter_ms: Upper bound of a seeded random delay
+        seed: Random seed (same seed, same delays)
+    """
+
+    scale: float = 1.0
+    extra_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self):
+        self._random = random.Random(self.seed)
+
+    def delay_seconds(self, interaction: Interaction) -> float:
+        jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (interaction.elapsed_ms * self.scale + self.extra_ms + jitter) / 1000
+
+
+@dataclass
+class ReplayStats:
+    """Traffic seen by a CassetteServer
+
+    Attributes:
+        requests: Requests served
+        misses: Requests without a recorded response (answered 404)
+        input_tokens / output_tokens / cache_read_input_tokens / cache_creation_input_tokens:
+            Anthropic usage summed over the served responses
+    """
+
+    requests: int = 0
+    misses: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+    def add_usage(self, body: str) -> None:
+        """Add the usage of an Anthropic Messages response (JSON or SSE stream)"""
+        for usage in _usages(body):
+            for key in ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens"):
+                setattr(self, key, getattr(self, key) + (usage.get(key) or 0))
+
+
+class CassetteServer:
+    """Records exchanges with ``upstream`` or replays them from the cassette"""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        upstream: str | None = None,
+        latency: LatencyModel | None = None,
+        strict: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize server
+
+        Args:
+            cassette: Cassette to record into / replay from
+            upstream: Real API origin (e.g. "https://api.anthropic.com"); None = replay
+            latency: Replay delay (default: recorded latency)
+            strict: Replay: answer 404 for requests whose fingerprint was not recorded
+                instead of reusing a same-endpoint response (keep True for Anthropic;
+                Slack writes can be lenient)
+            host: Bind address
+            port: Bind port (0 = any free port)
+        """
+        self.cassette = cassette
+        self.stats = ReplayStats()
+        self._upstream = upstream.rstrip("/") if upstream else None
+        self._latency = latency or LatencyModel()
+        self._strict = strict
+        self._host = host
+        self._port = port
+        self._runner: web.AppRunner | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._url = ""
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server (e.g. "http://127.0.0.1:54321")"""
+        return self._url
+
+    async def start(self) -> str:
+        """Start serving
+
+        Returns:
+            Base URL of the server
+        """
+        app = web.Application(client_max_size=32 * 1024**2)
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self._url = f"http://{self._host}:{port}"
+        if self._upstream:
+            self._session = aiohttp.ClientSession()
+        return self._url
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.text()
+        self.stats.requests += 1
+        if self._upstream:
+            interaction = await self._forward(request, body)
+        else:
+            replayed = self.cassette.match(request.method, request.path_qs, body, strict=self._strict)
+            if replayed is None:
+                self.stats.misses += 1
+                logger.warning(f"Cassette miss: {request.method} {request.path_qs}")
+                return web.json_response({"ok": False, "error": "cassette_miss"}, status=404)
+            interaction = replayed
+            await asyncio.sleep(self._latency.delay_seconds(interaction))
+
+        if request.path.endswith("/messages"):
+            self.stats.add_usage(interaction.body)
+        return web.Response(status=interaction.status, headers=interaction.headers, body=interaction.body.encode())
+
+    async def _forward(self, request: web.Request, body: str) -> Interaction:
+        """Send the request upstream and record the exchange"""
+        if self._upstream is None:
+            raise RuntimeError("CassetteServer has no upstream (replay mode)")
+        if self._session is None:
+            raise RuntimeError("CassetteServer.start() has not been called")
+        headers = {key: value for key, value in request.headers.items() if key.lower() not in _SKIPPED_REQUEST_HEADERS}
+        started = time.monotonic()
+        async with self._session.request(
+            request.method, self._upstream + request.path_qs, headers=headers, data=body.encode()
+        ) as response:
+            response_body = await response.text()
+        interaction = Interaction(
+            method=request.method,
+            path=request.path_qs,
+            request_body=body,
+            status=response.status,
+            headers={
+                key: value for key, value in response.headers.items() if key.lower() not in _HOP_BY_HOP_HEADERS
+            },
+            body=response_body,
+            elapsed_ms=(time.monotonic() - started) * 1000,
+        )
+        self.cassette.record(interaction)
+        return interaction
+
+
+def _usages(body: str) -> list[dict[str, Any]]:
+    """usage objects of a Messages response (JSON body or SSE events)"""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        return [data["usage"]] if isinstance(data.get("usage"), dict) else []
+
+    usages = []
+    for line in body.splitlines():
+        if not line.startswith("data:"):
+            continue
+        try:
+            event = json.loads(line[5:])
+        except ValueError:
+            continue
+        if event.get("type") == "message_start":
+            # Output tokens are counted from the (cumulative) message_delta
+            usage = dict(event.get("message", {}).get("usage") or {})
+            usage.pop("output_tokens", None)
+            usages.append(usage)
+        elif event.get("type") == "message_delta":
+            usages.append({"output_tokens": (event.get("usage") or {}).get("output_tokens")})
+    return usages
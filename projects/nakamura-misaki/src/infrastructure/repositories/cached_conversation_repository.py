@@ -0,0 +1,237 @@
+"""In-process cache of hydrated conversations
+
+Every Slack turn loads the user's conversation and saves it back. The cache
+keeps the last committed state of active conversations so a turn needs no
+DB read:
+
+- ConversationCache: LRU keyed by (user_id, channel_id), entries expire at
+  the conversation's ``expires_at`` (the conversation TTL)
+- CachedConversationRepository: ConversationRepository decorator that reads
+  through the cache and writes through to the wrapped repository
+
+Entries are snapshots: ``get`` returns a copy, so a turn that fails after
+mutating its conversation never leaks into the cache, and a save that is
+rolled back evicts its entry.
+
+The cache is per process and nothing invalidates it across processes, so it
+is off by default (CONVERSATION_CACHE_SIZE=0) and must only be enabled when a
+single process serves all conversations. With several processes, a stale
+entry appends messages at positions another process already wrote, and
+ConversationMessageStore drops them. ``add_listener`` / ``invalidate`` are
+the hooks for a cross-process notification (e.g. PostgreSQL LISTEN/NOTIFY).
+"""
+
+import dataclasses
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...contexts.personal_tasks.domain.models.conversation import Conversation
+from ...contexts.personal_tasks.domain.repositories.conversation_repository import ConversationRepository
+from ..database.session_scope import ScopedSession
+from ..metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+CacheKey = tuple[str, str]
+# Called with (user_id, channel_id) whenever this process changes a conversation
+ChangeListener = Callable[[str, str], None]
+
+
+class ConversationCache:
+    """LRU of conversation snapshots keyed by (user_id, channel_id)"""
+
+    def __init__(self, max_size: int = 1000, max_messages: int = 200):
+        """Initialize cache
+
+        Args:
+            max_size: Maximum number of cached conversations (least recently used evicted first)
+            max_messages: Messages kept per entry (the unsummarized tail, as the repository loads it)
+        """
+        self._max_size = max_size
+        self._max_messages = max_messages
+        self._entries: OrderedDict[CacheKey, Conversation] = OrderedDict()
+        self._keys_by_id: dict[UUID, CacheKey] = {}
+        self._listeners: list[ChangeListener] = []
+
+    def get(self, user_id: str, channel_id: str) -> Conversation | None:
+        """Copy of the cached conversation (None if absent or expired)"""
+        key = (user_id, channel_id)
+        conversation = self._entries.get(key)
+        if conversation is None:
+            return None
+        if conversation.is_expired():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return conversation.copy()
+
+    def get_by_id(self, conversation_id: UUID) -> Conversation | None:
+        key = self._keys_by_id.get(conversation_id)
+        return self.get(*key) if key else None
+
+    def put(self, conversation: Conversation) -> None:
+        """Store a snapshot of a persisted conversation"""
+        key = (conversation.user_id, conversation.channel_id)
+        snapshot = self._snapshot(conversation)
+        previous = self._entries.get(key)
+        if previous is not None and previous.id != conversation.id:
+            self._keys_by_id.pop(previous.id, None)
+        elif previous is not None and previous.summarized_count > snapshot.summarized_count:
+            # A background summary stored while this turn ran (save() never writes the summary)
+            snapshot.apply_summary(previous.summary or "", previous.summarized_count)
+            snapshot = self._snapshot(snapshot)
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        self._keys_by_id[conversation.id] = key
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def apply_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> None:
+        """Reflect a stored rolling summary in the cached snapshot"""
+        key = self._keys_by_id.get(conversation_id)
+        if key is None:
+            return
+        conversation = self._entries.get(key)
+        if conversation is None or summarized_count <= conversation.summarized_count:
+            return
+        if summarized_count > conversation.message_count:
+            self._remove(key)
+            return
+        conversation.apply_summary(summary, summarized_count)
+        self._entries[key] = self._snapshot(conversation)
+
+    def invalidate(self, user_id: str, channel_id: str) -> None:
+        """Drop an entry (e.g. on a change notification from another process)"""
+        self._remove((user_id, channel_id))
+
+    def invalidate_id(self, conversation_id: UUID) -> None:
+        key = self._keys_by_id.get(conversation_id)
+        if key:
+            self._remove(key)
+
+    def evict_expired(self) -> int:
+        """Drop expired entries
+
+        Returns:
+            Number of entries dropped
+        """
+        expired = [key for key, conversation in self._entries.items() if conversation.is_expired()]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """Register a callback for conversations changed by this process"""
+        self._listeners.append(listener)
+
+    def notify_changed(self, user_id: str, channel_id: str) -> None:
+        for listener in self._listeners:
+            try:
+                listener(user_id, channel_id)
+            except Exception as e:
+                logger.warning(f"Conversation cache listener failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: CacheKey) -> None:
+        conversation = self._entries.pop(key, None)
+        if conversation is not None:
+            self._keys_by_id.pop(conversation.id, None)
+
+    def _snapshot(self, conversation: Conversation) -> Conversation:
+        """Copy keeping only the messages the repository would load"""
+        start = max(conversation.summarized_count, conversation.message_count - self._max_messages)
+        start = max(start, conversation.message_offset)
+        return dataclasses.replace(
+            conversation,
+            messages=conversation.messages_between(start, conversation.message_count),
+            message_offset=start,
+        )
+
+
+class CachedConversationRepository(ConversationRepository):
+    """ConversationRepository reading through a ConversationCache
+
+    Reads of cached, unexpired conversations skip the wrapped repository;
+    writes go to the wrapped repository first, then update the cache.
+    """
+
+    def __init__(
+        self,
+        repository: ConversationRepository,
+        cache: ConversationCache,
+        session: AsyncSession | ScopedSession,
+    ):
+        """Initialize repository
+
+        Args:
+            repository: Repository that persists conversations
+            cache: Shared cache
+            session: Session of ``repository`` (a rollback evicts the entries written in it)
+        """
+        self._repository = repository
+        self._cache = cache
+        self._session = session
+
+    async def save(self, conversation: Conversation) -> None:
+        await self._repository.save(conversation)
+        self._cache.put(conversation)
+        self._evict_on_rollback(conversation.id)
+        self._cache.notify_changed(conversation.user_id, conversation.channel_id)
+
+    async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
+        cached = self._cache.get_by_id(conversation_id)
+        if cached is not None:
+            metrics.increment("conversation_cache.hits")
+            return cached
+        metrics.increment("conversation_cache.misses")
+        conversation = await self._repository.get_by_id(conversation_id)
+        if conversation is not None:
+            self._cache.put(conversation)
+        return conversation
+
+    async def get_by_user_and_channel(self, user_id: str, channel_id: str) -> Conversation | None:
+        cached = self._cache.get(user_id, channel_id)
+        if cached is not None:
+            metrics.increment("conversation_cache.hits")
+            return cached
+        metrics.increment("conversation_cache.misses")
+        conversation = await self._repository.get_by_user_and_channel(user_id, channel_id)
+        if conversation is not None:
+            self._cache.put(conversation)
+        return conversation
+
+    async def save_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> bool:
+        saved = await self._repository.save_summary(conversation_id, summary, summarized_count)
+        if saved:
+            self._cache.apply_summary(conversation_id, summary, summarized_count)
+            self._evict_on_rollback(conversation_id)
+        return saved
+
+    async def delete(self, conversation_id: UUID) -> None:
+        self._cache.invalidate_id(conversation_id)
+        await self._repository.delete(conversation_id)
+
+    async def delete_expired(self, limit: int | None = None) -> int:
+        self._cache.evict_expired()
+        return await self._repository.delete_expired(limit)
+
+    def _evict_on_rollback(self, conversation_id: UUID) -> None:
+        """Drop the entry again if the write's transaction is rolled back"""
+        event.listen(
+            self._session.sync_session,
+            "after_soft_rollback",
+            lambda session, previous_transaction: self._cache.invalidate_id(conversation_id),
+            once=True,
+        )
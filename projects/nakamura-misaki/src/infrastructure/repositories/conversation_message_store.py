@@ -0,0 +1,90 @@
+"""Append-only storage of conversation messages (conversation_messages table)
+
+Shared by the conversation repositories of both contexts: each turn inserts
+only the messages added since the last save, and reads load a bounded tail.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.schema import ConversationMessageTable
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.database.upsert import on_conflict_insert
+
+
+class StoredMessage(Protocol):
+    """Message fields persisted per row (both contexts' Message value objects match)"""
+
+    role: str
+    content: str
+    timestamp: datetime
+
+
+class ConversationMessageStore:
+    """Appends and reads conversation message rows"""
+
+    def __init__(self, session: AsyncSession | ScopedSession):
+        self._session = session
+
+    async def append(self, conversation_id: UUID, first_seq: int, messages: Sequence[StoredMessage]) -> None:
+        """Insert messages as seq first_seq, first_seq + 1, ...
+
+        Seqs that are already stored are skipped (ON CONFLICT DO NOTHING).
+
+        Args:
+            conversation_id: Conversation ID
+            first_seq: Seq of messages[0] (the stored message count)
+            messages: New messages only
+        """
+        if not messages:
+            return
+        dialect_insert = on_conflict_insert(self._session)
+        stmt = (
+            dialect_insert(ConversationMessageTable).on_conflict_do_nothing()
+            if dialect_insert
+            else insert(ConversationMessageTable)
+        )
+        await self._session.execute(
+            stmt,
+            [
+                {
+                    "conversation_id": conversation_id,
+                    "seq": first_seq + i,
+                    "role": message.role,
+                    "content": message.content,
+                    "created_at": message.timestamp,
+                }
+                for i, message in enumerate(messages)
+            ],
+        )
+
+    async def load_tail(
+        self, conversation_id: UUID, from_seq: int = 0, limit: int | None = None
+    ) -> list[ConversationMessageTable]:
+        """Load messages with seq >= from_seq, at most the last ``limit`` of them
+
+        Args:
+            conversation_id: Conversation ID
+            from_seq: First seq of interest (e.g. the first unsummarized message)
+            limit: Maximum rows (None = all)
+
+        Returns:
+            Rows in seq order
+        """
+        stmt = (
+            select(ConversationMessageTable)
+            .where(
+                ConversationMessageTable.conversation_id == conversation_id,
+                ConversationMessageTable.seq >= from_seq,
+            )
+            .order_by(ConversationMessageTable.seq.desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return list(reversed(result.scalars().all()))
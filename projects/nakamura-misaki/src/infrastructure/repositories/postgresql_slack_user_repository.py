@@ -3,7 +3,8 @@
 from datetime import datetime
 
 from sqlalchemy import Boolean, DateTime, String, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -34,6 +35,7 @@ class SlackUserModel(Base):
     synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
 class PostgreSQLSlackUserRepository(SlackUserRepository):
@@ -47,14 +49,20 @@ class PostgreSQLSlackUserRepository(SlackUserRepository):
         """
         self.session = session
 
-    async def save_all(self, users: list[SlackUser]) -> None:
+    async def save_all(self, users: list[SlackUser]) -> int:
         """Save or update multiple users (upsert)
 
+        Rows whose ``content_hash`` is unchanged are left untouched, so
+        re-syncing an unchanged roster writes nothing.
+
         Args:
-            users: List of SlackUser domain entities to save
+            users: List of SlackUser domain entities to save (one batch)
+
+        Returns:
+            Number of rows inserted or updated
         """
         if not users:
-            return
+            return 0
 
         # Convert domain entities to dictionaries for bulk upsert
         user_dicts = [
@@ -71,11 +79,13 @@ class PostgreSQLSlackUserRepository(SlackUserRepository):
                 "synced_at": user.synced_at,
                 "created_at": user.created_at,
                 "updated_at": user.updated_at,
+                "content_hash": user.content_hash,
             }
             for user in users
         ]
 
-        # PostgreSQL upsert using ON CONFLICT DO UPDATE
+        # Upsert using ON CONFLICT DO UPDATE, skipping unchanged rows
+        insert = pg_insert if self.session.bind.dialect.name == "postgresql" else sqlite_insert
         stmt = insert(SlackUserModel).values(user_dicts)
         stmt = stmt.on_conflict_do_update(
             index_elements=["user_id"],
@@ -90,10 +100,13 @@ class PostgreSQLSlackUserRepository(SlackUserRepository):
                 "slack_created_at": stmt.excluded.slack_created_at,
                 "synced_at": stmt.excluded.synced_at,
                 "updated_at": stmt.excluded.updated_at,
+                "content_hash": stmt.excluded.content_hash,
             },
-        )
+            where=SlackUserModel.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        ).returning(SlackUserModel.user_id)
 
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt)
+        return len(result.all())
 
     async def find_all_active(self) -> list[SlackUser]:
         """Find all non-deleted users
@@ -0,0 +1,238 @@
+"""Write-behind persistence of conversations
+
+The assistant reply is ready before the conversation is saved. In write-behind
+mode the save only enqueues a snapshot, so the Slack reply no longer waits
+for the conversation write and its commit:
+
+- ConversationWriteBehind: per-process flusher. Keeps the latest snapshot per
+  conversation and saves pending snapshots in batches (one unit of work per
+  batch) a few milliseconds after they are enqueued
+- WriteBehindConversationRepository: ConversationRepository decorator whose
+  ``save`` enqueues; reads return a pending snapshot before the wrapped
+  repository, so the next turn sees the previous one even if it is not
+  flushed yet
+
+A conversation has at most one snapshot pending and one being written, and
+the single flusher task saves them in enqueue order, so writes of a
+conversation are never reordered. A newer snapshot contains every message of
+the older ones, so a failed batch is retried only for conversations that
+have not been enqueued again since.
+
+Durability trade-off: snapshots that are not flushed when the process dies
+are lost (the reply was already sent). ``close()`` flushes everything on
+shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from ...contexts.personal_tasks.domain.models.conversation import Conversation
+from ...contexts.personal_tasks.domain.repositories.conversation_repository import ConversationRepository
+from ..metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+
+@dataclass
+class _PendingWrite:
+    repository: ConversationRepository
+    conversation: Conversation
+    attempts: int = 0
+
+
+class ConversationWriteBehind:
+    """Batches conversation saves off the reply path"""
+
+    def __init__(
+        self,
+        unit_of_work: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+        flush_interval_seconds: float = 0.005,
+        max_batch_size: int = 100,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 0.5,
+    ):
+        """Initialize flusher
+
+        Args:
+            unit_of_work: Opens the DB scope of a batch (e.g. DatabaseManager.request_scope)
+            flush_interval_seconds: Time snapshots are collected before a batch is written
+            max_batch_size: Conversations saved per batch
+            max_attempts: Failed batches a snapshot is retried in before it is dropped
+            retry_delay_seconds: Pause after a failed batch
+        """
+        self._unit_of_work = unit_of_work or nullcontext
+        self._flush_interval = flush_interval_seconds
+        self._max_batch_size = max_batch_size
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay_seconds
+        self._pending: OrderedDict[UUID, _PendingWrite] = OrderedDict()
+        self._in_flight: dict[UUID, _PendingWrite] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def enqueue(self, repository: ConversationRepository, conversation: Conversation) -> None:
+        """Queue a snapshot of the conversation to be saved with ``repository``
+
+        Raises:
+            RuntimeError: After ``close()``
+        """
+        if self._closing:
+            raise RuntimeError("ConversationWriteBehind is closed")
+        superseded = self._pending.pop(conversation.id, None)
+        self._pending[conversation.id] = _PendingWrite(repository, conversation.copy())
+        metrics.increment("conversation_write_behind.coalesced" if superseded else "conversation_write_behind.enqueued")
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def get(self, conversation_id: UUID) -> Conversation | None:
+        """Copy of the newest unsaved snapshot (None if everything is flushed)"""
+        write = self._pending.get(conversation_id) or self._in_flight.get(conversation_id)
+        return write.conversation.copy() if write else None
+
+    def find(self, user_id: str, channel_id: str) -> Conversation | None:
+        """Copy of the newest unsaved snapshot of (user_id, channel_id)"""
+        for writes in (reversed(self._pending.values()), self._in_flight.values()):
+            for write in writes:
+                conversation = write.conversation
+                if conversation.user_id == user_id and conversation.channel_id == channel_id:
+                    return conversation.copy()
+        return None
+
+    def apply_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> None:
+        """Reflect a stored rolling summary in unsaved snapshots"""
+        for write in (self._pending.get(conversation_id), self._in_flight.get(conversation_id)):
+            if write is None:
+                continue
+            conversation = write.conversation
+            if conversation.summarized_count < summarized_count <= conversation.message_count:
+                conversation.apply_summary(summary, summarized_count)
+
+    def discard(self, conversation_id: UUID) -> None:
+        """Drop a pending snapshot (e.g. the conversation is deleted)"""
+        self._pending.pop(conversation_id, None)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._in_flight)
+
+    async def close(self, timeout_seconds: float = 10.0) -> None:
+        """Flush every pending snapshot (up to ``timeout_seconds``) and stop"""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout_seconds)
+        except TimeoutError:
+            logger.error(f"Conversation write-behind did not flush in time; {self.pending_count} conversations lost")
+            metrics.increment("conversation_write_behind.dropped", self.pending_count)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if not self._closing:
+                # Collect the saves of concurrent turns into one batch
+                await asyncio.sleep(self._flush_interval)
+            if not await self._flush_batch():
+                await asyncio.sleep(self._retry_delay)
+
+    async def _flush_batch(self) -> bool:
+        """Save up to ``max_batch_size`` pending snapshots in one unit of work
+
+        Returns:
+            False if the batch failed (its snapshots are queued again)
+        """
+        batch: list[_PendingWrite] = []
+        while self._pending and len(batch) < self._max_batch_size:
+            conversation_id, write = self._pending.popitem(last=False)
+            self._in_flight[conversation_id] = write
+            batch.append(write)
+
+        started = time.perf_counter()
+        try:
+            async with self._unit_of_work():
+                for write in batch:
+                    # save() records what it persisted on the entity; keep the snapshot as enqueued for retries
+                    await write.repository.save(write.conversation.copy())
+        except Exception as e:
+            metrics.increment("conversation_write_behind.failed")
+            logger.error(f"Conversation write-behind batch of {len(batch)} failed: {e}", exc_info=True)
+            for write in batch:
+                self._retry(write)
+            return False
+        finally:
+            for write in batch:
+                self._in_flight.pop(write.conversation.id, None)
+
+        metrics.increment("conversation_write_behind.flushed", len(batch))
+        metrics.record_time("conversation_write_behind_flush_time", (time.perf_counter() - started) * 1000)
+        return True
+
+    def _retry(self, write: _PendingWrite) -> None:
+        conversation_id = write.conversation.id
+        if conversation_id in self._pending:
+            return  # a newer snapshot (containing these messages) is already queued
+        write.attempts += 1
+        if write.attempts >= self._max_attempts:
+            logger.error(f"Dropping conversation {conversation_id} after {write.attempts} failed flushes")
+            metrics.increment("conversation_write_behind.dropped")
+            return
+        self._pending[conversation_id] = write
+        self._pending.move_to_end(conversation_id, last=False)
+
+
+class WriteBehindConversationRepository(ConversationRepository):
+    """ConversationRepository whose saves are flushed by a ConversationWriteBehind"""
+
+    def __init__(self, repository: ConversationRepository, write_behind: ConversationWriteBehind):
+        """Initialize repository
+
+        Args:
+            repository: Repository that persists conversations (used by the flusher)
+            write_behind: Shared flusher
+        """
+        self._repository = repository
+        self._write_behind = write_behind
+
+    async def save(self, conversation: Conversation) -> None:
+        self._write_behind.enqueue(self._repository, conversation)
+
+    async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
+        pending = self._write_behind.get(conversation_id)
+        if pending is not None:
+            return pending
+        return await self._repository.get_by_id(conversation_id)
+
+    async def get_by_user_and_channel(self, user_id: str, channel_id: str) -> Conversation | None:
+        pending = self._write_behind.find(user_id, channel_id)
+        if pending is not None:
+            return pending
+        return await self._repository.get_by_user_and_channel(user_id, channel_id)
+
+    async def save_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> bool:
+        saved = await self._repository.save_summary(conversation_id, summary, summarized_count)
+        if saved:
+            self._write_behind.apply_summary(conversation_id, summary, summarized_count)
+        return saved
+
+    async def delete(self, conversation_id: UUID) -> None:
+        self._write_behind.discard(conversation_id)
+        await self._repository.delete(conversation_id)
+
+    async def delete_expired(self, limit: int | None = None) -> int:
+        return await self._repository.delete_expired(limit)
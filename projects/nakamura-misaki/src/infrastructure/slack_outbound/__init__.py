@@ -0,0 +1,7 @@
+"""Rate-limited outbound Slack delivery package"""
+
+from .sender import SlackOutboundSender
+from .streaming_reply import StreamingReply
+from .token_bucket import TokenBucket
+
+__all__ = ["SlackOutboundSender", "StreamingReply", "TokenBucket"]
@@ -0,0 +1,247 @@
+"""Central rate-limited Slack sender
+
+Every outbound Slack Web API write goes through ``SlackOutboundSender``:
+- Per-method token buckets (Slack rate-limit tiers) plus a per-channel bucket
+  for message posting (Slack allows roughly one message per second per channel)
+- HTTP 429 pauses the method bucket for Retry-After
+- Rate-limited or transiently failed calls move to a bounded retry queue that
+  a background task drains, so the caller never blocks on Slack's backoff
+- Delivery metrics (sent / rate_limited / retried / dropped / failed, latency)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import aiohttp
+from slack_sdk.errors import SlackApiError, SlackClientError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from ..metrics import get_metrics
+from .token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+# Sustained calls per second per method (Slack tiers: Tier 2 = 20/min, Tier 3 = 50/min)
+DEFAULT_METHOD_RATES: dict[str, float] = {
+    "chat.postMessage": 5.0,
+    "chat.update": 0.8,
+    "chat.delete": 0.8,
+    "reactions.add": 0.8,
+    "conversations.open": 0.8,
+}
+# Fallback for methods not listed above (Tier 2)
+DEFAULT_RATE = 0.3
+
+# Methods additionally limited per channel
+PER_CHANNEL_METHODS = frozenset({"chat.postMessage"})
+
+
+class _RetryableError(Exception):
+    """A call that may succeed if retried after ``retry_after`` seconds"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class SlackOutboundSender:
+    """Rate-limited outbound Slack Web API sender"""
+
+    def __init__(
+        self,
+        client: AsyncWebClient,
+        method_rates: dict[str, float] | None = None,
+        channel_rate: float = 1.0,
+        channel_burst: float = 3.0,
+        max_retries: int = 3,
+        retry_queue_size: int = 100,
+        default_retry_after_seconds: float = 1.0,
+        max_channel_buckets: int = 1000,
+    ):
+        """Initialize sender
+
+        Args:
+            client: Slack AsyncWebClient
+            method_rates: Calls per second per method (overrides DEFAULT_METHOD_RATES)
+            channel_rate: Messages per second per channel
+            channel_burst: Burst size per channel
+            max_retries: Retries per call before it is dropped
+            retry_queue_size: Capacity of the retry queue (calls beyond it are dropped)
+            default_retry_after_seconds: Delay when Slack gives no Retry-After / on transport errors
+            max_channel_buckets: Idle per-channel buckets are forgotten beyond this count
+        """
+        self._client = client
+        self._method_rates = {**DEFAULT_METHOD_RATES, **(method_rates or {})}
+        self._channel_rate = channel_rate
+        self._channel_burst = channel_burst
+        self._max_retries = max_retries
+        self._default_retry_after = default_retry_after_seconds
+        self._max_channel_buckets = max_channel_buckets
+        self._method_buckets: dict[str, TokenBucket] = {}
+        self._channel_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._retry_queue: asyncio.Queue = asyncio.Queue(maxsize=retry_queue_size)
+        self._retry_task: asyncio.Task | None = None
+
+    async def post_message(
+        self, channel: str, text: str, retry: bool = True, **kwargs: Any
+    ) -> dict[str, Any] | None:
+        """Post a message (chat.postMessage)
+
+        Returns:
+            Slack response data, or None if delivery was deferred (or skipped)
+        """
+        return await self.call("chat.postMessage", retry=retry, channel=channel, text=text, **kwargs)
+
+    async def call(self, method: str, retry: bool = True, **kwargs: Any) -> dict[str, Any] | None:
+        """Call a Slack Web API method under the rate limits
+
+        Args:
+            method: Slack API method (e.g. "chat.postMessage")
+            retry: Defer rate-limited/transient failures to the retry queue.
+                False for disposable calls (placeholders, progress updates),
+                which are skipped instead.
+            **kwargs: Method arguments
+
+        Returns:
+            Slack response data, or None if delivery was deferred (or skipped)
+
+        Raises:
+            SlackApiError: Non-retryable Slack error (e.g. channel_not_found)
+            SlackClientError: Response body is not JSON
+        """
+        try:
+            return await self._send(method, kwargs)
+        except _RetryableError as e:
+            if retry:
+                self._schedule_retry(method, kwargs, attempt=1, retry_after=e.retry_after)
+            else:
+                metrics.increment(f"slack_outbound.skipped.{method}")
+            return None
+
+    @property
+    def pending_retries(self) -> int:
+        """Number of calls waiting in the retry queue"""
+        return self._retry_queue.qsize()
+
+    async def close(self, timeout_seconds: float = 10.0) -> None:
+        """Drain the retry queue (up to ``timeout_seconds``) and stop the retry task"""
+        if self._retry_task is None:
+            return
+        try:
+            await asyncio.wait_for(self._retry_queue.join(), timeout=timeout_seconds)
+        except TimeoutError:
+            logger.warning(f"Dropping {self._retry_queue.qsize()} undelivered Slack call(s) at shutdown")
+            metrics.increment("slack_outbound.dropped", self._retry_queue.qsize())
+        self._retry_task.cancel()
+        try:
+            await self._retry_task
+        except asyncio.CancelledError:
+            pass
+        self._retry_task = None
+
+    async def _send(self, method: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Acquire rate-limit tokens and perform one API call"""
+        started = time.time()
+        bucket = self._method_bucket(method)
+        await bucket.acquire()
+        channel = kwargs.get("channel")
+        if channel and method in PER_CHANNEL_METHODS:
+            await self._channel_bucket(channel).acquire()
+
+        try:
+            response = await self._client.api_call(method, json=kwargs)
+        except SlackApiError as e:
+            status = e.response.status_code
+            if status == 429:
+                retry_after = self._retry_after(e.response.headers)
+                bucket.pause(retry_after)
+                metrics.increment(f"slack_outbound.rate_limited.{method}")
+                logger.warning(f"Slack {method} rate limited, retry after {retry_after}s")
+                raise _RetryableError(retry_after) from e
+            if status >= 500:
+                raise _RetryableError(self._default_retry_after) from e
+            metrics.increment(f"slack_outbound.failed.{method}")
+            raise
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.warning(f"Slack {method} transport error: {e!r}")
+            raise _RetryableError(self._default_retry_after) from e
+
+        if not isinstance(response.data, dict):
+            metrics.increment(f"slack_outbound.failed.{method}")
+            raise SlackClientError(f"Slack {method} returned a non-JSON response (HTTP {response.status_code})")
+
+        metrics.increment(f"slack_outbound.sent.{method}")
+        metrics.record_time(f"slack_outbound_latency.{method}", (time.time() - started) * 1000)
+        return response.data
+
+    def _schedule_retry(self, method: str, kwargs: dict[str, Any], attempt: int, retry_after: float) -> None:
+        """Put a call on the bounded retry queue (drop it when full or exhausted)"""
+        if attempt > self._max_retries:
+            metrics.increment("slack_outbound.dropped")
+            logger.error(f"Dropping Slack {method} after {self._max_retries} retries")
+            return
+        try:
+            self._retry_queue.put_nowait((method, kwargs, attempt, time.monotonic() + retry_after))
+        except asyncio.QueueFull:
+            metrics.increment("slack_outbound.dropped")
+            logger.error(f"Slack retry queue full, dropping {method}")
+            return
+        metrics.increment("slack_outbound.retried")
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self._drain_retries())
+
+    async def _drain_retries(self) -> None:
+        """Background task: re-send queued calls once their delay has passed"""
+        while True:
+            method, kwargs, attempt, not_before = await self._retry_queue.get()
+            try:
+                delay = not_before - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self._send(method, kwargs)
+            except _RetryableError as e:
+                self._schedule_retry(method, kwargs, attempt + 1, e.retry_after)
+            except Exception as e:
+                logger.error(f"Slack {method} retry failed: {e}")
+            finally:
+                self._retry_queue.task_done()
+
+    def _method_bucket(self, method: str) -> TokenBucket:
+        bucket = self._method_buckets.get(method)
+        if bucket is None:
+            rate = self._method_rates.get(method, DEFAULT_RATE)
+            bucket = TokenBucket(rate, capacity=max(1.0, rate))
+            self._method_buckets[method] = bucket
+        return bucket
+
+    def _channel_bucket(self, channel: str) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel)
+        if bucket is None:
+            bucket = TokenBucket(self._channel_rate, capacity=self._channel_burst)
+            self._channel_buckets[channel] = bucket
+            if len(self._channel_buckets) > self._max_channel_buckets:
+                self._evict_idle_channel_buckets()
+        else:
+            self._channel_buckets.move_to_end(channel)
+        return bucket
+
+    def _evict_idle_channel_buckets(self) -> None:
+        for channel in list(self._channel_buckets):
+            if len(self._channel_buckets) <= self._max_channel_buckets:
+                break
+            if self._channel_buckets[channel].idle:
+                del self._channel_buckets[channel]
+
+    def _retry_after(self, headers: Any) -> float:
+        """Retry-After header in seconds (headers may be a plain dict or case-insensitive)"""
+        value = None
+        if headers:
+            value = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            return float(value) if value is not None else self._default_retry_after
+        except ValueError:
+            return self._default_retry_after
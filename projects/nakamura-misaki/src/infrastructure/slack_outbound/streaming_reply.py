@@ -0,0 +1,122 @@
+"""Progressive Slack reply for streamed Claude output
+
+Posts a placeholder right away, then edits it with ``chat.update`` as text
+arrives. Updates are throttled and never block the token stream: at most
+one update is in flight, and updates arriving meanwhile are coalesced.
+"""
+
+import asyncio
+import logging
+import time
+
+from slack_sdk.errors import SlackApiError
+
+from ..metrics import get_metrics
+from .sender import SlackOutboundSender
+
+logger = logging.getLogger(__name__)
+metrics = get_metrics()
+
+
+class StreamingReply:
+    """A Slack message that is updated while the reply is generated"""
+
+    def __init__(
+        self,
+        sender: SlackOutboundSender,
+        channel: str,
+        placeholder: str = "…",
+        min_update_interval_seconds: float = 1.0,
+    ):
+        """Initialize reply
+
+        Args:
+            sender: SlackOutboundSender
+            channel: Channel to reply in
+            placeholder: Text shown until the first tokens arrive
+            min_update_interval_seconds: Minimum gap between chat.update calls
+        """
+        self._sender = sender
+        self._channel = channel
+        self._placeholder = placeholder
+        self._min_interval = min_update_interval_seconds
+        self._ts: str | None = None
+        self._text = ""
+        self._last_update = 0.0
+        self._started_at = 0.0
+        self._first_text_recorded = False
+        self._update_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Post the placeholder (skipped if Slack is rate limiting)"""
+        self._started_at = time.time()
+        data = await self._sender.post_message(self._channel, self._placeholder, retry=False)
+        self._ts = data.get("ts") if data else None
+
+    async def append(self, delta: str) -> None:
+        """Add streamed text; schedules a throttled update
+
+        Args:
+            delta: Text delta from the model stream (agent-loop rounds arrive newline-separated)
+        """
+        self._text += delta
+        if self._ts is None or not self._text.strip():
+            return
+        if self._update_task is not None and not self._update_task.done():
+            return
+        if time.time() - self._last_update < self._min_interval:
+            return
+        self._last_update = time.time()
+        self._update_task = asyncio.create_task(self._update(self._text))
+
+    async def finish(self, text: str) -> None:
+        """Show the final text (or remove the placeholder if there is none)
+
+        Text already streamed (e.g. a preamble before tool calls) stays
+        visible: the final message is the streamed text, followed by ``text``
+        if it was not part of the stream.
+
+        Args:
+            text: Final reply text
+        """
+        await self._wait_for_update()
+        streamed = self._text.strip()
+        if streamed:
+            text = streamed if text.strip() in streamed else f"{streamed}\n{text}"
+        if self._ts is None:
+            # Placeholder was never posted: fall back to a normal message
+            if text:
+                await self._sender.post_message(self._channel, text, unfurl_links=False, unfurl_media=False)
+            return
+        if text:
+            await self._sender.call("chat.update", channel=self._channel, ts=self._ts, text=text)
+            self._record_first_text()
+        else:
+            await self._sender.call("chat.delete", channel=self._channel, ts=self._ts)
+
+    async def abort(self) -> None:
+        """Remove the placeholder after a failure (best effort)"""
+        await self._wait_for_update()
+        if self._ts is None:
+            return
+        try:
+            await self._sender.call("chat.delete", retry=False, channel=self._channel, ts=self._ts)
+        except SlackApiError as e:
+            logger.warning(f"Failed to delete placeholder: {e}")
+
+    async def _update(self, text: str) -> None:
+        try:
+            if await self._sender.call("chat.update", retry=False, channel=self._channel, ts=self._ts, text=text):
+                self._record_first_text()
+        except SlackApiError as e:
+            logger.warning(f"Progressive update failed: {e}")
+
+    async def _wait_for_update(self) -> None:
+        if self._update_task is not None:
+            await self._update_task
+            self._update_task = None
+
+    def _record_first_text(self) -> None:
+        if not self._first_text_recorded:
+            self._first_text_recorded = True
+            metrics.record_time("slack_reply_time_to_first_text", (time.time() - self._started_at) * 1000)
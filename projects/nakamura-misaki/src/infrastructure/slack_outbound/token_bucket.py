@@ -0,0 +1,63 @@
+"""Async token bucket rate limiter"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket: ``rate`` tokens per second, bursts up to ``capacity``
+
+    Waiters are served in FIFO order. ``pause()`` blocks the bucket entirely,
+    e.g. for the Retry-After period of a 429 response.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize bucket
+
+        Args:
+            rate: Refill rate in tokens per second
+            capacity: Maximum burst size
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Take one token, waiting until one is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self._rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Block the bucket for ``seconds`` and drop accumulated burst tokens"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    @property
+    def idle(self) -> bool:
+        """True if the bucket is full and not paused (safe to forget)"""
+        now = time.monotonic()
+        self._refill(now)
+        return not self._lock.locked() and now >= self._blocked_until and self._tokens >= self._capacity
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
@@ -7,6 +7,7 @@ Feature: Database caching for Slack users with periodic background sync.
 
 import asyncio
 from contextlib import asynccontextmanager
+from functools import partial
 
 import uvicorn
 from fastapi import FastAPI
@@ -14,13 +15,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from slack_sdk.web.async_client import AsyncWebClient
 
 from .adapters.primary.api.routes import router
-from .adapters.primary.dependencies import get_slack_adapter
+from .adapters.primary.api.routes.slack import SLACK_MESSAGE_JOB, merge_message_payloads, process_message_job
 from .adapters.secondary.slack_adapter import SlackAdapter
 from .domain.services.slack_user_sync_service import SlackUserSyncService
 from .infrastructure.config import AppConfig
 from .infrastructure.database.manager import DatabaseManager
+from .infrastructure.dedup import InMemoryEventDedupStore, PostgreSQLEventDedupStore
+from .infrastructure.di import (
+    create_anthropic_client,
+    create_conversation_cleanup_job,
+    create_slack_event_handler,
+)
 from .infrastructure.logging import setup_logging
+from .infrastructure.queue import JobWorkerPool, KeyedExecutor, PostgreSQLJobQueue
 from .infrastructure.repositories.postgresql_slack_user_repository import PostgreSQLSlackUserRepository
+from .infrastructure.slack_outbound import SlackOutboundSender
 
 # Load configuration
 config = AppConfig.from_env()
@@ -30,7 +39,7 @@ config.validate()
 setup_logging(debug=config.debug)
 
 
-async def _periodic_user_sync(db_manager: DatabaseManager, slack_token: str) -> None:
+async def _periodic_user_sync(db_manager: DatabaseManager, slack_adapter: SlackAdapter) -> None:
     """Background task: Sync Slack users every hour"""
     sync_interval = 3600  # 1 hour in seconds
 
@@ -38,7 +47,6 @@ async def _periodic_user_sync(db_manager: DatabaseManager, slack_token: str) ->
         try:
             print("🔄 Starting periodic Slack user sync...")
             async with db_manager.session() as session:
-                slack_adapter = SlackAdapter(token=slack_token)
                 slack_user_repo = PostgreSQLSlackUserRepository(session)
                 sync_service = SlackUserSyncService(slack_adapter, slack_user_repo)
 
@@ -73,21 +81,71 @@ async def lifespan(app: FastAPI):
     app.state.db_manager = db_manager
 
     # Initialize Slack client
-    slack_client = AsyncWebClient(token=config.slack_bot_token)
+    slack_client = AsyncWebClient(token=config.slack_bot_token, base_url=config.slack_api_base_url)
     app.state.slack_client = slack_client
 
+    # Central rate-limited sender for every outbound Slack post
+    slack_sender = SlackOutboundSender(slack_client)
+    app.state.slack_sender = slack_sender
+
+    # Shared pooled Slack Web API adapter (DND / user sync)
+    slack_adapter = SlackAdapter(token=config.slack_bot_token)
+    app.state.slack_adapter = slack_adapter
+
+    # Shared Anthropic client (concurrency cap, jittered retries, circuit breaker)
+    anthropic_client = create_anthropic_client(config)
+
+    # Application graph built once; repositories use the session bound per job
+    app.state.slack_event_handler, conversation_summarizer, conversation_write_behind = create_slack_event_handler(
+        config, db_manager, slack_client, anthropic_client
+    )
+
     # Initialize app.state with configuration (for routes)
     app.state.slack_signing_secret = config.slack_signing_secret
     app.state.slack_token = config.slack_bot_token
     app.state.anthropic_api_key = config.anthropic_api_key
     app.state.database_url = config.database_url
     app.state.conversation_ttl_hours = config.conversation_ttl_hours
+    app.state.slack_streaming_replies = config.slack_streaming_replies
+    app.state.slack_stream_update_interval_seconds = config.slack_stream_update_interval_ms / 1000
+
+    # Slack event deduplication (Slack retries the same event_id on slow acks)
+    if config.event_dedup_backend == "postgres":
+        app.state.event_dedup_store = PostgreSQLEventDedupStore(db_manager, ttl_seconds=config.event_dedup_ttl_seconds)
+    else:
+        app.state.event_dedup_store = InMemoryEventDedupStore(ttl_seconds=config.event_dedup_ttl_seconds)
 
     print("✅ Application state initialized")
 
+    # Start durable job queue workers (Slack message processing)
+    job_queue = PostgreSQLJobQueue(
+        db_manager,
+        visibility_timeout_seconds=config.job_visibility_timeout_seconds,
+        max_attempts=config.job_max_attempts,
+        payload_mergers={SLACK_MESSAGE_JOB: merge_message_payloads},
+        coalesce_window_seconds=config.message_coalesce_window_ms / 1000,
+        coalesce_max_wait_seconds=config.message_coalesce_max_wait_ms / 1000,
+    )
+    worker_pool = JobWorkerPool(
+        job_queue,
+        handler=partial(process_message_job, app.state),
+        concurrency=config.worker_concurrency,
+    )
+    app.state.keyed_executor = KeyedExecutor(
+        max_concurrency=config.max_concurrent_messages,
+        max_concurrency_per_user=config.max_concurrent_messages_per_user,
+    )
+    app.state.job_queue = job_queue
+    app.state.worker_pool = worker_pool
+    await worker_pool.start()
+    print(f"✅ Started job worker pool (concurrency: {config.worker_concurrency})")
+
+    # Delete expired conversations in batches (indexed expires_at)
+    cleanup_job = create_conversation_cleanup_job(config, db_manager)
+    await cleanup_job.start()
+
     # End DND mode on startup
-    slack = get_slack_adapter()
-    dnd_result = await slack.end_dnd()
+    dnd_result = await slack_adapter.end_dnd()
     if dnd_result.get("ok"):
         print("✅ おやすみモード解除完了")
     else:
@@ -97,7 +155,6 @@ async def lifespan(app: FastAPI):
     print("🔄 Running initial Slack user sync...")
     try:
         async with db_manager.session() as session:
-            slack_adapter = SlackAdapter(token=config.slack_bot_token)
             slack_user_repo = PostgreSQLSlackUserRepository(session)
             sync_service = SlackUserSyncService(slack_adapter, slack_user_repo)
 
@@ -112,7 +169,7 @@ async def lifespan(app: FastAPI):
         print(f"❌ Error in initial user sync: {e}")
 
     # Start background user sync task
-    sync_task = asyncio.create_task(_periodic_user_sync(db_manager, config.slack_bot_token))
+    sync_task = asyncio.create_task(_periodic_user_sync(db_manager, slack_adapter))
     print("✅ Started periodic user sync task (1 hour interval)")
 
     yield
@@ -124,6 +181,15 @@ async def lifespan(app: FastAPI):
         await sync_task
     except asyncio.CancelledError:
         pass
+    await worker_pool.stop()
+    await cleanup_job.stop()
+    if conversation_summarizer is not None:
+        await conversation_summarizer.close()
+    if conversation_write_behind is not None:
+        await conversation_write_behind.close()
+    await slack_sender.close()
+    await slack_adapter.close()
+    await anthropic_client.close()
     await db_manager.close()
 
 
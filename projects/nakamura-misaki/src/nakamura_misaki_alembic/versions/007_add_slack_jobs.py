@@ -0,0 +1,54 @@
+"""add slack_jobs work queue table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create slack_jobs table (durable queue replacing FastAPI BackgroundTasks)"""
+    op.create_table(
+        "slack_jobs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("job_type", sa.String(length=50), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_slack_jobs")),
+    )
+
+    # Dequeue scans pending jobs by availability; reaper scans expired leases
+    op.create_index(
+        op.f("idx_slack_jobs_status_available"),
+        "slack_jobs",
+        ["status", "available_at"],
+        unique=False,
+    )
+    op.create_index(op.f("idx_slack_jobs_locked_until"), "slack_jobs", ["locked_until"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop slack_jobs table"""
+    op.drop_index(op.f("idx_slack_jobs_locked_until"), table_name="slack_jobs")
+    op.drop_index(op.f("idx_slack_jobs_status_available"), table_name="slack_jobs")
+    op.drop_table("slack_jobs")
@@ -0,0 +1,41 @@
+"""add slack_processed_events dedup table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create UNLOGGED slack_processed_events table for Slack event deduplication"""
+    op.create_table(
+        "slack_processed_events",
+        sa.Column("event_id", sa.String(length=100), nullable=False),
+        sa.Column("received_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("event_id", name=op.f("pk_slack_processed_events")),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index(
+        op.f("idx_slack_processed_events_received"),
+        "slack_processed_events",
+        ["received_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop slack_processed_events table"""
+    op.drop_index(op.f("idx_slack_processed_events_received"), table_name="slack_processed_events")
+    op.drop_table("slack_processed_events")
@@ -0,0 +1,35 @@
+"""add conversation_key to slack_jobs for per-conversation ordering
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add conversation_key column and (conversation_key, id) index"""
+    op.add_column("slack_jobs", sa.Column("conversation_key", sa.String(length=200), nullable=True))
+    op.create_index(
+        op.f("idx_slack_jobs_conversation_key"),
+        "slack_jobs",
+        ["conversation_key", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_key column"""
+    op.drop_index(op.f("idx_slack_jobs_conversation_key"), table_name="slack_jobs")
+    op.drop_column("slack_jobs", "conversation_key")
@@ -0,0 +1,28 @@
+"""add content_hash to slack_users for incremental user sync
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content_hash column (NULL = always rewritten on next sync)"""
+    op.add_column("slack_users", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop content_hash column"""
+    op.drop_column("slack_users", "content_hash")
@@ -0,0 +1,33 @@
+"""add rolling summary columns to conversations
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add summary / summarized_count (existing conversations start unsummarized)"""
+    op.add_column("conversations", sa.Column("summary", sa.Text(), nullable=True))
+    op.add_column(
+        "conversations",
+        sa.Column("summarized_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Drop summary columns"""
+    op.drop_column("conversations", "summarized_count")
+    op.drop_column("conversations", "summary")
@@ -0,0 +1,89 @@
+"""move conversation messages from a JSON column to an append-only table
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Older rows hold the array either as JSON or as a JSON-encoded string
+_MESSAGES_ARRAY = (
+    "CASE WHEN json_typeof(c.messages) = 'string' THEN (c.messages #>> '{}')::json ELSE c.messages END"
+)
+
+
+def upgrade() -> None:
+    """Create conversation_messages, copy existing messages, drop conversations.messages"""
+    op.create_table(
+        "conversation_messages",
+        sa.Column(
+            "conversation_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("conversations.conversation_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("seq", sa.Integer(), primary_key=True),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.add_column(
+        "conversations",
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.execute(
+        f"""
+        INSERT INTO conversation_messages (conversation_id, seq, role, content, created_at)
+        SELECT c.conversation_id,
+               m.ordinality - 1,
+               m.value ->> 'role',
+               m.value ->> 'content',
+               COALESCE((m.value ->> 'timestamp')::timestamptz, c.created_at)
+        FROM conversations c
+        CROSS JOIN LATERAL json_array_elements({_MESSAGES_ARRAY}) WITH ORDINALITY AS m(value, ordinality)
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversations c
+        SET message_count = counts.n
+        FROM (SELECT conversation_id, count(*) AS n FROM conversation_messages GROUP BY conversation_id) counts
+        WHERE counts.conversation_id = c.conversation_id
+        """
+    )
+    op.drop_column("conversations", "messages")
+
+
+def downgrade() -> None:
+    """Fold conversation_messages back into conversations.messages"""
+    op.add_column("conversations", sa.Column("messages", sa.JSON(), nullable=False, server_default="[]"))
+    op.execute(
+        """
+        UPDATE conversations c
+        SET messages = rows.messages
+        FROM (
+            SELECT conversation_id,
+                   json_agg(json_build_object('role', role, 'content', content, 'timestamp', created_at)
+                            ORDER BY seq) AS messages
+            FROM conversation_messages
+            GROUP BY conversation_id
+        ) rows
+        WHERE rows.conversation_id = c.conversation_id
+        """
+    )
+    op.alter_column("conversations", "messages", server_default=None)
+    op.drop_column("conversations", "message_count")
+    op.drop_table("conversation_messages")
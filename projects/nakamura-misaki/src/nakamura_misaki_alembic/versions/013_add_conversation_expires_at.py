@@ -0,0 +1,32 @@
+"""add indexed expires_at to conversations
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add expires_at (existing rows keep the previous created_at + 24h expiry)"""
+    op.add_column("conversations", sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE conversations SET expires_at = created_at + interval '24 hours'")
+    op.alter_column("conversations", "expires_at", nullable=False)
+    op.create_index("idx_conversations_expires_at", "conversations", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Drop expires_at"""
+    op.drop_index("idx_conversations_expires_at", table_name="conversations")
+    op.drop_column("conversations", "expires_at")
@@ -0,0 +1,106 @@
+"""Unit tests for the intent fast path dispatch"""
+
+from typing import Any
+
+from src.adapters.primary.intent_fast_path import IntentFastPath
+from src.adapters.primary.tools.registry import BoundTools
+from src.infrastructure.metrics import get_metrics
+
+
+class FakeTool:
+    def __init__(self, name: str, result: dict[str, Any]):
+        self.name = name
+        self.result = result
+        self.calls: list[dict[str, Any]] = []
+
+    def to_tool_definition(self) -> dict[str, Any]:
+        return {"name": self.name}
+
+    async def execute(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        return self.result
+
+
+def _task(task_id: str, title: str, status: str = "pending", due_at: str | None = None) -> dict[str, Any]:
+    return {"id": task_id, "title": title, "status": status, "due_at": due_at}
+
+
+def _tools(tasks: list[dict[str, Any]], **results: dict[str, Any]) -> tuple[BoundTools, dict[str, FakeTool]]:
+    fakes = {
+        "list_tasks": FakeTool("list_tasks", {"success": True, "data": {"tasks": tasks, "count": len(tasks)}}),
+        "complete_task": FakeTool("complete_task", results.get("complete_task", {"success": False})),
+        "register_task": FakeTool("register_task", results.get("register_task", {"success": False})),
+    }
+    return BoundTools.from_tools(list(fakes.values())), fakes
+
+
+async def test_list_tasks_answers_with_open_tasks_sorted_by_due():
+    metrics = get_metrics()
+    metrics.reset()
+    tools, _ = _tools(
+        [
+            _task("1", "日報", due_at=None),
+            _task("2", "資料作成", due_at="2026-10-17T23:59:00"),
+            _task("3", "済んだ件", status="completed"),
+        ]
+    )
+
+    reply = await IntentFastPath().try_handle("タスク一覧", tools)
+
+    assert reply == "未完了のタスクは2件だ。\n• 資料作成（期限: 10/17(土) 23:59）\n• 日報"
+    assert metrics.get_metrics()["counters"]["intent_fast_path.hit.list_tasks"] == 1
+
+
+async def test_today_list_keeps_tasks_due_by_today():
+    tools, _ = _tools(
+        [
+            _task("1", "日報", due_at=None),
+            _task("2", "資料作成", due_at="2000-01-01T23:59:00"),
+            _task("3", "来年の計画", due_at="2999-01-01T23:59:00"),
+        ]
+    )
+
+    reply = await IntentFastPath().try_handle("今日のタスク", tools)
+
+    assert reply == "今日までの未完了のタスクは1件だ。\n• 資料作成（期限: 1/1(土) 23:59）"
+
+
+async def test_complete_task_requires_a_unique_match():
+    tools, fakes = _tools(
+        [_task("1", "資料作成"), _task("2", "資料作成レビュー")],
+        complete_task={"success": True, "data": _task("1", "資料作成", status="completed")},
+    )
+
+    assert await IntentFastPath().try_handle("資料作成完了", tools) is None
+    assert fakes["complete_task"].calls == []
+
+    reply = await IntentFastPath().try_handle("資料作成レビュー完了", tools)
+    assert reply == "了解した。「資料作成」を完了にした。"
+    assert fakes["complete_task"].calls == [{"task_identifier": "2"}]
+
+
+async def test_register_task_passes_parsed_due_date():
+    tools, fakes = _tools(
+        [],
+        register_task={"success": True, "data": _task("9", "資料作成", due_at="2026-10-17T23:59:00")},
+    )
+
+    reply = await IntentFastPath().try_handle("タスク追加: 明日までに資料作成", tools)
+
+    assert reply == "了解した。「資料作成」を登録した。期限は10/17(土) 23:59だ。"
+    assert fakes["register_task"].calls[0]["title"] == "資料作成"
+    assert "due_date" in fakes["register_task"].calls[0]
+
+
+async def test_low_confidence_and_misses_fall_back():
+    metrics = get_metrics()
+    metrics.reset()
+    tools, fakes = _tools([])
+
+    assert await IntentFastPath().try_handle("それ終わった", tools) is None
+    assert await IntentFastPath().try_handle("来週の会議の準備を手伝って", tools) is None
+
+    counters = metrics.get_metrics()["counters"]
+    assert counters["intent_fast_path.low_confidence.complete_task"] == 1
+    assert counters["intent_fast_path.miss"] == 1
+    assert fakes["list_tasks"].calls == []
@@ -0,0 +1,61 @@
+"""Unit tests for compact tool-result encoding"""
+
+import json
+
+from src.adapters.primary.tools.result_encoder import TRUNCATED_MARKER, encode_tool_result
+from src.adapters.primary.tools.task_tools import ListTasksTool, RegisterTaskTool
+from src.domain.services.conversation_window import estimate_tokens
+
+
+def _task(i: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "title": f"タスク{i}",
+        "description": None,
+        "status": "pending",
+        "due_at": "2026-10-17T09:00:00+00:00",
+        "completed_at": None,
+        "created_at": "2026-10-16T10:30:12.345678+09:00",
+    }
+
+
+def test_compact_json_drops_nulls_and_abbreviates_timestamps():
+    encoded, truncated = encode_tool_result({"success": True, "data": _task(1)}, token_budget=500)
+
+    assert not truncated
+    assert json.loads(encoded) == {
+        "success": True,
+        "data": {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "title": "タスク1",
+            "status": "pending",
+            "due_at": "2026-10-17T09:00Z",
+            "created_at": "2026-10-16T10:30+09:00",
+        },
+    }
+    assert ", " not in encoded and "None" not in encoded
+
+
+def test_long_lists_are_cut_with_more_marker():
+    result = {"success": True, "data": {"tasks": [_task(i) for i in range(200)], "count": 200}}
+
+    encoded, truncated = encode_tool_result(result, token_budget=500)
+
+    data = json.loads(encoded)["data"]
+    assert truncated
+    assert estimate_tokens(encoded) <= 500
+    assert 0 < len(data["tasks"]) < 200
+    assert data["tasks_more"] == 200 - len(data["tasks"])
+    assert data["count"] == 200
+
+
+def test_unsplittable_results_are_hard_truncated():
+    encoded, truncated = encode_tool_result({"success": False, "error": "x" * 5000}, token_budget=100)
+
+    assert truncated
+    assert encoded.endswith(TRUNCATED_MARKER)
+    assert len(encoded) <= 100 / 0.35
+
+
+def test_tools_declare_result_budgets():
+    assert ListTasksTool.result_token_budget > RegisterTaskTool.result_token_budget
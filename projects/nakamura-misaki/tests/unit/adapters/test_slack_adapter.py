@@ -0,0 +1,93 @@
+"""Unit tests for the async pooled SlackAdapter (local aiohttp test server)"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.adapters.secondary.slack_adapter import SlackAdapter
+
+
+@pytest.fixture
+async def server():
+    requests: list[web.Request] = []
+
+    async def post_message(request: web.Request) -> web.Response:
+        requests.append(request)
+        body = await request.json()
+        return web.json_response({"ok": True, "channel": body["channel"]})
+
+    async def slow(request: web.Request) -> web.Response:
+        await asyncio.sleep(1)
+        return web.json_response({"ok": True})
+
+    async def users_page(request: web.Request) -> web.Response:
+        requests.append(request)
+        cursor = request.query.get("cursor")
+        if cursor is None:
+            return web.json_response({"ok": True, "members": [{"id": "U1"}], "response_metadata": {"next_cursor": "c2"}})
+        if len([r for r in requests if r.query.get("cursor") == "c2"]) == 1:
+            return web.json_response({"ok": False, "error": "ratelimited"}, status=429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True, "members": [{"id": "U2"}], "response_metadata": {"next_cursor": ""}})
+
+    app = web.Application()
+    app.router.add_post("/chat.postMessage", post_message)
+    app.router.add_get("/users.list", slow)
+    app.router.add_get("/users.paged", users_page)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    test_server.requests = requests
+    yield test_server
+    await test_server.close()
+
+
+def _adapter(server: TestServer, **kwargs) -> SlackAdapter:
+    adapter = SlackAdapter("xoxb-test", **kwargs)
+    adapter.API_URL = str(server.make_url("/chat.postMessage"))
+    adapter.USERS_LIST_URL = str(server.make_url("/users.list"))
+    return adapter
+
+
+async def test_requests_reuse_one_pooled_session(server: TestServer):
+    adapter = _adapter(server)
+
+    first = await adapter.send_message("C1", "hello")
+    session = adapter._session
+    second = await adapter.send_message("C2", "hello")
+
+    assert first == {"ok": True, "channel": "C1"}
+    assert second == {"ok": True, "channel": "C2"}
+    assert adapter._session is session
+    assert server.requests[0].headers["Authorization"] == "Bearer xoxb-test"
+
+    await adapter.close()
+    assert session.closed
+
+
+async def test_timeout_returns_error_without_raising(server: TestServer):
+    adapter = _adapter(server, timeout_seconds=0.1)
+
+    result = await adapter.users_list()
+
+    assert result["ok"] is False
+    await adapter.close()
+
+
+async def test_missing_token_skips_request():
+    adapter = SlackAdapter("  ")
+
+    assert await adapter.end_dnd() == {"ok": False, "error": "token_missing"}
+    assert adapter._session is None
+
+
+async def test_iter_users_follows_cursor_and_honors_retry_after(server: TestServer):
+    adapter = _adapter(server)
+    adapter.USERS_LIST_URL = str(server.make_url("/users.paged"))
+
+    pages = [page async for page in adapter.iter_users(page_size=1)]
+
+    assert pages == [[{"id": "U1"}], [{"id": "U2"}]]
+    assert [r.query.get("cursor") for r in server.requests] == [None, "c2", "c2"]
+    assert server.requests[0].query["limit"] == "1"
+    await adapter.close()
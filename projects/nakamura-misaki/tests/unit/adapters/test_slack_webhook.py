@@ -0,0 +1,234 @@
+"""Unit tests for the Slack Events API webhook route"""
+
+import hashlib
+import hmac
+import json
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from src.adapters.primary.api.routes.slack import (
+    BOT_USER_ID,
+    BUSY_REPLY,
+    SLACK_MESSAGE_JOB,
+    _process_message_with_handler,
+    router,
+)
+from src.adapters.primary.tools.base_tool import BaseTool
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.domain.services.claude_agent_service import ClaudeAgentService
+from src.infrastructure.claude_gateway import ClaudeUnavailableError
+from src.infrastructure.database.schema import ConversationTable
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.dedup import InMemoryEventDedupStore
+
+SIGNING_SECRET = "test-secret"
+
+
+class FakeJobQueue:
+    """Records enqueued jobs"""
+
+    def __init__(self):
+        self.jobs: list = []
+
+    async def enqueue(self, job_type, payload, **kwargs):
+        self.jobs.append((job_type, payload, kwargs))
+        return len(self.jobs)
+
+
+class FakeWorkerPool:
+    def notify(self) -> None:
+        pass
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.state.slack_signing_secret = SIGNING_SECRET
+    app.state.job_queue = FakeJobQueue()
+    app.state.worker_pool = FakeWorkerPool()
+    app.state.event_dedup_store = InMemoryEventDedupStore()
+    return app
+
+
+async def _post(app: FastAPI, payload: dict, retry_num: str | None = None, secret: str = SIGNING_SECRET):
+    body = json.dumps(payload).encode()
+    timestamp = str(int(time.time()))
+    signature = "v0=" + hmac.new(secret.encode(), b"v0:" + timestamp.encode() + b":" + body, hashlib.sha256).hexdigest()
+    headers = {"X-Slack-Signature": signature, "X-Slack-Request-Timestamp": timestamp}
+    if retry_num is not None:
+        headers["X-Slack-Retry-Num"] = retry_num
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.post("/slack", content=body, headers=headers)
+
+
+def _message(event_id: str = "Ev1", **event) -> dict:
+    return {
+        "type": "event_callback",
+        "event_id": event_id,
+        "event": {"type": "message", "user": "U1", "text": "明日の予定は？", "channel": "C1", **event},
+    }
+
+
+async def test_message_is_enqueued(app: FastAPI):
+    response = await _post(app, _message(text="  明日の予定は？ "))
+
+    assert response.json() == {"status": "ok"}
+    assert app.state.job_queue.jobs == [
+        (SLACK_MESSAGE_JOB, {"user_id": "U1", "text": "明日の予定は？", "channel": "C1"}, {"conversation_key": "U1:C1"})
+    ]
+
+
+async def test_invalid_signature_is_rejected(app: FastAPI):
+    response = await _post(app, _message(), secret="wrong")
+
+    assert response.status_code == 401
+    assert app.state.job_queue.jobs == []
+
+
+async def test_url_verification(app: FastAPI):
+    response = await _post(app, {"type": "url_verification", "challenge": "abc"})
+
+    assert response.json() == {"challenge": "abc"}
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"subtype": "bot_message"},
+        {"bot_id": "B1"},
+        {"user": BOT_USER_ID},
+        {"text": "   "},
+        {"type": "reaction_added"},
+    ],
+)
+async def test_ignorable_events_are_not_enqueued(app: FastAPI, event: dict):
+    response = await _post(app, _message(**event))
+
+    assert response.json() == {"status": "ignored"}
+    assert app.state.job_queue.jobs == []
+
+
+async def test_slack_retry_of_seen_event_is_acked_without_retry(app: FastAPI):
+    await _post(app, _message())
+
+    response = await _post(app, _message(), retry_num="1")
+
+    assert response.json() == {"status": "ignored"}
+    assert response.headers["X-Slack-No-Retry"] == "1"
+    assert len(app.state.job_queue.jobs) == 1
+
+
+async def test_malformed_payload_is_rejected(app: FastAPI):
+    response = await _post(app, {"type": "event_callback", "event": {"text": 123}})
+
+    assert response.status_code == 400
+
+
+class _UnavailableHandler:
+    async def handle_message(self, user_id, text, channel, on_text=None):
+        raise ClaudeUnavailableError("circuit open")
+
+
+class _FakeDatabaseManager:
+    @asynccontextmanager
+    async def request_scope(self):
+        yield
+
+
+class _FakeSender:
+    def __init__(self):
+        self.posted: list[tuple[str, str]] = []
+
+    async def post_message(self, channel, text, **kwargs):
+        self.posted.append((channel, text))
+        return {"ok": True}
+
+
+@pytest.mark.parametrize(("notify_busy", "expected"), [(True, [("C1", BUSY_REPLY)]), (False, [])])
+async def test_busy_reply_when_claude_is_unavailable(notify_busy: bool, expected: list):
+    sender = _FakeSender()
+
+    # Re-raised so that the job queue retries the message
+    with pytest.raises(ClaudeUnavailableError):
+        await _process_message_with_handler(
+            _FakeDatabaseManager(), _UnavailableHandler(), sender, "U1", "hi", "C1", notify_busy=notify_busy
+        )
+
+    assert sender.posted == expected
+
+
+class _SaveConversationTool(BaseTool):
+    """Non-idempotent DB tool: every call inserts a row through the message's session"""
+
+    name = "save_conversation"
+    description = "Save"
+    input_schema = {"type": "object", "properties": {}}
+
+    async def execute(self, **kwargs: Any) -> dict[str, Any]:
+        conversation = Conversation.create(user_id="U1", channel_id="C1", messages=[Message.user("hi")])
+        await PostgreSQLConversationRepository(ScopedSession()).save(conversation)
+        return {"success": True}
+
+
+class _ScriptedMessages:
+    """messages.create replaying responses (or raising errors) across job attempts"""
+
+    def __init__(self, script: list):
+        self._script = list(script)
+
+    async def create(self, **kwargs):
+        step = self._script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+class _AgentHandler:
+    def __init__(self, service: ClaudeAgentService):
+        self._service = service
+
+    async def handle_message(self, user_id, text, channel, on_text=None):
+        conversation = Conversation.create(user_id=user_id, channel_id=channel, messages=[])
+        return await self._service.process_message(conversation, text, on_text=on_text)
+
+
+def _tool_round() -> SimpleNamespace:
+    return SimpleNamespace(
+        stop_reason="tool_use",
+        content=[SimpleNamespace(type="tool_use", id="toolu_0", name="save_conversation", input={})],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+    )
+
+
+async def test_retried_job_does_not_repeat_tool_writes_of_the_failed_attempt(db_manager):
+    final = SimpleNamespace(
+        stop_reason="end_turn",
+        content=[SimpleNamespace(type="text", text="登録した")],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+    )
+    messages = _ScriptedMessages([_tool_round(), ClaudeUnavailableError("overloaded"), _tool_round(), final])
+    handler = _AgentHandler(
+        ClaudeAgentService(anthropic_client=SimpleNamespace(messages=messages), tools=[_SaveConversationTool()])
+    )
+    sender = _FakeSender()
+
+    # Round 2 of the first attempt fails after the tool wrote; the job queue retries the message
+    with pytest.raises(ClaudeUnavailableError):
+        await _process_message_with_handler(db_manager, handler, sender, "U1", "登録して", "C1")
+    await _process_message_with_handler(db_manager, handler, sender, "U1", "登録して", "C1", notify_busy=False)
+
+    async with db_manager.session() as session:
+        stored = (await session.execute(select(func.count()).select_from(ConversationTable))).scalar_one()
+    assert stored == 1
+    assert sender.posted == [("C1", BUSY_REPLY), ("C1", "登録した")]
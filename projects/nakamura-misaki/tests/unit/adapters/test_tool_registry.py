@@ -0,0 +1,60 @@
+"""Unit tests for the process-wide tool registry"""
+
+from dataclasses import fields
+from typing import Any
+from unittest.mock import Mock
+
+from src.adapters.primary.slack_event_handler import TOOL_REGISTRY, ToolDependencies
+from src.adapters.primary.tools.base_tool import BaseTool
+from src.adapters.primary.tools.registry import ToolRegistry
+from src.adapters.primary.tools.task_tools import ListTasksTool
+
+
+def _dependencies() -> ToolDependencies:
+    return ToolDependencies(**{field.name: Mock() for field in fields(ToolDependencies)})
+
+
+def test_definitions_are_shared_across_requests():
+    first = TOOL_REGISTRY.bind(_dependencies(), "U1")
+    second = TOOL_REGISTRY.bind(_dependencies(), "U2")
+
+    assert first.definitions is second.definitions
+    assert len(TOOL_REGISTRY.definitions) == 13
+
+
+def test_every_factory_matches_its_definition():
+    tools = TOOL_REGISTRY.bind(_dependencies(), "U1")
+
+    for definition in TOOL_REGISTRY.definitions:
+        assert tools.get(definition["name"]).to_tool_definition() == definition
+
+
+def test_tools_are_created_lazily_with_call_time_user():
+    factory = Mock(side_effect=lambda deps, user_id: ListTasksTool(deps, user_id))
+    registry = ToolRegistry([(ListTasksTool, factory)])
+
+    tools = registry.bind("use-case", "U42")
+    factory.assert_not_called()
+
+    tool = tools.get("list_tasks")
+    assert tools.get("list_tasks") is tool
+    assert tool._user_id == "U42"
+    factory.assert_called_once_with("use-case", "U42")
+    assert tools.get("unknown") is None
+
+
+def test_definitions_are_read_without_constructing_tools():
+    class StatefulTool(BaseTool):
+        name = "stateful"
+        description = "Needs its dependencies"
+        input_schema = {"type": "object", "properties": {}}
+
+        def __init__(self, client: Any):
+            self._client = client
+
+        async def execute(self, **kwargs: Any) -> dict[str, Any]:
+            return {"success": True, "data": self._client}
+
+    registry = ToolRegistry([(StatefulTool, lambda deps, user_id: StatefulTool(deps))])
+
+    assert registry.definitions == [StatefulTool.to_tool_definition()]
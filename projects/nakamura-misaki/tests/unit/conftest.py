@@ -0,0 +1,32 @@
+"""Unit test fixtures"""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest_asyncio
+
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import ConversationMessageTable, ConversationTable
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path: Path) -> AsyncGenerator[DatabaseManager, None]:
+    """SQLite database with the conversation tables
+
+    Modules testing other tables override this fixture with their own.
+
+    Args:
+        tmp_path: Per-test temporary directory
+
+    Yields:
+        DatabaseManager instance
+    """
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'conversations.db'}")
+    async with manager.session() as session:
+        connection = await session.connection()
+        await connection.run_sync(
+            ConversationTable.metadata.create_all,
+            tables=[ConversationTable.__table__, ConversationMessageTable.__table__],
+        )
+    yield manager
+    await manager.close()
@@ -0,0 +1,264 @@
+"""Unit tests for ClaudeAgentService request construction"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.adapters.primary.tools.base_tool import BaseTool
+from src.contexts.personal_tasks.domain.models.conversation import Conversation
+from src.domain.services.claude_agent_service import LOOP_EXHAUSTED_MESSAGE, SYSTEM_PROMPT, ClaudeAgentService
+from src.domain.services.model_router import DEFAULT_MODEL, FAST_MODEL, ModelRouter
+from src.infrastructure.metrics import get_metrics
+
+
+class EchoTool(BaseTool):
+    name = "echo"
+    description = "Echo the input"
+    input_schema = {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def execute(self, **kwargs: Any) -> dict[str, Any]:
+        return {"success": True, "data": kwargs}
+
+
+class SleepTool(BaseTool):
+    """Session-free tool that sleeps (for concurrency/timeout tests)"""
+
+    name = "sleep"
+    description = "Sleep"
+    input_schema = {"type": "object", "properties": {"seconds": {"type": "number"}}}
+
+    uses_shared_session = False
+
+    async def execute(self, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(kwargs["seconds"])
+        return {"success": True}
+
+
+def _tool_response(*calls: tuple[str, dict]) -> SimpleNamespace:
+    return SimpleNamespace(
+        stop_reason="tool_use",
+        content=[
+            SimpleNamespace(type="tool_use", id=f"toolu_{i}", name=name, input=tool_input)
+            for i, (name, tool_input) in enumerate(calls)
+        ],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+    )
+
+
+def _text_response(text: str, cache_read: int = 0, cache_creation: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        stop_reason="end_turn",
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=SimpleNamespace(
+            input_tokens=10,
+            output_tokens=5,
+            cache_read_input_tokens=cache_read,
+            cache_creation_input_tokens=cache_creation,
+        ),
+    )
+
+
+class FakeStream:
+    def __init__(self, response: SimpleNamespace):
+        self._response = response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        for block in self._response.content:
+            if block.type == "text":
+                for char in block.text:
+                    yield char
+
+    async def get_final_message(self):
+        return self._response
+
+
+class FakeMessages:
+    def __init__(self, responses: list):
+        self.responses = list(responses)
+        self.requests: list[dict] = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return self.responses.pop(0)
+
+    def stream(self, **kwargs):
+        self.requests.append(kwargs)
+        return FakeStream(self.responses.pop(0))
+
+
+@pytest.fixture
+def metrics():
+    collector = get_metrics()
+    collector.reset()
+    yield collector
+    collector.reset()
+
+
+def _service(responses: list, **kwargs) -> tuple[ClaudeAgentService, FakeMessages]:
+    messages = FakeMessages(responses)
+    client = SimpleNamespace(messages=messages)
+    return ClaudeAgentService(anthropic_client=client, tools=[EchoTool(), SleepTool()], **kwargs), messages
+
+
+def _conversation() -> Conversation:
+    return Conversation.create(user_id="U1", channel_id="C1", messages=[])
+
+
+async def test_static_prefix_is_cacheable_and_byte_stable(metrics):
+    service, fake = _service([_text_response("a"), _text_response("b")])
+
+    await service.process_message(_conversation(), "こんにちは")
+    await service.process_message(_conversation(), "こんばんは")
+
+    first, second = fake.requests
+    static_block, time_block = first["system"]
+    assert static_block == {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    assert "現在時刻" in time_block["text"] and "cache_control" not in time_block
+    # Everything up to the breakpoint is identical across calls
+    assert first["tools"] == second["tools"]
+    assert first["system"][0] == second["system"][0]
+
+
+async def test_cache_usage_is_recorded(metrics):
+    service, _ = _service([_text_response("a", cache_creation=1500), _text_response("b", cache_read=1500)])
+
+    await service.process_message(_conversation(), "1")
+    await service.process_message(_conversation(), "2")
+
+    counters = metrics.get_metrics()["counters"]
+    assert counters["claude_cache_creation_input_tokens"] == 1500
+    assert counters["claude_cache_read_input_tokens"] == 1500
+    assert counters["claude_prompt_cache_hits"] == 1
+    assert counters["claude_prompt_cache_misses"] == 1
+
+
+async def test_agent_loop_runs_multiple_tool_rounds(metrics):
+    service, fake = _service(
+        [
+            _tool_response(("echo", {"text": "list"})),
+            _tool_response(("echo", {"text": "complete"})),
+            _text_response("完了した"),
+        ]
+    )
+    conversation = _conversation()
+
+    reply = await service.process_message(conversation, "タスク一覧を見てレポートを完了して")
+
+    assert reply == "完了した"
+    assert len(fake.requests) == 3
+    # Second round sees both earlier tool results
+    assert [m["role"] for m in fake.requests[2]["messages"]] == ["user", "assistant", "user", "assistant", "user"]
+    assert [m.content for m in conversation.messages] == ["タスク一覧を見てレポートを完了して", "完了した"]
+
+
+async def test_tools_in_one_turn_run_concurrently(metrics):
+    service, fake = _service([_tool_response(("sleep", {"seconds": 0.2}), ("sleep", {"seconds": 0.2})), _text_response("ok")])
+
+    started = time.monotonic()
+    await service.process_message(_conversation(), "go")
+
+    assert time.monotonic() - started < 0.35
+    results = fake.requests[1]["messages"][-1]["content"]
+    assert [r["tool_use_id"] for r in results] == ["toolu_0", "toolu_1"]
+
+
+async def test_tool_timeout_becomes_error_result(metrics):
+    service, fake = _service(
+        [_tool_response(("sleep", {"seconds": 5})), _text_response("timed out")], tool_timeout_seconds=0.05
+    )
+
+    await service.process_message(_conversation(), "go")
+
+    [result] = fake.requests[1]["messages"][-1]["content"]
+    assert result["is_error"] is True
+    assert metrics.get_metrics()["counters"]["tool_timeouts.sleep"] == 1
+
+
+async def test_loop_stops_at_max_iterations(metrics):
+    service, fake = _service([_tool_response(("echo", {"text": "again"}))] * 2, max_iterations=2)
+
+    reply = await service.process_message(_conversation(), "loop")
+
+    assert reply == LOOP_EXHAUSTED_MESSAGE
+    assert len(fake.requests) == 2
+    assert metrics.get_metrics()["counters"]["claude_agent_loop_truncated"] == 1
+
+
+async def test_streaming_mode_passes_text_deltas(metrics):
+    service, fake = _service([_tool_response(("echo", {"text": "x"})), _text_response("了解した")])
+    deltas: list[str] = []
+
+    async def on_text(delta: str) -> None:
+        deltas.append(delta)
+
+    reply = await service.process_message(_conversation(), "go", on_text=on_text)
+
+    assert reply == "了解した"
+    assert "".join(deltas) == "了解した"
+    assert "claude_api_time_to_first_token" in metrics.get_metrics()["timings"]
+
+
+async def test_streamed_text_of_successive_rounds_is_separated(metrics):
+    preamble = _tool_response(("echo", {"text": "x"}))
+    preamble.content.insert(0, SimpleNamespace(type="text", text="確認する"))
+    service, _ = _service([preamble, _tool_response(("echo", {"text": "y"})), _text_response("完了")])
+    deltas: list[str] = []
+
+    async def on_text(delta: str) -> None:
+        deltas.append(delta)
+
+    reply = await service.process_message(_conversation(), "go", on_text=on_text)
+
+    assert reply == "完了"
+    assert "".join(deltas) == "確認する\n完了"
+
+
+async def test_simple_turn_uses_fast_model(metrics):
+    service, fake = _service([_text_response("おはよう")], model_router=ModelRouter())
+
+    await service.process_message(_conversation(), "おはよう")
+
+    assert fake.requests[0]["model"] == FAST_MODEL
+    assert metrics.get_metrics()["counters"][f"claude_api_calls.{FAST_MODEL}"] == 1
+
+
+async def test_multi_tool_step_escalates_to_default_model(metrics):
+    service, fake = _service(
+        [_tool_response(("echo", {"text": "a"}), ("echo", {"text": "b"})), _text_response("done")],
+        model_router=ModelRouter(),
+    )
+
+    await service.process_message(_conversation(), "aとbを出して")
+
+    assert [request["model"] for request in fake.requests] == [FAST_MODEL, DEFAULT_MODEL]
+    assert metrics.get_metrics()["counters"]["model_routing.escalated.multi_tool"] == 1
+
+
+async def test_failed_tool_escalates_to_default_model(metrics):
+    service, fake = _service(
+        [_tool_response(("missing", {})), _text_response("done")],
+        model_router=ModelRouter(),
+    )
+
+    await service.process_message(_conversation(), "おはよう")
+
+    assert [request["model"] for request in fake.requests] == [FAST_MODEL, DEFAULT_MODEL]
+    assert metrics.get_metrics()["counters"]["model_routing.escalated.tool_error"] == 1
+
+
+async def test_request_model_overrides_router(metrics):
+    service, fake = _service([_text_response("a")], model_router=ModelRouter())
+
+    await service.process_message(_conversation(), "おはよう", model="claude-custom")
+
+    assert fake.requests[0]["model"] == "claude-custom"
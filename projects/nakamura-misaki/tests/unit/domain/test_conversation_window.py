@@ -0,0 +1,199 @@
+"""Unit tests for the token-budgeted history window and rolling summary"""
+
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import select
+
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.domain.services.claude_agent_service import ClaudeAgentService
+from src.domain.services.conversation_summarizer import ConversationSummarizer
+from src.domain.services.conversation_window import ConversationWindow, estimate_tokens
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import ConversationMessageTable
+
+
+def _conversation(turns: int, size: int = 100) -> Conversation:
+    messages = []
+    for i in range(turns):
+        messages.append(Message.user(f"u{i} " + "x" * size))
+        messages.append(Message.assistant(f"a{i} " + "y" * size))
+    return Conversation.create(user_id="U1", channel_id="C1", messages=messages)
+
+
+def test_window_keeps_recent_messages_within_budget():
+    conversation = _conversation(turns=50)
+    window = ConversationWindow(max_history_tokens=400, summary_batch_messages=6)
+
+    history = window.build(conversation)
+
+    assert 0 < len(history.messages) < 100
+    assert history.messages[-1] == conversation.messages[-1].to_dict()
+    assert history.messages[0]["role"] == "user"
+    assert history.estimated_tokens <= 400
+    assert history.start == 100 - len(history.messages)
+
+
+def test_window_keeps_short_conversations_whole():
+    conversation = _conversation(turns=3)
+
+    history = ConversationWindow(max_history_tokens=6000).build(conversation)
+
+    assert history.start == 0
+    assert len(history.messages) == 6
+
+
+def test_window_always_keeps_minimum_recent_messages():
+    conversation = _conversation(turns=2, size=5000)
+
+    history = ConversationWindow(max_history_tokens=10, min_recent_messages=2).build(conversation)
+
+    assert [m["content"][:2] for m in history.messages] == ["u1", "a1"]
+
+
+def test_window_skips_summarized_messages_and_counts_summary():
+    conversation = _conversation(turns=10)
+    conversation.apply_summary("要約", summarized_count=16)
+
+    history = ConversationWindow(max_history_tokens=6000).build(conversation)
+
+    assert history.start == 16
+    assert history.summary == "要約"
+    assert history.estimated_tokens == estimate_tokens("要約") + sum(
+        estimate_tokens(m.content) for m in conversation.messages[16:]
+    )
+
+
+def test_needs_summary_after_batch_leaves_window():
+    window = ConversationWindow(max_history_tokens=400, summary_batch_messages=6)
+    short = _conversation(turns=3)
+    long = _conversation(turns=50)
+
+    assert window.needs_summary(short) is None
+    assert window.needs_summary(long) == window.build(long).start
+
+
+def test_agent_sends_window_and_summary_in_system_prompt():
+    conversation = _conversation(turns=50)
+    conversation.apply_summary("以前: 資料作成タスクを登録済み", summarized_count=10)
+    service = ClaudeAgentService(
+        anthropic_client=None, tools=[], history_window=ConversationWindow(max_history_tokens=400)
+    )
+
+    messages = service._build_messages(conversation)
+    system = service._build_system_prompt("以前: 資料作成タスクを登録済み")
+
+    assert len(messages) < 90
+    assert "資料作成タスク" in system[-1]["text"]
+    assert "cache_control" not in system[-1]
+
+
+class FakeMessages:
+    def __init__(self, text: str):
+        self.text = text
+        self.prompts: list[str] = []
+
+    async def create(self, **request):
+        self.prompts.append(request["messages"][0]["content"])
+        await asyncio.sleep(0)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=self.text)],
+            usage=SimpleNamespace(input_tokens=100, output_tokens=20),
+        )
+
+
+async def test_summarizer_refreshes_in_background_and_survives_saves(db_manager):
+    conversation = _conversation(turns=10)
+    async with db_manager.session() as session:
+        await PostgreSQLConversationRepository(session).save(conversation)
+
+    messages_api = FakeMessages("- 資料作成を登録")
+    summarizer = ConversationSummarizer(
+        SimpleNamespace(messages=messages_api),
+        _ScopedRepository(db_manager),
+    )
+    assert summarizer.schedule(conversation, summarized_count=8)
+    assert not summarizer.schedule(conversation, summarized_count=8)  # already running
+    await summarizer.close()
+
+    assert "u0" in messages_api.prompts[0] and "u4" not in messages_api.prompts[0]
+
+    # A concurrent save of the stale in-memory conversation keeps the summary
+    conversation.add_message(Message.user("next"))
+    async with db_manager.session() as session:
+        repository = PostgreSQLConversationRepository(session)
+        await repository.save(conversation)
+        stored = await repository.get_by_id(conversation.id)
+        # Older summaries never replace newer ones
+        assert not await repository.save_summary(conversation.id, "old", 4)
+
+    assert stored.summary == "- 資料作成を登録"
+    assert stored.summarized_count == 8
+    # Only the unsummarized tail is loaded
+    assert stored.message_count == 21
+    assert stored.message_offset == 8
+    assert stored.messages[0].content == conversation.messages[8].content
+
+
+async def test_save_appends_only_new_messages(db_manager):
+    conversation = _conversation(turns=3)
+    async with db_manager.session() as session:
+        await PostgreSQLConversationRepository(session).save(conversation)
+
+    async with db_manager.session() as session:
+        repository = PostgreSQLConversationRepository(session, max_loaded_messages=4)
+        loaded = await repository.get_by_user_and_channel("U1", "C1")
+        loaded.add_message(Message.user("next"))
+        await repository.save(loaded)
+        # Saving again without changes inserts nothing
+        await repository.save(loaded)
+
+        rows = (await session.execute(select(ConversationMessageTable.seq, ConversationMessageTable.content))).all()
+        stored = await repository.get_by_id(conversation.id)
+
+    assert loaded.message_offset == 2 and len(loaded.messages) == 5
+    assert loaded.stored_message_count == 7
+    assert sorted(rows)[-1] == (6, "next")
+    assert len(rows) == 7
+    assert [m.content for m in stored.messages][-1] == "next"
+    assert stored.message_count == 7
+
+
+def test_window_positions_are_absolute_for_a_loaded_tail():
+    conversation = _conversation(turns=10)
+    tail = Conversation(
+        id=conversation.id,
+        user_id="U1",
+        channel_id="C1",
+        messages=conversation.messages[12:],
+        created_at=conversation.created_at,
+        updated_at=conversation.updated_at,
+        expires_at=conversation.expires_at,
+        summary="要約",
+        summarized_count=12,
+        message_offset=12,
+    )
+    window = ConversationWindow(max_history_tokens=120, summary_batch_messages=2)
+
+    history = window.build(tail)
+
+    assert history.start > 12
+    assert history.messages[0] == conversation.messages[history.start].to_dict()
+    assert window.needs_summary(tail) == history.start
+    assert tail.messages_between(12, history.start) == conversation.messages[12 : history.start]
+
+
+class _ScopedRepository:
+    """Saves each summary in its own session, as request_scope() does in production"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self._db_manager = db_manager
+
+    async def save_summary(self, conversation_id, summary, summarized_count) -> bool:
+        async with self._db_manager.session() as session:
+            return await PostgreSQLConversationRepository(session).save_summary(
+                conversation_id, summary, summarized_count
+            )
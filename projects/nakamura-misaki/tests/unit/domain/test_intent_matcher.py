@@ -0,0 +1,123 @@
+"""Unit tests for the rule-based intent matcher and relative-date parser"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.services.intent_matcher import (
+    COMPLETE_TASK,
+    LIST_TASKS,
+    REGISTER_TASK,
+    IntentMatcher,
+    parse_relative_date,
+)
+
+# Friday
+NOW = datetime(2026, 10, 16, 10, 30)
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("今日", datetime(2026, 10, 16, 23, 59)),
+        ("明日までに", datetime(2026, 10, 17, 23, 59)),
+        ("明後日", datetime(2026, 10, 18, 23, 59)),
+        ("3日後", datetime(2026, 10, 19, 23, 59)),
+        ("2週間後", datetime(2026, 10, 30, 23, 59)),
+        ("来週", datetime(2026, 10, 19, 23, 59)),
+        ("来週水曜日まで", datetime(2026, 10, 21, 23, 59)),
+        ("今週", datetime(2026, 10, 16, 23, 59)),
+        ("月曜", datetime(2026, 10, 19, 23, 59)),
+        ("金曜", datetime(2026, 10, 16, 23, 59)),
+    ],
+)
+def test_parse_relative_date(expression, expected):
+    due, remaining = parse_relative_date(f"{expression}資料作成", NOW)
+
+    assert due == expected
+    assert remaining == "資料作成"
+
+
+def test_parse_relative_date_without_expression():
+    assert parse_relative_date("資料作成", NOW) == (None, "資料作成")
+
+
+@pytest.mark.parametrize(
+    ("text", "arguments"),
+    [
+        ("今日のタスク", {}),
+        ("タスク一覧", {}),
+        ("タスク一覧を見せてください", {}),
+        ("今日のタスクは？", {}),
+        ("ＴＯＤＯ", {}),
+        ("完了したタスク", {"status": "completed"}),
+    ],
+)
+def test_list_intents(text, arguments):
+    intent = IntentMatcher().match(text, NOW)
+
+    assert intent.name == LIST_TASKS
+    assert intent.arguments == arguments
+    assert intent.confidence == 1.0
+
+
+def test_today_scope_limits_the_list_to_tasks_due_today():
+    assert IntentMatcher().match("今日のタスク", NOW).due_by == datetime(2026, 10, 16, 23, 59)
+    assert IntentMatcher().match("自分のタスク", NOW).due_by is None
+
+
+def test_complete_intent():
+    intent = IntentMatcher().match("資料作成完了！", NOW)
+
+    assert intent.name == COMPLETE_TASK
+    assert intent.arguments == {"task_identifier": "資料作成"}
+    assert intent.confidence >= 0.8
+
+
+def test_referential_complete_has_low_confidence():
+    intent = IntentMatcher().match("それ終わった", NOW)
+
+    assert intent.name == COMPLETE_TASK
+    assert intent.confidence < 0.8
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["資料作成終わった？", "レポート完了した?", "資料作成は完了？", "タスク追加: 資料作成?"],
+)
+def test_questions_are_not_commands(text):
+    assert IntentMatcher().match(text, NOW) is None
+
+
+def test_reported_event_is_not_a_confident_completion():
+    intent = IntentMatcher().match("会議が終わった", NOW)
+
+    assert intent.name == COMPLETE_TASK
+    assert intent.confidence < 0.8
+
+
+def test_register_title_keeps_the_original_spelling():
+    intent = IntentMatcher().match("タスク追加: Review PR for API", NOW)
+
+    assert intent.name == REGISTER_TASK
+    assert intent.arguments == {"title": "Review PR for API"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["タスク追加: 明日までに資料作成", "明日までに資料作成をタスクに追加して"],
+)
+def test_register_intent_with_due_date(text):
+    intent = IntentMatcher().match(text, NOW)
+
+    assert intent.name == REGISTER_TASK
+    assert intent.arguments == {"title": "資料作成", "due_date": "2026-10-17T23:59:00"}
+    assert intent.confidence >= 0.8
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["今日は疲れた", "資料作成の進め方を相談したい", "タスク一覧\nあと相談がある", "x" * 100],
+)
+def test_free_text_is_left_to_llm(text):
+    assert IntentMatcher().match(text, NOW) is None
@@ -0,0 +1,71 @@
+"""Unit tests for ModelRouter"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.services.model_router import (
+    DEFAULT_MODEL,
+    FAST_MODEL,
+    ModelRouter,
+    RoutingDecision,
+    record_model_usage,
+)
+from src.infrastructure.metrics import get_metrics
+
+
+@pytest.fixture
+def metrics():
+    collector = get_metrics()
+    collector.reset()
+    yield collector
+    collector.reset()
+
+
+@pytest.mark.parametrize(
+    ("text", "model", "reason"),
+    [
+        ("おはよう", FAST_MODEL, "simple"),
+        ("明日までに資料作成を登録して", FAST_MODEL, "simple"),
+        ("プロジェクトAの進捗を教えて", DEFAULT_MODEL, "complex"),
+        ("それ完了にしておいて", DEFAULT_MODEL, "ambiguous"),
+        ("a" * 81, DEFAULT_MODEL, "long"),
+        ("資料作成\nレビュー依頼", DEFAULT_MODEL, "long"),
+    ],
+)
+def test_route(metrics, text, model, reason):
+    decision = ModelRouter().route(text)
+
+    assert decision == RoutingDecision(model, reason)
+    assert metrics.get_metrics()["counters"][f"model_routing.{reason}"] == 1
+
+
+def test_explicit_model_overrides_routing(metrics):
+    decision = ModelRouter().route("おはよう", model="claude-custom")
+
+    assert decision == RoutingDecision("claude-custom", "override")
+
+
+def test_escalate_only_from_fast_model(metrics):
+    router = ModelRouter()
+
+    escalated = router.escalate(RoutingDecision(FAST_MODEL, "simple"), "tool_error")
+    unchanged = router.escalate(RoutingDecision(DEFAULT_MODEL, "complex"), "tool_error")
+
+    assert escalated == RoutingDecision(DEFAULT_MODEL, "escalated_tool_error")
+    assert unchanged == RoutingDecision(DEFAULT_MODEL, "complex")
+    assert metrics.get_metrics()["counters"]["model_routing.escalated.tool_error"] == 1
+
+
+def test_record_model_usage_prices_cache_tokens(metrics):
+    usage = SimpleNamespace(
+        input_tokens=1000, output_tokens=100, cache_read_input_tokens=10000, cache_creation_input_tokens=0
+    )
+
+    record_model_usage(FAST_MODEL, usage, 120)
+
+    counters = metrics.get_metrics()["counters"]
+    # 1000*0.8 + 10000*0.08 + 100*4 = 2000 microUSD
+    assert counters[f"claude_cost_microusd.{FAST_MODEL}"] == 2000
+    assert counters[f"claude_api_calls.{FAST_MODEL}"] == 1
+    assert counters[f"claude_input_tokens.{FAST_MODEL}"] == 1000
@@ -0,0 +1,96 @@
+"""Unit tests for the prefetched task snapshot"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from src.contexts.personal_tasks.application.dto.task_dto import TaskDTO
+from src.domain.services.claude_agent_service import ClaudeAgentService
+from src.domain.services.task_snapshot import TaskSnapshotBuilder
+
+NOW = datetime(2026, 10, 16, 10, 0, tzinfo=UTC)
+
+
+def _task(title: str, status: str = "pending", due_in_days: int | None = None) -> TaskDTO:
+    return TaskDTO(
+        id=uuid4(),
+        title=title,
+        description=None,
+        status=status,
+        assignee_user_id="U1",
+        creator_user_id="U1",
+        due_at=NOW + timedelta(days=due_in_days) if due_in_days is not None else None,
+        completed_at=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+class FakeQueryUserTasks:
+    def __init__(self, tasks: list[TaskDTO], error: Exception | None = None):
+        self.tasks = tasks
+        self.error = error
+
+    async def execute(self, user_id: str, status=None) -> list[TaskDTO]:
+        if self.error:
+            raise self.error
+        await asyncio.sleep(0)
+        return self.tasks
+
+
+async def test_snapshot_lists_open_tasks_by_due_date():
+    report = _task("週次レポート", status="in_progress", due_in_days=2)
+    slides = _task("資料作成", due_in_days=1)
+    builder = TaskSnapshotBuilder(
+        FakeQueryUserTasks([_task("日報"), report, _task("済み", status="completed"), slides])
+    )
+
+    snapshot = await builder.build("U1")
+
+    lines = snapshot.splitlines()
+    assert lines[0] == "# ユーザーの未完了タスク（3件）"
+    assert lines[3] == f"{slides.id}|資料作成|未着手|10/17 10:00"
+    assert lines[4] == f"{report.id}|週次レポート|進行中|10/18 10:00"
+    assert lines[5].endswith("|日報|未着手|-")
+    assert "済み" not in snapshot
+
+
+async def test_snapshot_is_token_capped():
+    builder = TaskSnapshotBuilder(FakeQueryUserTasks([_task(f"タスク{i}") for i in range(100)]), max_tokens=200)
+
+    snapshot = await builder.build("U1")
+
+    assert len(snapshot) * 0.35 < 250
+    assert snapshot.splitlines()[-1].startswith("…ほか")
+
+
+async def test_snapshot_failure_is_optional():
+    builder = TaskSnapshotBuilder(FakeQueryUserTasks([], error=RuntimeError("db down")))
+
+    assert await builder.build("U1") is None
+
+
+async def test_snapshot_runs_in_its_own_unit_of_work():
+    scopes: list[str] = []
+
+    @asynccontextmanager
+    async def unit_of_work():
+        scopes.append("opened")
+        yield
+
+    builder = TaskSnapshotBuilder(FakeQueryUserTasks([_task("日報")]), unit_of_work=unit_of_work)
+
+    assert builder.concurrent
+    assert not TaskSnapshotBuilder(FakeQueryUserTasks([])).concurrent
+    assert await builder.build("U1")
+    assert scopes == ["opened"]
+
+
+def test_snapshot_follows_the_cache_breakpoint():
+    service = ClaudeAgentService(anthropic_client=None, tools=[])
+
+    system = service._build_system_prompt(task_snapshot="# ユーザーの未完了タスク（1件）")
+
+    assert "cache_control" in system[0]
+    assert system[-1] == {"type": "text", "text": "# ユーザーの未完了タスク（1件）"}
@@ -0,0 +1,164 @@
+"""Unit tests for ResilientAnthropicClient and CircuitBreaker"""
+
+import asyncio
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from src.infrastructure.claude_gateway import CircuitBreaker, ClaudeUnavailableError, ResilientAnthropicClient
+
+_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+def _status_error(status_code: int, headers: dict | None = None) -> anthropic.APIStatusError:
+    response = httpx.Response(status_code, request=_REQUEST, headers=headers or {})
+    return anthropic.APIStatusError(f"status {status_code}", response=response, body=None)
+
+
+class FakeStream:
+    def __init__(self):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+        return False
+
+
+class FakeMessages:
+    """Raises the queued errors in order, then succeeds"""
+
+    def __init__(self, errors: list[Exception] | None = None, delay: float = 0.0):
+        self.errors = list(errors or [])
+        self.delay = delay
+        self.calls = 0
+        self.streams: list[FakeStream] = []
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(content="ok")
+
+    def stream(self, **kwargs):
+        self.calls += 1
+        errors = self.errors
+
+        class Opening(FakeStream):
+            async def __aenter__(self):
+                if errors:
+                    raise errors.pop(0)
+                return self
+
+        stream = Opening()
+        self.streams.append(stream)
+        return stream
+
+
+def _client(messages: FakeMessages, **kwargs) -> ResilientAnthropicClient:
+    kwargs.setdefault("base_backoff_seconds", 0.001)
+    return ResilientAnthropicClient(SimpleNamespace(messages=messages), **kwargs)
+
+
+async def test_overload_is_retried():
+    messages = FakeMessages([_status_error(529), _status_error(429)])
+
+    result = await _client(messages).messages.create(model="m", messages=[])
+
+    assert result.content == "ok"
+    assert messages.calls == 3
+
+
+async def test_retry_after_is_honored():
+    messages = FakeMessages([_status_error(429, {"retry-after-ms": "50"})])
+
+    started = asyncio.get_running_loop().time()
+    await _client(messages).messages.create(model="m", messages=[])
+
+    assert asyncio.get_running_loop().time() - started >= 0.05
+
+
+async def test_non_retryable_error_is_raised_unchanged():
+    messages = FakeMessages([_status_error(400)])
+
+    with pytest.raises(anthropic.APIStatusError):
+        await _client(messages).messages.create(model="m", messages=[])
+    assert messages.calls == 1
+
+
+async def test_exhausted_retries_raise_unavailable():
+    messages = FakeMessages([_status_error(500)] * 3)
+
+    with pytest.raises(ClaudeUnavailableError):
+        await _client(messages, max_retries=2).messages.create(model="m", messages=[])
+    assert messages.calls == 3
+
+
+async def test_deadline_bounds_a_slow_call():
+    messages = FakeMessages(delay=1.0)
+
+    with pytest.raises(ClaudeUnavailableError, match="deadline"):
+        await _client(messages, deadline_seconds=0.05).messages.create(model="m", messages=[])
+
+
+async def test_calls_beyond_concurrency_cap_are_shed():
+    messages = FakeMessages(delay=0.2)
+    client = _client(messages, max_concurrent=1)
+
+    results = await asyncio.gather(
+        client.messages.create(model="m", messages=[]),
+        client.create(deadline_seconds=0.05, model="m", messages=[]),
+        return_exceptions=True,
+    )
+
+    assert results[0].content == "ok"
+    assert isinstance(results[1], ClaudeUnavailableError)
+    assert messages.calls == 1
+
+
+async def test_open_circuit_rejects_without_calling():
+    messages = FakeMessages([_status_error(529)] * 2)
+    client = _client(messages, max_retries=0, breaker=CircuitBreaker(failure_threshold=2))
+
+    for _ in range(2):
+        with pytest.raises(ClaudeUnavailableError):
+            await client.messages.create(model="m", messages=[])
+    with pytest.raises(ClaudeUnavailableError, match="circuit open") as excinfo:
+        await client.messages.create(model="m", messages=[])
+
+    assert messages.calls == 2
+    assert excinfo.value.retry_after > 0
+
+
+def test_circuit_half_opens_after_reset_timeout():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.allow()  # the trial call
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+async def test_stream_open_is_retried():
+    messages = FakeMessages([anthropic.APIConnectionError(request=_REQUEST)])
+
+    async with _client(messages).messages.stream(model="m", messages=[]) as stream:
+        assert stream is messages.streams[-1]
+
+    assert messages.calls == 2
+    assert stream.closed
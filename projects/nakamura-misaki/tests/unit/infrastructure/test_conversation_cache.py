@@ -0,0 +1,126 @@
+"""Unit tests for the in-process conversation cache"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.repositories.cached_conversation_repository import (
+    CachedConversationRepository,
+    ConversationCache,
+)
+
+
+@pytest.fixture
+def cache():
+    return ConversationCache(max_size=10)
+
+
+@pytest.fixture
+def repository(cache):
+    session = ScopedSession()
+    return CachedConversationRepository(PostgreSQLConversationRepository(session), cache, session)
+
+
+def _conversation(user_id: str = "U1", turns: int = 1) -> Conversation:
+    conversation = Conversation.create(user_id=user_id, channel_id="C1")
+    for i in range(turns):
+        conversation.add_message(Message.user(f"u{i}"))
+        conversation.add_message(Message.assistant(f"a{i}"))
+    return conversation
+
+
+async def test_active_conversation_is_served_without_db_reads(db_manager, repository):
+    conversation = _conversation()
+    async with db_manager.request_scope():
+        await repository.save(conversation)
+
+    statements = []
+    async with db_manager.request_scope() as session:
+        connection = await session.connection()
+        event.listen(connection.sync_connection, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        loaded = await repository.get_by_user_and_channel("U1", "C1")
+        loaded.add_message(Message.user("next"))
+        await repository.save(loaded)
+        reloaded = await repository.get_by_user_and_channel("U1", "C1")
+
+    assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+    assert loaded is not conversation
+    assert [m.content for m in reloaded.messages] == ["u0", "a0", "next"]
+
+
+async def test_uncommitted_changes_never_reach_the_cache(db_manager, repository):
+    conversation = _conversation()
+    async with db_manager.request_scope():
+        await repository.save(conversation)
+
+    # A turn that fails after mutating its copy
+    async with db_manager.request_scope():
+        failed = await repository.get_by_user_and_channel("U1", "C1")
+        failed.add_message(Message.user("lost"))
+
+    # A turn whose save is rolled back
+    with pytest.raises(RuntimeError):
+        async with db_manager.request_scope():
+            rolled_back = await repository.get_by_user_and_channel("U1", "C1")
+            rolled_back.add_message(Message.user("rolled back"))
+            await repository.save(rolled_back)
+            raise RuntimeError("Slack post failed")
+
+    async with db_manager.request_scope():
+        current = await repository.get_by_user_and_channel("U1", "C1")
+
+    assert [m.content for m in current.messages] == ["u0", "a0"]
+
+
+async def test_background_summary_survives_a_concurrent_turn(db_manager, repository, cache):
+    conversation = _conversation(turns=4)
+    async with db_manager.request_scope():
+        await repository.save(conversation)
+        turn = await repository.get_by_user_and_channel("U1", "C1")
+
+    async with db_manager.request_scope():
+        assert await repository.save_summary(conversation.id, "要約", 4)
+    async with db_manager.request_scope():
+        turn.add_message(Message.user("next"))
+        await repository.save(turn)
+
+    cached = cache.get("U1", "C1")
+    assert (cached.summary, cached.summarized_count) == ("要約", 4)
+    assert cached.message_offset == 4
+    assert cached.messages[-1].content == "next"
+
+
+def test_least_recently_used_and_expired_entries_are_dropped():
+    cache = ConversationCache(max_size=2)
+    first, second, third = _conversation("U1"), _conversation("U2"), _conversation("U3")
+    cache.put(first)
+    cache.put(second)
+    cache.get("U1", "C1")
+    cache.put(third)
+
+    assert cache.get("U2", "C1") is None
+    assert cache.get("U1", "C1") is not None
+
+    third.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+    cache.put(third)
+    assert cache.get("U3", "C1") is None
+    assert len(cache) == 1
+
+
+def test_listeners_hear_local_changes_and_invalidate_drops_entries():
+    cache = ConversationCache()
+    changes = []
+    cache.add_listener(lambda user_id, channel_id: changes.append((user_id, channel_id)))
+    cache.put(_conversation())
+
+    cache.notify_changed("U1", "C1")
+    cache.invalidate("U1", "C1")
+
+    assert changes == [("U1", "C1")]
+    assert cache.get("U1", "C1") is None
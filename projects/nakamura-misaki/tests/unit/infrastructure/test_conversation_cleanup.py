@@ -0,0 +1,63 @@
+"""Unit tests for the batched expired-conversation cleanup"""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event, func, select
+
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.domain.services.conversation_manager import ConversationManager
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import ConversationTable
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.jobs import ConversationCleanupJob
+from src.infrastructure.metrics import get_metrics
+
+
+async def _save(db_manager: DatabaseManager, user_id: str, expires_in: timedelta) -> None:
+    conversation = Conversation.create(user_id=user_id, channel_id="C1", messages=[Message.user("hi")])
+    conversation.expires_at = datetime.now(UTC) + expires_in
+    async with db_manager.session() as session:
+        await PostgreSQLConversationRepository(session).save(conversation)
+
+
+async def test_cleanup_deletes_expired_conversations_in_batches(db_manager):
+    for i in range(5):
+        await _save(db_manager, f"UOLD{i}", timedelta(hours=-1))
+    await _save(db_manager, "UACTIVE", timedelta(hours=1))
+    job = ConversationCleanupJob(
+        PostgreSQLConversationRepository(ScopedSession()),
+        batch_size=2,
+        unit_of_work=db_manager.request_scope,
+    )
+    deletes = []
+    event.listen(
+        db_manager._engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: deletes.append(args[2]) if args[2].lstrip().startswith("DELETE") else None,
+    )
+    before = get_metrics().get_metrics()["counters"].get("conversation_cleanup.deleted", 0)
+
+    deleted = await job._cleanup_expired_conversations()
+
+    async with db_manager.session() as session:
+        remaining = (await session.execute(select(ConversationTable.user_id))).scalars().all()
+    assert deleted == 5
+    assert len(deletes) == 3  # 2 + 2 + 1
+    assert remaining == ["UACTIVE"]
+    assert get_metrics().get_metrics()["counters"]["conversation_cleanup.deleted"] - before == 5
+
+
+async def test_activity_slides_the_stored_expiry(db_manager):
+    conversation = Conversation.create(user_id="U1", channel_id="C1", ttl_hours=1)
+    conversation.expires_at = datetime.now(UTC) + timedelta(minutes=1)
+    async with db_manager.request_scope():
+        manager = ConversationManager(PostgreSQLConversationRepository(ScopedSession()), ttl_hours=48)
+        conversation.add_message(Message.user("hi"))
+        await manager.save(conversation)
+
+    async with db_manager.session() as session:
+        expires_at = (await session.execute(select(func.max(ConversationTable.expires_at)))).scalar_one()
+    assert expires_at.replace(tzinfo=UTC) > datetime.now(UTC) + timedelta(hours=47)
@@ -0,0 +1,99 @@
+"""Unit tests for write-behind conversation persistence"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import event, func, select
+
+from src.contexts.personal_tasks.domain.models.conversation import Conversation, Message
+from src.contexts.personal_tasks.infrastructure.repositories.postgresql_conversation_repository import (
+    PostgreSQLConversationRepository,
+)
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import ConversationMessageTable, ConversationTable
+from src.infrastructure.database.session_scope import ScopedSession
+from src.infrastructure.repositories.write_behind_conversation_repository import (
+    ConversationWriteBehind,
+    WriteBehindConversationRepository,
+)
+
+
+def _repository(write_behind: ConversationWriteBehind) -> WriteBehindConversationRepository:
+    return WriteBehindConversationRepository(PostgreSQLConversationRepository(ScopedSession()), write_behind)
+
+
+async def _stored_messages(db_manager: DatabaseManager) -> list[str]:
+    async with db_manager.session() as session:
+        result = await session.execute(select(ConversationMessageTable.content).order_by(ConversationMessageTable.seq))
+        return list(result.scalars())
+
+
+async def test_save_returns_before_the_write_and_reads_see_the_pending_turn(db_manager):
+    statements = []
+    event.listen(db_manager._engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    write_behind = ConversationWriteBehind(unit_of_work=db_manager.request_scope, flush_interval_seconds=0.05)
+    repository = _repository(write_behind)
+    conversation = Conversation.create(user_id="U1", channel_id="C1", messages=[Message.user("u0")])
+
+    await repository.save(conversation)
+    conversation.add_message(Message.assistant("not saved yet"))
+    pending = await repository.get_by_user_and_channel("U1", "C1")
+
+    assert statements == []
+    assert [m.content for m in pending.messages] == ["u0"]
+
+    # The next turn builds on the pending snapshot; both turns reach the DB in order
+    pending.add_message(Message.assistant("a0"))
+    await repository.save(pending)
+    await write_behind.close()
+
+    assert await _stored_messages(db_manager) == ["u0", "a0"]
+    assert write_behind.pending_count == 0
+    with pytest.raises(RuntimeError):
+        write_behind.enqueue(repository, conversation)
+
+
+async def test_concurrent_turns_are_flushed_in_one_unit_of_work(db_manager):
+    scopes = []
+
+    @asynccontextmanager
+    async def unit_of_work():
+        scopes.append(1)
+        async with db_manager.request_scope() as session:
+            yield session
+
+    write_behind = ConversationWriteBehind(unit_of_work=unit_of_work, flush_interval_seconds=0.05)
+    repository = _repository(write_behind)
+    for i in range(3):
+        await repository.save(Conversation.create(user_id=f"U{i}", channel_id="C1", messages=[Message.user("hi")]))
+    await write_behind.close()
+
+    async with db_manager.session() as session:
+        stored = (await session.execute(select(func.count()).select_from(ConversationTable))).scalar_one()
+    assert stored == 3
+    assert len(scopes) == 1
+
+
+async def test_failed_batch_is_retried(db_manager):
+    failures = [RuntimeError("connection reset")]
+
+    @asynccontextmanager
+    async def flaky_unit_of_work():
+        async with db_manager.request_scope() as session:
+            yield session
+            if failures:
+                raise failures.pop()
+
+    write_behind = ConversationWriteBehind(
+        unit_of_work=flaky_unit_of_work,
+        flush_interval_seconds=0,
+        retry_delay_seconds=0,
+    )
+    repository = _repository(write_behind)
+    await repository.save(
+        Conversation.create(user_id="U1", channel_id="C1", messages=[Message.user("u0"), Message.assistant("a0")])
+    )
+    await write_behind.close()
+
+    assert failures == []
+    assert await _stored_messages(db_manager) == ["u0", "a0"]
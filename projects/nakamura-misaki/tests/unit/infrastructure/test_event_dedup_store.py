@@ -0,0 +1,100 @@
+"""Unit tests for Slack event deduplication stores"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import SlackProcessedEventTable
+from src.infrastructure.dedup import InMemoryEventDedupStore, PostgreSQLEventDedupStore
+
+
+class TestInMemoryEventDedupStore:
+    """Test suite for InMemoryEventDedupStore"""
+
+    async def test_duplicate_is_rejected(self):
+        store = InMemoryEventDedupStore()
+
+        assert await store.mark_seen("Ev1") is True
+        assert await store.mark_seen("Ev1") is False
+
+    async def test_size_cap_evicts_oldest_entry(self):
+        store = InMemoryEventDedupStore(max_size=2)
+
+        await store.mark_seen("Ev1")
+        await store.mark_seen("Ev2")
+        await store.mark_seen("Ev3")
+
+        assert len(store) == 2
+        # Oldest (Ev1) was evicted, newer ones are still remembered
+        assert await store.mark_seen("Ev3") is False
+        assert await store.mark_seen("Ev2") is False
+        assert await store.mark_seen("Ev1") is True
+
+    async def test_entries_expire_after_ttl(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("src.infrastructure.dedup.event_dedup_store.time.monotonic", lambda: clock[0])
+        store = InMemoryEventDedupStore(ttl_seconds=60)
+
+        await store.mark_seen("Ev1")
+        clock[0] += 61
+
+        assert await store.mark_seen("Ev1") is True
+
+    async def test_release_forgets_event(self):
+        store = InMemoryEventDedupStore()
+        await store.mark_seen("Ev1")
+
+        await store.release("Ev1")
+
+        assert await store.mark_seen("Ev1") is True
+
+
+class TestPostgreSQLEventDedupStore:
+    """Test suite for PostgreSQLEventDedupStore (SQLite backend)"""
+
+    @pytest.fixture
+    async def db_manager(self, tmp_path):
+        manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'dedup.db'}")
+        await manager.create_tables()
+        yield manager
+        await manager.close()
+
+    async def test_duplicate_seen_by_another_worker_is_rejected(self, db_manager: DatabaseManager):
+        worker_a = PostgreSQLEventDedupStore(db_manager)
+        worker_b = PostgreSQLEventDedupStore(db_manager)
+
+        assert await worker_a.mark_seen("Ev1") is True
+        assert await worker_b.mark_seen("Ev1") is False
+
+    async def test_expired_entry_is_claimable_again(self, db_manager: DatabaseManager):
+        await PostgreSQLEventDedupStore(db_manager, ttl_seconds=60).mark_seen("Ev1")
+        async with db_manager.session() as session:
+            await session.execute(
+                update(SlackProcessedEventTable).values(received_at=datetime.now(UTC) - timedelta(minutes=5))
+            )
+
+        assert await PostgreSQLEventDedupStore(db_manager, ttl_seconds=60).mark_seen("Ev1") is True
+
+    async def test_release_allows_retry(self, db_manager: DatabaseManager):
+        store = PostgreSQLEventDedupStore(db_manager)
+        await store.mark_seen("Ev1")
+
+        await store.release("Ev1")
+
+        assert await PostgreSQLEventDedupStore(db_manager).mark_seen("Ev1") is True
+
+    async def test_failed_insert_does_not_mark_the_event_locally(self, db_manager: DatabaseManager, monkeypatch):
+        store = PostgreSQLEventDedupStore(db_manager)
+
+        async def unavailable(event_id: str) -> bool:
+            raise ConnectionError("database unavailable")
+
+        monkeypatch.setattr(store, "_claim", unavailable)
+        with pytest.raises(ConnectionError):
+            await store.mark_seen("Ev1")
+        monkeypatch.undo()
+
+        # Slack's retry reaches this worker again
+        assert await store.mark_seen("Ev1") is True
@@ -0,0 +1,180 @@
+"""Unit tests for PostgreSQLJobQueue and JobWorkerPool (SQLite backend)"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.schema import SlackJobTable
+from src.infrastructure.queue import Job, JobStatus, JobWorkerPool, PostgreSQLJobQueue
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """File-backed SQLite database (shared across pooled connections)"""
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    await manager.create_tables()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def queue(db_manager: DatabaseManager) -> PostgreSQLJobQueue:
+    return PostgreSQLJobQueue(db_manager, visibility_timeout_seconds=60, max_attempts=2, retry_backoff_seconds=0)
+
+
+async def _job_rows(db_manager: DatabaseManager) -> list:
+    async with db_manager.session() as session:
+        result = await session.execute(select(SlackJobTable).order_by(SlackJobTable.id))
+        return list(result.scalars().all())
+
+
+async def test_enqueue_and_dequeue_in_order(queue: PostgreSQLJobQueue):
+    """Jobs are claimed in enqueue order and only once"""
+    first = await queue.enqueue("slack_message", {"text": "first"})
+    second = await queue.enqueue("slack_message", {"text": "second"})
+
+    jobs = await queue.dequeue("worker-1", limit=5)
+
+    assert [job.id for job in jobs] == [first, second]
+    assert jobs[0].payload == {"text": "first"}
+    assert all(job.attempts == 1 for job in jobs)
+    assert await queue.dequeue("worker-2", limit=5) == []
+
+
+async def test_delayed_job_not_available_yet(queue: PostgreSQLJobQueue):
+    await queue.enqueue("slack_message", {"text": "later"}, delay_seconds=60)
+
+    assert await queue.dequeue("worker-1") == []
+
+
+async def test_complete_removes_job(queue: PostgreSQLJobQueue, db_manager: DatabaseManager):
+    await queue.enqueue("slack_message", {"text": "hi"})
+    [job] = await queue.dequeue("worker-1")
+
+    await queue.complete(job)
+
+    assert await _job_rows(db_manager) == []
+
+
+async def test_fail_retries_then_marks_dead(queue: PostgreSQLJobQueue, db_manager: DatabaseManager):
+    await queue.enqueue("slack_message", {"text": "boom"})
+
+    [job] = await queue.dequeue("worker-1")
+    await queue.fail(job, "first failure")
+    [retry] = await queue.dequeue("worker-1")
+    assert retry.attempts == 2
+
+    await queue.fail(retry, "second failure")
+
+    [row] = await _job_rows(db_manager)
+    assert row.status == JobStatus.DEAD
+    assert row.last_error == "second failure"
+    assert await queue.dequeue("worker-1") == []
+
+
+async def test_expired_lease_is_reclaimed(queue: PostgreSQLJobQueue, db_manager: DatabaseManager):
+    """A job whose worker died becomes claimable after the visibility timeout"""
+    await queue.enqueue("slack_message", {"text": "orphan"})
+    [job] = await queue.dequeue("worker-1")
+
+    async with db_manager.session() as session:
+        await session.execute(
+            update(SlackJobTable).values(locked_until=datetime.now(UTC) - timedelta(seconds=1))
+        )
+
+    [reclaimed] = await queue.dequeue("worker-2")
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+
+    # The stale worker can no longer complete the job it lost
+    await queue.complete(job)
+    assert len(await _job_rows(db_manager)) == 1
+
+
+async def test_worker_pool_processes_jobs(queue: PostgreSQLJobQueue, db_manager: DatabaseManager):
+    processed: list[str] = []
+    done = asyncio.Event()
+
+    async def handler(job: Job) -> None:
+        processed.append(job.payload["text"])
+        if len(processed) == 2:
+            done.set()
+
+    pool = JobWorkerPool(queue, handler, concurrency=2, poll_interval_seconds=0.05)
+    await pool.start()
+    await queue.enqueue("slack_message", {"text": "a"})
+    await queue.enqueue("slack_message", {"text": "b"})
+    pool.notify()
+
+    await asyncio.wait_for(done.wait(), timeout=5)
+    await pool.stop()
+
+    assert sorted(processed) == ["a", "b"]
+    assert await _job_rows(db_manager) == []
+
+
+async def test_same_conversation_key_is_claimed_in_order(queue: PostgreSQLJobQueue):
+    """A later job of a conversation waits until the earlier one finishes"""
+    first = await queue.enqueue("slack_message", {"text": "1"}, conversation_key="U1:C1")
+    await queue.enqueue("slack_message", {"text": "2"}, conversation_key="U1:C1")
+    other = await queue.enqueue("slack_message", {"text": "x"}, conversation_key="U2:C1")
+
+    claimed = await queue.dequeue("worker-1", limit=5)
+    assert [job.id for job in claimed] == [first, other]
+
+    await queue.complete(claimed[0])
+    [second] = await queue.dequeue("worker-2", limit=5)
+    assert second.payload == {"text": "2"}
+
+
+def _merge_texts(payloads: list[dict]) -> dict:
+    return {"text": "\n".join(payload["text"] for payload in payloads)}
+
+
+async def test_burst_is_coalesced_into_one_job(db_manager: DatabaseManager):
+    """Later pending jobs of a conversation are merged into the claimed job"""
+    queue = PostgreSQLJobQueue(db_manager, payload_mergers={"slack_message": _merge_texts})
+    first = await queue.enqueue("slack_message", {"text": "明日"}, conversation_key="U1:C1")
+    await queue.enqueue("slack_message", {"text": "10時に"}, conversation_key="U1:C1")
+    other = await queue.enqueue("slack_message", {"text": "x"}, conversation_key="U2:C1")
+
+    claimed = await queue.dequeue("worker-1", limit=5)
+
+    assert [job.id for job in claimed] == [first, other]
+    assert claimed[0].payload == {"text": "明日\n10時に"}
+    assert len(claimed[0].coalesced_ids) == 1
+    # The merged payload is persisted so a retry replays the whole burst
+    await queue.fail(claimed[0], "boom")
+    assert [row.payload for row in await _job_rows(db_manager)] == [{"text": "明日\n10時に"}, {"text": "x"}]
+
+
+async def test_debounce_window_postpones_burst(db_manager: DatabaseManager):
+    queue = PostgreSQLJobQueue(
+        db_manager,
+        payload_mergers={"slack_message": _merge_texts},
+        coalesce_window_seconds=60,
+        coalesce_max_wait_seconds=120,
+    )
+    await queue.enqueue("slack_message", {"text": "a"}, conversation_key="U1:C1")
+    assert await queue.dequeue("worker-1") == []
+
+    # Make the burst look due, then a new message pushes it back again
+    async with db_manager.session() as session:
+        await session.execute(update(SlackJobTable).values(available_at=datetime.now(UTC) - timedelta(seconds=1)))
+    await queue.enqueue("slack_message", {"text": "b"}, conversation_key="U1:C1")
+    assert await queue.dequeue("worker-1") == []
+
+    # A burst older than the max wait is no longer postponed
+    async with db_manager.session() as session:
+        await session.execute(
+            update(SlackJobTable).values(
+                available_at=datetime.now(UTC) - timedelta(seconds=1),
+                created_at=datetime.now(UTC) - timedelta(seconds=300),
+            )
+        )
+    await queue.enqueue("slack_message", {"text": "c"}, conversation_key="U1:C1")
+    [job] = await queue.dequeue("worker-1")
+    assert job.payload == {"text": "a\nb\nc"}
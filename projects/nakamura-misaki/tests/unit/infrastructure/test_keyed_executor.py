@@ -0,0 +1,69 @@
+"""Unit tests for KeyedExecutor"""
+
+import asyncio
+
+from src.infrastructure.queue import KeyedExecutor
+
+
+async def test_same_key_runs_in_submission_order():
+    executor = KeyedExecutor(max_concurrency=4)
+    events: list[str] = []
+
+    async def step(name: str, delay: float) -> str:
+        events.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        events.append(f"end:{name}")
+        return name
+
+    results = await asyncio.gather(
+        executor.run(("U1", "C1"), "U1", lambda: step("first", 0.05)),
+        executor.run(("U1", "C1"), "U1", lambda: step("second", 0)),
+    )
+
+    assert results == ["first", "second"]
+    assert events == ["start:first", "end:first", "start:second", "end:second"]
+    assert executor.active_keys == 0
+
+
+async def test_different_keys_run_in_parallel():
+    executor = KeyedExecutor(max_concurrency=4)
+    both_started = asyncio.Event()
+    running = 0
+
+    async def step() -> None:
+        nonlocal running
+        running += 1
+        if running == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    await asyncio.gather(
+        executor.run(("U1", "C1"), "U1", step),
+        executor.run(("U2", "C1"), "U2", step),
+    )
+
+
+async def test_global_and_per_user_limits():
+    executor = KeyedExecutor(max_concurrency=3, max_concurrency_per_user=1)
+    running: dict[str, int] = {}
+    peak_total = 0
+    peak_per_user = 0
+
+    async def step(user_id: str) -> None:
+        nonlocal peak_total, peak_per_user
+        running[user_id] = running.get(user_id, 0) + 1
+        peak_total = max(peak_total, sum(running.values()))
+        peak_per_user = max(peak_per_user, running[user_id])
+        await asyncio.sleep(0.01)
+        running[user_id] -= 1
+
+    await asyncio.gather(
+        *[
+            executor.run((user_id, channel), user_id, lambda u=user_id: step(u))
+            for user_id in ("U1", "U2", "U3", "U4")
+            for channel in ("C1", "C2")
+        ]
+    )
+
+    assert peak_total <= 3
+    assert peak_per_user == 1
@@ -0,0 +1,144 @@
+"""Unit tests for the record/replay cassette server"""
+
+import time
+
+import pytest
+from aiohttp import web
+from anthropic import AsyncAnthropic, NotFoundError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.infrastructure.replay import Cassette, CassetteServer, Interaction, LatencyModel
+
+MESSAGE_RESPONSE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "test-model",
+    "content": [{"type": "text", "text": "了解した。"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 120, "output_tokens": 8, "cache_read_input_tokens": 1000},
+}
+
+
+@pytest.fixture
+async def upstream():
+    """Stand-in for the real Anthropic API"""
+    requests = []
+
+    async def messages(request: web.Request) -> web.Response:
+        requests.append(await request.json())
+        return web.json_response(MESSAGE_RESPONSE)
+
+    app = web.Application()
+    app.router.add_post("/v1/messages", messages)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    yield f"http://127.0.0.1:{runner.addresses[0][1]}", requests
+    await runner.cleanup()
+
+
+async def _create(base_url: str, now: str):
+    client = AsyncAnthropic(api_key="sk-ant-secret", base_url=base_url, max_retries=0)
+    try:
+        return await client.messages.create(
+            model="test-model",
+            max_tokens=100,
+            system=f"現在時刻: {now}",
+            messages=[{"role": "user", "content": "おはよう"}],
+        )
+    finally:
+        await client.close()
+
+
+async def test_recorded_exchange_replays_offline(upstream, tmp_path):
+    upstream_url, upstream_requests = upstream
+    recorder = CassetteServer(Cassette(), upstream=upstream_url)
+    await recorder.start()
+    try:
+        recorded = await _create(recorder.url, "2026-10-17 09:00:00")
+    finally:
+        await recorder.close()
+    recorder.cassette.save(tmp_path / "anthropic.json")
+    assert "sk-ant-secret" not in (tmp_path / "anthropic.json").read_text()  # no API key in the cassette
+
+    replayer = CassetteServer(Cassette.load(tmp_path / "anthropic.json"), latency=LatencyModel(scale=0, extra_ms=50))
+    await replayer.start()
+    try:
+        started = time.monotonic()
+        # Another day: the masked timestamp still matches the recording
+        replayed = await _create(replayer.url, "2026-10-18 21:30:00")
+        elapsed = time.monotonic() - started
+    finally:
+        await replayer.close()
+
+    assert len(upstream_requests) == 1
+    assert replayed.content[0].text == recorded.content[0].text == "了解した。"
+    assert elapsed >= 0.05
+    assert (replayer.stats.input_tokens, replayer.stats.output_tokens) == (120, 8)
+    assert replayer.stats.cache_read_input_tokens == 1000
+
+
+async def test_strict_replay_misses_unknown_requests():
+    server = CassetteServer(Cassette(), latency=LatencyModel(scale=0))
+    await server.start()
+    try:
+        with pytest.raises(NotFoundError):
+            await _create(server.url, "2026-10-17 09:00:00")
+    finally:
+        await server.close()
+
+    assert server.stats.misses == 1
+
+
+async def test_lenient_replay_reuses_same_endpoint_response():
+    recorded = Interaction(
+        method="POST",
+        path="/api/chat.postMessage",
+        request_body='{"channel": "DBAAAAAAAA", "text": "first reply"}',
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body='{"ok": true, "ts": "1760000000.000100"}',
+    )
+    server = CassetteServer(Cassette([recorded]), latency=LatencyModel(scale=0), strict=False)
+    await server.start()
+    client = AsyncWebClient(token="xoxb-test", base_url=server.url + "/api/")
+    try:
+        first = await client.chat_postMessage(channel="DBBBBBBBBB", text="another reply")
+        second = await client.chat_postMessage(channel="DBBBBBBBBB", text="yet another reply")
+    finally:
+        await server.close()
+
+    assert first["ts"] == second["ts"] == "1760000000.000100"
+    assert server.stats.misses == 0
+
+
+def test_match_prefers_unused_exact_fingerprint():
+    first = Interaction("POST", "/v1/messages", '{"text": "a"}', 200, body="A1")
+    second = Interaction("POST", "/v1/messages", '{"text": "b"}', 200, body="B")
+    third = Interaction("POST", "/v1/messages", '{"text": "a"}', 200, body="A2")
+    cassette = Cassette([first, second, third])
+
+    bodies = [cassette.match("POST", "/v1/messages", '{"text": "a"}').body for _ in range(3)]
+
+    assert bodies == ["A1", "A2", "A2"]
+
+
+def test_strict_match_misses_a_diverged_request():
+    recorded = Interaction("POST", "/v1/messages", '{"text": "a"}', 200, body="A")
+    cassette = Cassette([recorded])
+
+    assert cassette.match("POST", "/v1/messages", '{"text": "a, after a tool error"}') is None
+
+
+def test_lenient_match_falls_back_to_the_endpoint():
+    first = Interaction("POST", "/api/chat.postMessage", '{"text": "a"}', 200, body="A")
+    second = Interaction("POST", "/api/chat.postMessage", '{"text": "b"}', 200, body="B")
+    cassette = Cassette([first, second])
+
+    # Unknown bodies: unused responses of the endpoint in recording order, then the last one
+    bodies = [cassette.match("POST", "/api/chat.postMessage", f'{{"text": "{c}"}}', strict=False).body for c in "cde"]
+
+    assert bodies == ["A", "B", "B"]
@@ -0,0 +1,65 @@
+"""Unit tests for the request-scoped session used by the application graph"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.database.session_scope import NoActiveSessionError, ScopedSession, session_scope
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'scope.db'}")
+    async with manager.session() as session:
+        await session.execute(text("CREATE TABLE items (name TEXT)"))
+    yield manager
+    await manager.close()
+
+
+class ItemRepository:
+    """Repository built once, like the ones in the shared DIContainer"""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def add(self, name: str) -> None:
+        await self._session.execute(text("INSERT INTO items VALUES (:name)"), {"name": name})
+
+    async def count(self) -> int:
+        return (await self._session.execute(text("SELECT count(*) FROM items"))).scalar_one()
+
+
+def test_scoped_session_outside_scope_raises():
+    with pytest.raises(NoActiveSessionError):
+        ScopedSession().execute
+
+
+async def test_request_scope_binds_and_commits(db_manager):
+    repository = ItemRepository(ScopedSession())
+
+    async with db_manager.request_scope():
+        await repository.add("a")
+    async with db_manager.request_scope():
+        assert await repository.count() == 1
+
+    with pytest.raises(NoActiveSessionError):
+        await repository.count()
+
+
+async def test_concurrent_scopes_use_their_own_session():
+    scoped = ScopedSession()
+
+    async def read_name() -> str:
+        await asyncio.sleep(0)
+        return scoped.name
+
+    async def unit_of_work(name: str) -> list[str]:
+        with session_scope(SimpleNamespace(name=name)):
+            await asyncio.sleep(0)
+            # Tasks spawned inside the scope (e.g. parallel tools) inherit the binding
+            return await asyncio.gather(read_name(), read_name())
+
+    assert await asyncio.gather(unit_of_work("s1"), unit_of_work("s2")) == [["s1", "s1"], ["s2", "s2"]]
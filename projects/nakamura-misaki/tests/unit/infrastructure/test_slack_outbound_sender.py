@@ -0,0 +1,119 @@
+"""Unit tests for SlackOutboundSender and TokenBucket"""
+
+import asyncio
+import time
+
+import pytest
+from slack_sdk.errors import SlackApiError, SlackClientError
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+from src.infrastructure.slack_outbound import SlackOutboundSender, TokenBucket
+
+
+def _response(status_code: int, data: dict | bytes, headers: dict | None = None) -> AsyncSlackResponse:
+    return AsyncSlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://slack.com/api/chat.postMessage",
+        req_args={},
+        data=data,
+        headers=headers or {},
+        status_code=status_code,
+    )
+
+
+class FakeSlackClient:
+    """Fails the first ``failures`` calls with the given response"""
+
+    def __init__(self, failures: list[AsyncSlackResponse] | None = None):
+        self.failures = list(failures or [])
+        self.calls: list[tuple[str, dict]] = []
+
+    async def api_call(self, method: str, json: dict):
+        self.calls.append((method, json))
+        if self.failures:
+            response = self.failures.pop(0)
+            raise SlackApiError(response.data["error"], response)
+        return _response(200, {"ok": True, "ts": str(len(self.calls))})
+
+
+async def test_token_bucket_throttles_after_burst():
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    # 2 burst tokens, then 2 more at 20/s
+    assert time.monotonic() - started >= 0.09
+
+
+async def test_post_message_sends_immediately():
+    client = FakeSlackClient()
+    sender = SlackOutboundSender(client)
+
+    result = await sender.post_message("C1", "hello", unfurl_links=False)
+
+    assert result == {"ok": True, "ts": "1"}
+    assert client.calls == [("chat.postMessage", {"channel": "C1", "text": "hello", "unfurl_links": False})]
+
+
+async def test_rate_limited_call_is_retried_after_retry_after():
+    client = FakeSlackClient([_response(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": "0.05"})])
+    sender = SlackOutboundSender(client)
+
+    assert await sender.post_message("C1", "hello") is None
+    assert sender.pending_retries == 1
+
+    await sender.close(timeout_seconds=5)
+
+    assert len(client.calls) == 2
+    assert sender.pending_retries == 0
+
+
+async def test_call_is_dropped_after_max_retries():
+    server_error = _response(500, {"ok": False, "error": "internal_error"})
+    client = FakeSlackClient([server_error] * 3)
+    sender = SlackOutboundSender(client, max_retries=2, default_retry_after_seconds=0.01)
+
+    await sender.post_message("C1", "hello")
+    await sender.close(timeout_seconds=5)
+
+    assert len(client.calls) == 3
+
+
+async def test_non_retryable_error_is_raised():
+    client = FakeSlackClient([_response(200, {"ok": False, "error": "channel_not_found"})])
+    sender = SlackOutboundSender(client)
+
+    with pytest.raises(SlackApiError):
+        await sender.post_message("C404", "hello")
+    assert sender.pending_retries == 0
+
+
+class BinarySlackClient(FakeSlackClient):
+    """Answers with a non-JSON body (e.g. an HTML error page from a proxy)"""
+
+    async def api_call(self, method: str, json: dict):
+        self.calls.append((method, json))
+        return _response(200, b"<html>proxy error</html>")
+
+
+async def test_non_json_response_is_raised():
+    sender = SlackOutboundSender(BinarySlackClient())
+
+    with pytest.raises(SlackClientError, match="non-JSON"):
+        await sender.post_message("C1", "hello")
+    assert sender.pending_retries == 0
+
+
+async def test_full_retry_queue_drops_calls():
+    rate_limited = _response(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": "0"})
+    client = FakeSlackClient([rate_limited, rate_limited])
+    sender = SlackOutboundSender(client, retry_queue_size=1, method_rates={"chat.postMessage": 100})
+
+    await sender.post_message("C1", "a")
+    await sender.post_message("C2", "b")
+
+    assert sender.pending_retries == 1
+    await asyncio.wait_for(sender.close(), timeout=5)
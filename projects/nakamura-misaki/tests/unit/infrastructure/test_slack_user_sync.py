@@ -0,0 +1,82 @@
+"""Unit tests for the streaming Slack user sync (SQLite backend)"""
+
+import pytest
+from sqlalchemy import select
+
+from src.adapters.secondary.slack_adapter import SlackAPIError
+from src.domain.services.slack_user_sync_service import SlackUserSyncService
+from src.infrastructure.database.manager import DatabaseManager
+from src.infrastructure.repositories.postgresql_slack_user_repository import (
+    PostgreSQLSlackUserRepository,
+    SlackUserModel,
+)
+
+
+class FakeSlackAdapter:
+    """Yields pre-built users.list pages"""
+
+    def __init__(self, pages: list[list[dict]], error: str | None = None):
+        self.pages = pages
+        self.error = error
+        self.page_sizes: list[int] = []
+
+    async def iter_users(self, page_size: int = 200):
+        self.page_sizes.append(page_size)
+        for page in self.pages:
+            yield page
+        if self.error:
+            raise SlackAPIError(self.error)
+
+
+def _member(user_id: str, name: str = "user", **fields) -> dict:
+    return {"id": user_id, "name": name, "profile": {"display_name": name}, "updated": 1700000000, **fields}
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    # slack_users lives on the repository's own declarative base
+    async with manager.session() as session:
+        connection = await session.connection()
+        await connection.run_sync(SlackUserModel.metadata.create_all)
+    yield manager
+    await manager.close()
+
+
+async def _sync(db_manager: DatabaseManager, adapter: FakeSlackAdapter, **kwargs) -> dict:
+    async with db_manager.session() as session:
+        service = SlackUserSyncService(adapter, PostgreSQLSlackUserRepository(session), **kwargs)
+        return await service.sync_users()
+
+
+async def test_all_pages_are_upserted_in_batches(db_manager: DatabaseManager):
+    pages = [[_member(f"U{i}") for i in range(5)], [_member(f"U{i}") for i in range(5, 8)]]
+
+    result = await _sync(db_manager, FakeSlackAdapter(pages), batch_size=2)
+
+    assert result == {"status": "success", "synced_count": 8, "total_fetched": 8}
+    async with db_manager.session() as session:
+        rows = (await session.execute(select(SlackUserModel))).scalars().all()
+    assert len(rows) == 8
+    assert all(row.content_hash for row in rows)
+
+
+async def test_unchanged_users_are_skipped_on_resync(db_manager: DatabaseManager):
+    await _sync(db_manager, FakeSlackAdapter([[_member("U1", "alice"), _member("U2", "bob")]]))
+
+    result = await _sync(db_manager, FakeSlackAdapter([[_member("U1", "alice"), _member("U2", "robert")]]))
+
+    assert result["synced_count"] == 1
+    assert result["total_fetched"] == 2
+    async with db_manager.session() as session:
+        bob = await PostgreSQLSlackUserRepository(session).find_by_id("U2")
+    assert bob.name == "robert"
+
+
+async def test_api_error_keeps_already_synced_pages(db_manager: DatabaseManager):
+    adapter = FakeSlackAdapter([[_member("U1")]], error="invalid_auth")
+
+    result = await _sync(db_manager, adapter)
+
+    assert result["status"] == "error"
+    assert result["synced_count"] == 1
@@ -0,0 +1,99 @@
+"""Unit tests for StreamingReply (progressive Slack message updates)"""
+
+import asyncio
+
+from src.infrastructure.slack_outbound import StreamingReply
+
+
+class FakeSender:
+    """Records calls; chat.postMessage returns a ts unless rate limited"""
+
+    def __init__(self, rate_limited: bool = False):
+        self.rate_limited = rate_limited
+        self.calls: list[tuple[str, dict]] = []
+
+    async def post_message(self, channel: str, text: str, retry: bool = True, **kwargs):
+        self.calls.append(("chat.postMessage", {"channel": channel, "text": text, **kwargs}))
+        return None if self.rate_limited else {"ok": True, "ts": "1.0"}
+
+    async def call(self, method: str, retry: bool = True, **kwargs):
+        self.calls.append((method, kwargs))
+        await asyncio.sleep(0)
+        return {"ok": True}
+
+
+async def test_placeholder_is_updated_then_finalized():
+    sender = FakeSender()
+    reply = StreamingReply(sender, "C1", min_update_interval_seconds=0)
+
+    await reply.start()
+    await reply.append("了解")
+    await asyncio.sleep(0.01)
+    await reply.append("した")
+    await reply.finish("了解した")
+
+    methods = [method for method, _ in sender.calls]
+    assert methods[0] == "chat.postMessage"
+    assert sender.calls[-1] == ("chat.update", {"channel": "C1", "ts": "1.0", "text": "了解した"})
+    assert methods.count("chat.update") >= 2
+
+
+async def test_final_message_keeps_text_of_earlier_rounds():
+    sender = FakeSender()
+    reply = StreamingReply(sender, "C1", min_update_interval_seconds=0)
+
+    await reply.start()
+    # The agent loop streams a preamble, runs a tool, then streams the answer on a new line
+    for delta in ["確認する", "\n完了"]:
+        await reply.append(delta)
+        await asyncio.sleep(0.01)
+    await reply.finish("完了")
+
+    assert sender.calls[-1] == ("chat.update", {"channel": "C1", "ts": "1.0", "text": "確認する\n完了"})
+
+
+async def test_unstreamed_final_text_is_appended():
+    sender = FakeSender()
+    reply = StreamingReply(sender, "C1", min_update_interval_seconds=0)
+
+    await reply.start()
+    await reply.append("確認する")
+    await reply.finish("処理が長くなったため途中で打ち切った。")
+
+    assert sender.calls[-1][1]["text"] == "確認する\n処理が長くなったため途中で打ち切った。"
+
+
+async def test_updates_are_throttled():
+    sender = FakeSender()
+    reply = StreamingReply(sender, "C1", min_update_interval_seconds=60)
+
+    await reply.start()
+    for delta in ["a", "b", "c", "d"]:
+        await reply.append(delta)
+        await asyncio.sleep(0)
+    await reply.finish("abcd")
+
+    # One progressive update in the window plus the final one
+    assert [method for method, _ in sender.calls].count("chat.update") == 2
+
+
+async def test_empty_reply_deletes_placeholder():
+    sender = FakeSender()
+    reply = StreamingReply(sender, "C1")
+
+    await reply.start()
+    await reply.finish("")
+
+    assert sender.calls[-1] == ("chat.delete", {"channel": "C1", "ts": "1.0"})
+
+
+async def test_skipped_placeholder_falls_back_to_normal_post():
+    sender = FakeSender(rate_limited=True)
+    reply = StreamingReply(sender, "C1")
+
+    await reply.start()
+    await reply.append("hi")
+    await reply.finish("hi")
+
+    assert [method for method, _ in sender.calls] == ["chat.postMessage", "chat.postMessage"]
+    assert sender.calls[-1][1]["text"] == "hi"
@@ -0,0 +1,97 @@
+"""Unit tests for the single round-trip upsert helper"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.infrastructure.database.schema import BusinessSkillTable, DailySummaryTable
+from src.infrastructure.database.upsert import upsert
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            DailySummaryTable.metadata.create_all,
+            tables=[DailySummaryTable.__table__, BusinessSkillTable.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+def _summary(summary_id, text: str, created_at: datetime) -> dict:
+    return {
+        "id": summary_id,
+        "date": created_at.date(),
+        "user_id": "U1",
+        "tasks_completed": 1,
+        "tasks_pending": 2,
+        "summary_text": text,
+        "created_at": created_at,
+    }
+
+
+async def test_upsert_inserts_then_updates_in_one_statement(engine, session):
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    summary_id = uuid4()
+    created_at = datetime(2026, 10, 17, 9, 0)
+
+    await upsert(session, DailySummaryTable, _summary(summary_id, "first", created_at), insert_only=["created_at"])
+    row = await upsert(
+        session,
+        DailySummaryTable,
+        _summary(summary_id, "second", created_at + timedelta(days=1)),
+        insert_only=["created_at"],
+    )
+
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in statement for statement in statements)
+    assert row.summary_text == "second"
+    assert row.created_at == created_at  # insert-only column is kept
+
+
+async def test_upsert_refreshes_an_instance_loaded_in_the_session(session):
+    summary_id = uuid4()
+    created_at = datetime(2026, 10, 17, 9, 0)
+    await upsert(session, DailySummaryTable, _summary(summary_id, "first", created_at))
+    loaded = (await session.execute(select(DailySummaryTable))).scalar_one()
+
+    await upsert(session, DailySummaryTable, _summary(summary_id, "second", created_at))
+    reread = (await session.execute(select(DailySummaryTable))).scalar_one()
+
+    assert reread is loaded
+    assert reread.summary_text == "second"
+
+
+async def test_update_set_overrides_the_new_value(session):
+    skill_id = uuid4()
+    values = {
+        "skill_id": skill_id,
+        "skill_name": "接客",
+        "category": "店舗",
+        "display_order": 1,
+        "is_active": True,
+        "created_at": datetime(2026, 1, 1),
+        "updated_at": datetime(2026, 1, 1),
+    }
+    await upsert(session, BusinessSkillTable, values)
+
+    row = await upsert(
+        session,
+        BusinessSkillTable,
+        {**values, "display_order": 2},
+        update_set=lambda excluded: {"display_order": excluded.display_order + 10},
+    )
+
+    assert row.display_order == 12
@@ -76,6 +76,13 @@ class FakeConversationRepository(ConversationRepository):
                 return conv
         return None
 
+    async def save_summary(self, conversation_id: UUID, summary: str, summarized_count: int) -> bool:
+        conversation = self.conversations.get(conversation_id)
+        if conversation is None or conversation.summarized_count >= summarized_count:
+            return False
+        conversation.apply_summary(summary, summarized_count)
+        return True
+
     async def delete(self, conversation_id: UUID) -> None:
         if conversation_id in self.conversations:
             del self.conversations[conversation_id]